@@ -0,0 +1,48 @@
+# -*- encoding: utf-8 -*-
+# Copyright (c) 2020 Modist Team <admin@modist.io>
+# ISC License <https://choosealicense.com/licenses/isc>
+
+"""Measure memory allocated while parsing with and without inline transformation."""
+
+import tracemalloc
+
+from semsel.parser import SemselParser
+
+SELECTORS = [
+    "^1",
+    "~1.2",
+    ">=1.2.3 <2",
+    ">2.3.4 <2.4 || 2.3.9",
+    "1.0.0 - 1.2.0 || ^3.1.4-rc.1+build.5",
+    "= 1.2.3-alpha.1 || > 2 <3.1 || ~ 4.5.6",
+]
+
+
+def measure_peak(parser: SemselParser) -> int:
+    """Measure the peak memory allocated while parsing a single large selector.
+
+    :param SemselParser parser: The warmed parser to measure
+    :return: The peak number of allocated bytes
+    :rtype: int
+    """
+
+    content = " || ".join(SELECTORS * 50)
+    tracemalloc.start()
+    parser.parse(content, validate=False)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def main():
+    """Report the peak allocated memory with and without inline transformation."""
+
+    for inline_transform in (False, True):
+        parser = SemselParser(engine="lalr", inline_transform=inline_transform)
+        parser.parse(SELECTORS[0], validate=False)
+        peak = measure_peak(parser)
+        print(f"inline_transform={inline_transform!s:<5}  peak: {peak:>10,} bytes")
+
+
+if __name__ == "__main__":
+    main()
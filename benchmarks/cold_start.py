@@ -0,0 +1,57 @@
+# -*- encoding: utf-8 -*-
+# Copyright (c) 2020 Modist Team <admin@modist.io>
+# ISC License <https://choosealicense.com/licenses/isc>
+
+"""Benchmark the cold-start and warm-start cost of parsing a first selector."""
+
+import sys
+import tempfile
+import subprocess
+from statistics import median
+
+SCRIPT = """
+import time
+from semsel.parser import SemselParser
+start = time.perf_counter()
+SemselParser({arguments!s}).parse("^1")
+print(time.perf_counter() - start)
+"""
+RUNS = 5
+
+
+def measure(arguments: str, runs: int = RUNS) -> float:
+    """Measure the seconds taken to parse a first selector in a new process.
+
+    :param str arguments: The arguments to build the parser with
+    :param int runs: The number of processes to measure, defaults to RUNS
+    :return: The median number of seconds taken over the given number of runs
+    :rtype: float
+    """
+
+    return median(
+        float(
+            subprocess.check_output(
+                [sys.executable, "-c", SCRIPT.format(arguments=arguments)]
+            )
+        )
+        for _ in range(runs)
+    )
+
+
+def main():
+    """Report the cold-start and warm-start times of the available configurations."""
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cached = f"engine='lalr', grammar_cache={cache_dir!r}"
+        for name, arguments, runs in (
+            ("earley", "", RUNS),
+            ("lalr", "engine='lalr'", RUNS),
+            ("lalr (cold cache)", cached, 1),
+            ("lalr (warm cache)", cached, RUNS),
+        ):
+            elapsed = measure(arguments, runs=runs)
+            print(f"{name:>18s}: {elapsed * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
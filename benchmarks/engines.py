@@ -0,0 +1,55 @@
+# -*- encoding: utf-8 -*-
+# Copyright (c) 2020 Modist Team <admin@modist.io>
+# ISC License <https://choosealicense.com/licenses/isc>
+
+"""Benchmark the available selector parsing engines against eachother."""
+
+import timeit
+
+from semsel.parser import SemselParser
+
+SELECTORS = [
+    "^1",
+    "~1.2",
+    ">=1.2.3 <2",
+    ">2.3.4 <2.4 || 2.3.9",
+    "1.0.0 - 1.2.0 || ^3.1.4-rc.1+build.5",
+    "= 1.2.3-alpha.1 || > 2 <3.1 || ~ 4.5.6",
+]
+ENGINES = ["earley", "lalr", "native"]
+NUMBER = 500
+
+
+def bench_engine(engine: str) -> float:
+    """Time parsing all sample selectors with a warmed parser of the given engine.
+
+    :param str engine: The name of the engine to benchmark
+    :return: The total number of seconds taken to parse the sample selectors
+    :rtype: float
+    """
+
+    parser = SemselParser(engine=engine)
+    parser.parse(SELECTORS[0], validate=False)
+
+    return timeit.timeit(
+        lambda: [parser.parse(selector, validate=False) for selector in SELECTORS],
+        number=NUMBER,
+    )
+
+
+def main():
+    """Report parse throughput for each engine relative to the Earley engine."""
+
+    total = NUMBER * len(SELECTORS)
+    baseline = None
+    for engine in ENGINES:
+        elapsed = bench_engine(engine)
+        baseline = baseline or elapsed
+        print(
+            f"{engine:>8s}: {total / elapsed:10.0f} selectors/s "
+            f"({baseline / elapsed:.2f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+# -*- encoding: utf-8 -*-
+# Copyright (c) 2020 Modist Team <admin@modist.io>
+# ISC License <https://choosealicense.com/licenses/isc>
+
+"""Benchmark the throughput of valid and invalid selectors for each parsing API."""
+
+import timeit
+from typing import List
+
+from semsel.parser import SemselParser
+from semsel.exceptions import ParseFailure, InvalidExpression
+
+VALID_SELECTORS = [
+    "^1",
+    "~1.2",
+    ">=1.2.3 <2",
+    ">2.3.4 <2.4 || 2.3.9",
+    "1.0.0 - 1.2.0 || ^3.1.4-rc.1+build.5",
+]
+INVALID_SELECTORS = [
+    "^1.",
+    "~1.a",
+    ">=1.2.3 <2 |",
+    "2.3.4 <2.4 || 2.3.9 -",
+    "1.0.0 - 1.2.0 ||| ^3.1.4",
+]
+ENGINES = ["lalr", "native"]
+NUMBER = 500
+
+
+def parse(parser: SemselParser, selectors: List[str]):
+    """Parse the given selectors, catching any raised parsing errors.
+
+    :param SemselParser parser: The parser to parse the selectors with
+    :param List[str] selectors: The selectors to parse
+    """
+
+    for selector in selectors:
+        try:
+            parser.parse(selector, validate=False)
+        except (ParseFailure, InvalidExpression):
+            pass
+
+
+def main():
+    """Report the valid and invalid selector throughput of each parsing API."""
+
+    total = NUMBER * len(VALID_SELECTORS)
+    for engine in ENGINES:
+        parser = SemselParser(engine=engine)
+        for name, run in (
+            ("parse", lambda selectors: parse(parser, selectors)),
+            (
+                "try_parse",
+                lambda selectors: [parser.try_parse(_, False) for _ in selectors],
+            ),
+            ("check", lambda selectors: [parser.check(_, False) for _ in selectors]),
+        ):
+            valid = timeit.timeit(lambda: run(VALID_SELECTORS), number=NUMBER)
+            invalid = timeit.timeit(lambda: run(INVALID_SELECTORS), number=NUMBER)
+            print(
+                f"{engine:<8} {name:<10} valid: {total / valid:>10,.0f}/s  "
+                f"invalid: {total / invalid:>10,.0f}/s"
+            )
+
+
+if __name__ == "__main__":
+    main()
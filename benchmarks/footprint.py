@@ -0,0 +1,66 @@
+# -*- encoding: utf-8 -*-
+# Copyright (c) 2020 Modist Team <admin@modist.io>
+# ISC License <https://choosealicense.com/licenses/isc>
+
+"""Measure the bytes retained per version, expression, and parsed selector."""
+
+import tracemalloc
+from typing import Any, Callable
+
+from semsel.parser import SemselParser
+from semsel.version import PartialVersion
+from semsel.selector import VersionRange, ConditionOperator, VersionCondition
+
+COUNT = 50_000
+
+
+def measure(build: Callable[[int], Any]) -> float:
+    """Measure the bytes retained by each of many distinct built objects.
+
+    :param Callable[[int], Any] build: A callable building a distinct object for each
+        given index
+    :return: The average number of bytes retained by each object
+    :rtype: float
+    """
+
+    tracemalloc.start()
+    objects = [build(index) for index in range(COUNT)]
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    del objects
+    return retained / COUNT
+
+
+def main():
+    """Report the bytes retained per version, expression, and parsed selector."""
+
+    starts = [PartialVersion(index, 2, 3) for index in range(COUNT)]
+    ends = [PartialVersion(COUNT + index) for index in range(COUNT)]
+    # NOTE: ranges compare their bounds when built, so the sort keys of the bounds are
+    # computed up front to only measure the ranges themselves
+    sorted(starts + ends)
+
+    parser = SemselParser(engine="native")
+    contents = [
+        f">={index!s}.2.3 <{index + 1!s} || ^{index!s}.4" for index in range(COUNT)
+    ]
+
+    results = {
+        "PartialVersion": measure(lambda index: PartialVersion(index, 2, 3, "rc.1")),
+        "VersionCondition": measure(
+            lambda index: VersionCondition(ConditionOperator.GE, starts[index])
+        ),
+        "VersionRange": measure(
+            lambda index: VersionRange(starts[index], ends[index])
+        ),
+        "parsed selector": measure(
+            lambda index: parser.parse(contents[index], validate=False)
+        ),
+    }
+    for name, size in results.items():
+        print(f"{name!s:<18} {size:>10,.1f} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+# -*- encoding: utf-8 -*-
+# Copyright (c) 2020 Modist Team <admin@modist.io>
+# ISC License <https://choosealicense.com/licenses/isc>
+
+"""Compare repeatedly querying a version list with and without a VersionIndex."""
+
+import time
+import timeit
+
+from semsel.index import VersionIndex
+from semsel.parser import SemselParser
+from semsel.version import PartialVersion
+
+SELECTORS = ["^1.2", "~3.4", ">=2.0.0 <2.5.0 || ^7", "9.9.9"]
+VERSIONS = [
+    PartialVersion(major, minor, patch)
+    for major in range(10)
+    for minor in range(20)
+    for patch in range(10)
+]
+NUMBER = 20
+ROUNDS = 500
+
+
+def main():
+    """Report the time spent resolving each selector against the version list."""
+
+    parser = SemselParser(engine="native")
+    selectors = [parser.parse(content, validate=False) for content in SELECTORS]
+    index = VersionIndex.from_versions(VERSIONS)
+
+    for selector in selectors:
+        scanned = timeit.timeit(lambda: list(selector.filter(VERSIONS)), number=NUMBER)
+        bisected = timeit.timeit(lambda: list(index.select(selector)), number=NUMBER)
+        print(
+            f"{str(selector)!s:<24} filter: {scanned / NUMBER * 1e3:>8.3f} ms  "
+            f"select: {bisected / NUMBER * 1e3:>8.3f} ms"
+        )
+
+    # NOTE: a growing release list adds versions one at a time between queries
+    started = time.perf_counter()
+    for patch in range(ROUNDS):
+        index.add(PartialVersion(10, 0, patch))
+        index.max_satisfying(selectors[0])
+    elapsed = time.perf_counter() - started
+    print(f"{ROUNDS!s} rounds of add then query: {elapsed * 1e3:>8.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
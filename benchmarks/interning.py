@@ -0,0 +1,61 @@
+# -*- encoding: utf-8 -*-
+# Copyright (c) 2020 Modist Team <admin@modist.io>
+# ISC License <https://choosealicense.com/licenses/isc>
+
+"""Measure memory retained by parsed selectors with and without interning."""
+
+import tracemalloc
+from unittest import mock
+
+from semsel.parser import SemselParser
+from semsel.version import PartialVersion
+from semsel.selector import VersionCondition
+
+SELECTORS = [
+    "^1.2",
+    "~1.2.3",
+    ">=1.2.3 <2",
+    ">=1.0.0 <2.0.0 || ^3.1.4",
+    "1.0.0 - 1.2.0",
+]
+COUNT = 20_000
+
+
+def measure() -> int:
+    """Measure the memory retained by a large repetitive corpus of parsed selectors.
+
+    :return: The number of bytes retained by the parsed selectors
+    :rtype: int
+    """
+
+    parser = SemselParser(engine="native")
+    contents = [SELECTORS[index % len(SELECTORS)] for index in range(COUNT)]
+
+    tracemalloc.start()
+    selectors = [parser.parse(content, validate=False) for content in contents]
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    del selectors
+    return retained
+
+
+def main():
+    """Report the retained memory of parsed selectors with and without interning."""
+
+    with mock.patch.object(
+        PartialVersion,
+        "intern",
+        lambda *args: PartialVersion(*args),
+    ), mock.patch.object(
+        VersionCondition,
+        "intern",
+        lambda *args: VersionCondition(*args),
+    ):
+        print(f"without interning: {measure():>12,} bytes")
+
+    print(f"with interning:    {measure():>12,} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+# -*- encoding: utf-8 -*-
+# Copyright (c) 2020 Modist Team <admin@modist.io>
+# ISC License <https://choosealicense.com/licenses/isc>
+
+"""Benchmark batch selector parsing with an increasing number of worker processes."""
+
+import os
+import time
+
+from semsel.parser import SemselParser
+
+COUNT = 40_000
+
+
+def build_selectors(count: int):
+    """Build a number of distinct sample selectors.
+
+    :param int count: The number of selectors to build
+    :return: A list of distinct selector strings
+    :rtype: List[str]
+    """
+
+    return [
+        f">={index % 97!s}.{index % 13!s}.{index!s} <{index % 97 + 1!s} || "
+        f"~{index % 7!s}.{index % 11!s}"
+        for index in range(count)
+    ]
+
+
+def main():
+    """Report batch parse throughput for each number of worker processes."""
+
+    selectors = build_selectors(COUNT)
+    parser = SemselParser(engine="earley")
+    workers = 1
+    while workers <= (os.cpu_count() or 1):
+        started = time.perf_counter()
+        parser.parse_many(selectors, validate=False, workers=workers)
+        elapsed = time.perf_counter() - started
+        print(f"{workers:>3} workers: {COUNT / elapsed:>10,.0f} selectors/s")
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main()
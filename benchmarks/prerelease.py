@@ -0,0 +1,47 @@
+# -*- encoding: utf-8 -*-
+# Copyright (c) 2020 Modist Team <admin@modist.io>
+# ISC License <https://choosealicense.com/licenses/isc>
+
+"""Measure comparing numeric and alphanumeric prerelease identifiers."""
+
+import timeit
+
+from semsel.version import PartialVersion, _prerelease_key
+
+CASES = {
+    "numeric": [("1", "2"), ("0.10", "0.9"), ("12.4.1", "12.4")],
+    "alphanumeric": [("alpha", "beta"), ("rc", "rc-fix"), ("pre.alpha", "pre.beta")],
+    "mixed": [("rc.1", "rc.2"), ("beta.12", "beta.2"), ("alpha.1", "alpha.beta")],
+}
+NUMBER = 10_000
+
+
+def compare_all(pairs):
+    """Compare each pair of prereleases in both directions.
+
+    :param List[Tuple[str, str]] pairs: The pairs of prereleases to compare
+    """
+
+    for source, target in pairs:
+        PartialVersion.prerelease_compare(source, target)
+        PartialVersion.prerelease_compare(target, source)
+
+
+def main():
+    """Report the time spent comparing prereleases with a cold and warm key cache."""
+
+    for name, pairs in CASES.items():
+        comparisons = NUMBER * len(pairs) * 2
+        cold = timeit.timeit(
+            lambda: (_prerelease_key.cache_clear(), compare_all(pairs)),
+            number=NUMBER,
+        )
+        warm = timeit.timeit(lambda: compare_all(pairs), number=NUMBER)
+        print(
+            f"{name!s:<14} cold: {cold * 1e6 / comparisons:>6.3f} us  "
+            f"warm: {warm * 1e6 / comparisons:>6.3f} us  (per comparison)"
+        )
+
+
+if __name__ == "__main__":
+    main()
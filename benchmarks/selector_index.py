@@ -0,0 +1,60 @@
+# -*- encoding: utf-8 -*-
+# Copyright (c) 2020 Modist Team <admin@modist.io>
+# ISC License <https://choosealicense.com/licenses/isc>
+
+"""Compare finding the selectors satisfied by a version with and without an index."""
+
+import time
+
+from semsel.index import SelectorIndex
+from semsel.parser import SemselParser
+
+COUNT = 100_000
+QUERIES = ["1.2.3", "4.0.0", "7.5.0-rc.1", "12.0.0"]
+
+
+def main():
+    """Report the time spent finding the selectors satisfied by a few versions."""
+
+    parser = SemselParser(engine="native")
+    selectors = {
+        index: parser.parse(
+            f"^{index % 10!s}.{index % 7!s} || >={index % 13!s} <{index % 13 + 2!s}",
+            validate=False,
+        )
+        for index in range(COUNT)
+    }
+
+    started = time.perf_counter()
+    selector_index = SelectorIndex.from_selectors(selectors)
+    built = time.perf_counter()
+    print(f"build index of {COUNT:,} selectors: {built - started:>8.3f} s")
+
+    # NOTE: a growing release list adds selectors one at a time in sorted order
+    started = time.perf_counter()
+    incremental_index = SelectorIndex()
+    for index in range(COUNT // 10):
+        incremental_index.add(
+            index, parser.parse(f">={index!s} <{index + 1!s}", validate=False)
+        )
+    print(
+        f"add {COUNT // 10:,} sorted selectors:  "
+        f"{time.perf_counter() - started:>8.3f} s"
+    )
+
+    for version in QUERIES:
+        started = time.perf_counter()
+        scanned = [key for key, selector in selectors.items() if version in selector]
+        looped = time.perf_counter()
+        matched = selector_index.matching(version)
+        finished = time.perf_counter()
+
+        assert sorted(matched) == scanned
+        print(
+            f"{version!s:<12} {len(matched):>7,} matches  "
+            f"loop: {looped - started:>8.4f} s  index: {finished - looped:>8.4f} s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+# -*- encoding: utf-8 -*-
+# Copyright (c) 2020 Modist Team <admin@modist.io>
+# ISC License <https://choosealicense.com/licenses/isc>
+
+"""Compare evaluating redundant selectors before and after simplifying them."""
+
+import timeit
+
+from semsel.parser import SemselParser
+from semsel.version import PartialVersion
+
+SELECTORS = [
+    ">=1 >=1.2 <3 <2.5 || >=1.3 <2",
+    ">=0.1 >=0.2 >=0.3 <1 <0.9 || ^0.4 || ~0.5.1 || =0.5.3",
+    "^1 || ^1.1 || ^1.2 || ^1.3 || >=1.4 <1.9 || 1.0.0 - 1.8.0",
+    ">1.2.3 <=1.4.0 || >=1.3 <1.5 || >=1.4.5 <1.6 || >1.5.9 <2",
+]
+VERSIONS = [
+    PartialVersion(major, minor, patch)
+    for major in range(3)
+    for minor in range(10)
+    for patch in range(10)
+]
+NUMBER = 50
+
+
+def main():
+    """Report the time spent checking every version against each selector."""
+
+    parser = SemselParser(engine="native")
+    for content in SELECTORS:
+        selector = parser.parse(content, validate=False)
+        simplified = selector.simplify()
+
+        # NOTE: compile the intervals of both selectors before timing evaluation
+        list(selector.filter(VERSIONS))
+        list(simplified.filter(VERSIONS))
+
+        original = timeit.timeit(
+            lambda: list(selector.filter(VERSIONS)), number=NUMBER
+        )
+        reduced = timeit.timeit(
+            lambda: list(simplified.filter(VERSIONS)), number=NUMBER
+        )
+        print(f"{content!s}\n  -> {simplified!s}")
+        print(
+            f"  original: {original / NUMBER * 1e3:>7.3f} ms  "
+            f"simplified: {reduced / NUMBER * 1e3:>7.3f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
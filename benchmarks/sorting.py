@@ -0,0 +1,59 @@
+# -*- encoding: utf-8 -*-
+# Copyright (c) 2020 Modist Team <admin@modist.io>
+# ISC License <https://choosealicense.com/licenses/isc>
+
+"""Measure sorting a large list of versions by their precedence."""
+
+import time
+import random
+from functools import cmp_to_key
+
+from semsel.version import PartialVersion, sort_versions
+
+COUNT = 50_000
+PRERELEASES = [None, None, None, "alpha", "alpha.1", "beta.11", "rc.1", "rc.2"]
+
+
+def build_versions():
+    """Build a shuffled list of distinct version instances.
+
+    :return: A list of versions without any computed sort keys
+    :rtype: List[PartialVersion]
+    """
+
+    generator = random.Random(0)
+    return [
+        PartialVersion(
+            generator.randrange(20),
+            generator.randrange(20),
+            generator.randrange(20),
+            generator.choice(PRERELEASES),
+        )
+        for _ in range(COUNT)
+    ]
+
+
+def main():
+    """Report the time spent sorting versions with a comparator and by sort keys."""
+
+    versions = build_versions()
+    started = time.perf_counter()
+    sorted(versions, key=cmp_to_key(PartialVersion.compare))
+    compared = time.perf_counter() - started
+
+    versions = build_versions()
+    started = time.perf_counter()
+    sort_versions(versions)
+    keyed = time.perf_counter() - started
+
+    started = time.perf_counter()
+    sort_versions(versions)
+    cached = time.perf_counter() - started
+
+    print(f"sorted by comparator:   {compared:>8.3f} s")
+    print(f"sort_versions:          {keyed:>8.3f} s")
+    print(f"sort_versions (cached): {cached:>8.3f} s")
+
+
+if __name__ == "__main__":
+    main()
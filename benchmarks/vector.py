@@ -0,0 +1,55 @@
+# -*- encoding: utf-8 -*-
+# Copyright (c) 2020 Modist Team <admin@modist.io>
+# ISC License <https://choosealicense.com/licenses/isc>
+
+"""Compare checking a large array of versions with and without vectorization."""
+
+import time
+
+import numpy
+
+from semsel.parser import SemselParser
+from semsel.vector import VersionArray
+from semsel.version import PartialVersion
+
+SELECTOR = ">=1.2.0-beta <2 || ^4.1 || 7.0.0 - 7.3.0"
+COUNT = 1_000_000
+SAMPLE = 100_000
+
+
+def main():
+    """Report the time spent checking every version against the selector."""
+
+    random = numpy.random.default_rng(0)
+    major, minor, patch = (random.integers(0, 10, COUNT) for _ in range(3))
+    prerelease = random.choice(["", "alpha", "beta.2", "rc.1"], COUNT)
+    selector = SemselParser(engine="native").parse(SELECTOR, validate=False)
+
+    started = time.perf_counter()
+    versions = VersionArray.from_columns(major, minor, patch, prerelease)
+    encoded = time.perf_counter()
+    mask = versions.contains(selector)
+    finished = time.perf_counter()
+
+    objects = [
+        PartialVersion(*row, prerelease=text or None)
+        for *row, text in zip(
+            major[:SAMPLE].tolist(),
+            minor[:SAMPLE].tolist(),
+            patch[:SAMPLE].tolist(),
+            prerelease[:SAMPLE].tolist(),
+        )
+    ]
+    scalar_started = time.perf_counter()
+    expected = [selector.contains(version) for version in objects]
+    scalar_finished = time.perf_counter()
+
+    assert mask[:SAMPLE].tolist() == expected
+    scalar = (scalar_finished - scalar_started) / SAMPLE * COUNT
+    print(f"encode {COUNT:,} versions:       {encoded - started:>8.3f} s")
+    print(f"vectorized contains:         {finished - encoded:>8.3f} s")
+    print(f"scalar contains (estimated): {scalar:>8.3f} s")
+
+
+if __name__ == "__main__":
+    main()
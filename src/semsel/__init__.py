@@ -4,8 +4,45 @@
 
 """Contains module initialization logic."""
 
+import sys
+from typing import Any
 
 from . import __version__  # type: ignore
-from .parser import SemselParser
 
-__all__ = ["SemselParser"]
+__all__ = ["SemselParser", "SelectorIndex", "VersionIndex", "sort_versions"]
+
+# NOTE: the parser (and Lark) is only imported once it is first requested to keep the
+# import of this package cheap, module level __getattr__ requires Python 3.7+
+if sys.version_info < (3, 7):  # pragma: no cover
+    from .index import VersionIndex, SelectorIndex  # noqa: F401
+    from .parser import SemselParser  # noqa: F401
+    from .version import sort_versions  # noqa: F401
+else:
+
+    def __getattr__(name: str) -> Any:
+        """Lazily import the public members of this package.
+
+        :param str name: The name of the requested package member
+        :raises AttributeError: If the requested member does not exist
+        :return: The requested package member
+        :rtype: Any
+        """
+
+        if name == "SemselParser":
+            from .parser import SemselParser
+
+            return SemselParser
+        elif name == "VersionIndex":
+            from .index import VersionIndex
+
+            return VersionIndex
+        elif name == "SelectorIndex":
+            from .index import SelectorIndex
+
+            return SelectorIndex
+        elif name == "sort_versions":
+            from .version import sort_versions
+
+            return sort_versions
+
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
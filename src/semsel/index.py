@@ -0,0 +1,655 @@
+# -*- encoding: utf-8 -*-
+# Copyright (c) 2020 Modist Team <admin@modist.io>
+# ISC License <https://choosealicense.com/licenses/isc>
+
+"""Contains indexes of versions and selectors which can be repeatedly queried.
+
+Versions in a :class:`~VersionIndex` are kept sorted by their precedence key so every
+clause of a selector can be resolved by bisecting its interval bounds rather than by
+checking every version in the index.
+
+Selectors in a :class:`~SelectorIndex` are kept in a centered interval tree built over
+their canonical interval sets so the selectors satisfied by a version can be found
+without checking every selector in the index.
+"""
+
+import math
+from bisect import insort, bisect_left, bisect_right
+from typing import (
+    Any,
+    Dict,
+    List,
+    Tuple,
+    Union,
+    Hashable,
+    Iterable,
+    Iterator,
+    Optional,
+)
+
+import attr
+
+from .version import PartialVersion
+from .interval import Cut_T, Key_T, _version_key
+from .selector import VersionSelector
+
+
+def _bisect_cut(keys: List[Key_T], cut: Cut_T) -> int:
+    """Find the index of the first of the given sorted keys positioned after a cut.
+
+    .. note:: Since cuts are positioned directly before or after a key, this is both
+        the index of the first key within a lower cut and the index directly after the
+        last key within an upper cut.
+
+    :param List[Tuple[Any, ...]] keys: The sorted precedence keys to bisect
+    :param Tuple[Tuple[Any, ...], int] cut: The cut to bisect the keys at
+    :return: The index of the first key positioned after the cut
+    :rtype: int
+    """
+
+    key, flag = cut
+    return bisect_right(keys, key) if flag else bisect_left(keys, key)
+
+
+@attr.s(eq=False, repr=False)
+class VersionIndex:
+    """Describes a sorted collection of versions which can be queried by selectors.
+
+    >>> from semsel.index import VersionIndex
+    >>> index = VersionIndex.from_versions(["1.0.0", "1.2.0", "1.4.1", "2.0.0"])
+    >>> selector = SemselParser().parse("^1.1")
+    >>> [str(version) for version in index.select(selector)]
+        ['1.2.0', '1.4.1']
+    >>> str(index.max_satisfying(selector))
+        '1.4.1'
+
+    .. note:: Versions with the same precedence (such as ``1.0.0+a`` and ``1.0.0+b``)
+        are all kept in the index in the order they were added.
+
+        Versions are kept in plain sorted lists, so queries are ``O(log n)`` but
+        adding or removing a single version is ``O(n)``. The lists are only shifted
+        by a single ``memmove`` of their references, which stays cheap for indexes of
+        many thousands of versions.
+    """
+
+    _keys: List[Key_T] = attr.ib(factory=list, init=False)
+    _versions: List[PartialVersion] = attr.ib(factory=list, init=False)
+
+    @classmethod
+    def from_versions(
+        cls, versions: Iterable[Union[str, PartialVersion]]
+    ) -> "VersionIndex":
+        """Build a new index from the given versions.
+
+        .. note:: This sorts the given versions once which is much cheaper than adding
+            each version one at a time.
+
+        :param Iterable[Union[str, PartialVersion]] versions: The versions (or version
+            strings) to index
+        :raises ValueError: If a given string is not a valid partial semantic version
+        :return: A new VersionIndex instance
+        :rtype: VersionIndex
+        """
+
+        index = cls()
+        index.update(versions)
+        return index
+
+    def __repr__(self) -> str:
+        """Produce a developer readable string to describe the index.
+
+        :return: A developer readable string
+        :rtype: str
+        """
+
+        return f"{self.__class__.__qualname__!s}(<{len(self)!s} versions>)"
+
+    def __len__(self) -> int:
+        """Get the number of versions in the index.
+
+        :return: The number of versions in the index
+        :rtype: int
+        """
+
+        return len(self._versions)
+
+    def __iter__(self) -> Iterator[PartialVersion]:
+        """Iterate over the versions in the index in ascending precedence.
+
+        :return: An iterator of the indexed versions
+        :rtype: Iterator[PartialVersion]
+        """
+
+        return iter(self._versions)
+
+    def __contains__(self, version: Union[str, PartialVersion]) -> bool:
+        """Check if a version with the same precedence as the given version is indexed.
+
+        :param Union[str, PartialVersion] version: The version to check
+        :return: True if a version with the same precedence is indexed, otherwise False
+        :rtype: bool
+        """
+
+        key = _version_key(version)
+        position = bisect_left(self._keys, key)
+        return position < len(self._keys) and self._keys[position] == key
+
+    def add(self, version: Union[str, PartialVersion]):
+        """Add a single version to the index.
+
+        .. note:: Finding the position of the version takes ``O(log n)`` comparisons,
+            but inserting the version into the underlying lists is ``O(n)`` as every
+            following reference is shifted (by a single ``memmove``).
+
+        :param Union[str, PartialVersion] version: The version (or version string) to
+            add
+        :raises ValueError: If the given string is not a valid partial semantic version
+        """
+
+        if isinstance(version, str):
+            version = PartialVersion.from_string(version)
+
+        key = _version_key(version)
+        position = bisect_right(self._keys, key)
+        self._keys.insert(position, key)
+        self._versions.insert(position, version)
+
+    def update(self, versions: Iterable[Union[str, PartialVersion]]):
+        """Add many versions to the index.
+
+        .. note:: Small batches are inserted one version at a time, each in ``O(n)``
+            (see :meth:`~VersionIndex.add`). Batches of more than an eighth of the
+            indexed versions are instead sorted together with the indexed versions,
+            which is cheaper than shifting the underlying lists for each added version.
+
+        :param Iterable[Union[str, PartialVersion]] versions: The versions (or version
+            strings) to add
+        :raises ValueError: If a given string is not a valid partial semantic version
+        """
+
+        added: List[Tuple[Key_T, PartialVersion]] = []
+        for version in versions:
+            if isinstance(version, str):
+                version = PartialVersion.from_string(version)
+            added.append((_version_key(version), version))
+
+        if len(added) * 8 <= len(self._keys):
+            for key, version in added:
+                position = bisect_right(self._keys, key)
+                self._keys.insert(position, key)
+                self._versions.insert(position, version)
+            return
+
+        # NOTE: the sort is stable, so versions of the same precedence keep their order
+        entries = list(zip(self._keys, self._versions)) + added
+        entries.sort(key=lambda entry: entry[0])
+        self._keys = [key for key, _ in entries]
+        self._versions = [version for _, version in entries]
+
+    def remove(self, version: Union[str, PartialVersion]):
+        """Remove the first version with the same precedence as the given version.
+
+        :param Union[str, PartialVersion] version: The version to remove
+        :raises ValueError: If no version with the same precedence is indexed
+        """
+
+        key = _version_key(version)
+        position = bisect_left(self._keys, key)
+        if position >= len(self._keys) or self._keys[position] != key:
+            raise ValueError(f"{str(version)!r} is not in the index")
+
+        del self._keys[position]
+        del self._versions[position]
+
+    def _get_spans(self, selector: VersionSelector) -> List[Tuple[int, int]]:
+        """Get the sorted and merged index spans of versions satisfying the selector.
+
+        :param VersionSelector selector: The selector to resolve
+        :return: A list of non-overlapping ``(start, stop)`` spans in ascending order
+        :rtype: List[Tuple[int, int]]
+        """
+
+        spans: List[Tuple[int, int]] = []
+        for interval in selector.intervals:
+            if interval.is_empty:
+                continue
+
+            start = _bisect_cut(self._keys, interval.lower)
+            stop = _bisect_cut(self._keys, interval.upper)
+            if start < stop:
+                spans.append((start, stop))
+
+        # NOTE: clauses of a selector may overlap, so the spans must be merged to avoid
+        # yielding a version more than once
+        spans.sort()
+        merged: List[Tuple[int, int]] = []
+        for start, stop in spans:
+            if merged and start <= merged[-1][1]:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], stop))
+            else:
+                merged.append((start, stop))
+
+        return merged
+
+    def select(self, selector: VersionSelector) -> Iterator[PartialVersion]:
+        """Iterate over the indexed versions which satisfy the given selector.
+
+        .. note:: Each clause of the selector is resolved by bisecting its bounds, so
+            only the satisfying versions are ever visited. The index should not be
+            modified while iterating over the selected versions.
+
+        :param VersionSelector selector: The selector to resolve
+        :return: An iterator of the satisfying versions in ascending precedence
+        :rtype: Iterator[PartialVersion]
+        """
+
+        versions = self._versions
+        for start, stop in self._get_spans(selector):
+            for position in range(start, stop):
+                yield versions[position]
+
+    def count(self, selector: VersionSelector) -> int:
+        """Count the indexed versions which satisfy the given selector.
+
+        :param VersionSelector selector: The selector to resolve
+        :return: The number of satisfying versions
+        :rtype: int
+        """
+
+        return sum(stop - start for start, stop in self._get_spans(selector))
+
+    def max_satisfying(self, selector: VersionSelector) -> Optional[PartialVersion]:
+        """Get the greatest indexed version which satisfies the given selector.
+
+        .. note:: This takes ``O(k log n)`` comparisons for a selector of ``k`` clauses.
+
+        :param VersionSelector selector: The selector to resolve
+        :return: The greatest satisfying version, or None if no version satisfies the
+            selector
+        :rtype: Optional[PartialVersion]
+        """
+
+        best: Optional[int] = None
+        for interval in selector.intervals:
+            if interval.is_empty:
+                continue
+
+            stop = _bisect_cut(self._keys, interval.upper)
+            if stop > 0 and interval.contains_key(self._keys[stop - 1]):
+                if best is None or stop - 1 > best:
+                    best = stop - 1
+
+        return None if best is None else self._versions[best]
+
+    def min_satisfying(self, selector: VersionSelector) -> Optional[PartialVersion]:
+        """Get the least indexed version which satisfies the given selector.
+
+        .. note:: This takes ``O(k log n)`` comparisons for a selector of ``k`` clauses.
+
+        :param VersionSelector selector: The selector to resolve
+        :return: The least satisfying version, or None if no version satisfies the
+            selector
+        :rtype: Optional[PartialVersion]
+        """
+
+        best: Optional[int] = None
+        for interval in selector.intervals:
+            if interval.is_empty:
+                continue
+
+            start = _bisect_cut(self._keys, interval.lower)
+            if start < len(self._keys) and interval.contains_key(self._keys[start]):
+                if best is None or start < best:
+                    best = start
+
+        return None if best is None else self._versions[best]
+
+
+# NOTE: entries of the selector index are the lower cut, upper cut, and id of a single
+# interval of an indexed selector's canonical interval set
+_Entry_T = Tuple[Cut_T, Cut_T, int]
+
+# NOTE: a subtree is rebuilt once one of its children holds more than this fraction of
+# its entries, which keeps the depth of the tree within ``log(n) / -log(_BALANCE)``
+_BALANCE = 0.75
+
+
+@attr.s(eq=False, slots=True)
+class _SelectorNode:
+    """Describes a single node of the centered interval tree of a selector index.
+
+    Every interval stored in a node contains the node's center. Intervals entirely
+    before the center are stored in the left subtree while intervals entirely after the
+    center are stored in the right subtree.
+    """
+
+    center: Cut_T = attr.ib()
+    by_lower: List[_Entry_T] = attr.ib(factory=list)
+    by_upper: List[Tuple[Cut_T, int]] = attr.ib(factory=list)
+    left: Optional["_SelectorNode"] = attr.ib(default=None)
+    right: Optional["_SelectorNode"] = attr.ib(default=None)
+    size: int = attr.ib(default=0)
+
+
+def _get_node_size(node: Optional[_SelectorNode]) -> int:
+    """Get the number of entries stored in the subtree of the given node.
+
+    :param Optional[_SelectorNode] node: The root node of the subtree
+    :return: The number of entries stored in the subtree
+    :rtype: int
+    """
+
+    return 0 if node is None else node.size
+
+
+def _iter_node_entries(node: Optional[_SelectorNode]) -> Iterator[_Entry_T]:
+    """Iterate over the entries stored in the subtree of the given node.
+
+    :param Optional[_SelectorNode] node: The root node of the subtree
+    :return: An iterator of the stored entries in no particular order
+    :rtype: Iterator[_Entry_T]
+    """
+
+    stack: List[_SelectorNode] = [] if node is None else [node]
+    while stack:
+        node = stack.pop()
+        yield from node.by_lower
+        stack.extend(child for child in (node.left, node.right) if child is not None)
+
+
+def _build_selector_node(entries: List[_Entry_T]) -> Optional[_SelectorNode]:
+    """Build a balanced centered interval tree from the given entries.
+
+    :param List[_Entry_T] entries: The entries to build the tree from, sorted by
+        their lower cuts
+    :return: The root node of the tree, or None if there are no entries
+    :rtype: Optional[_SelectorNode]
+    """
+
+    if not entries:
+        return None
+
+    # NOTE: centering on the median lower cut guarantees that at least the interval
+    # with that lower cut is stored in the node, so building always terminates
+    center = entries[len(entries) // 2][0]
+    node = _SelectorNode(center=center, size=len(entries))
+    before: List[_Entry_T] = []
+    after: List[_Entry_T] = []
+    for lower, upper, entry_id in entries:
+        if upper <= center:
+            before.append((lower, upper, entry_id))
+        elif center < lower:
+            after.append((lower, upper, entry_id))
+        else:
+            node.by_lower.append((lower, upper, entry_id))
+            node.by_upper.append((upper, entry_id))
+
+    node.by_upper.sort()
+    node.left = _build_selector_node(before)
+    node.right = _build_selector_node(after)
+    return node
+
+
+@attr.s(eq=False, repr=False)
+class SelectorIndex:
+    """Describes a keyed collection of selectors which can be queried by versions.
+
+    >>> from semsel.index import SelectorIndex
+    >>> parser = SemselParser()
+    >>> index = SelectorIndex.from_selectors(
+    ...     {"first": parser.parse("^1.2"), "second": parser.parse(">=1.4 <3")}
+    ... )
+    >>> sorted(index.matching("1.5.0"))
+        ['first', 'second']
+    >>> index.remove("second")
+    >>> index.matching("2.1.0")
+        []
+
+    .. note:: Selectors are indexed by the intervals of their canonical interval set
+        (see :attr:`~.selector.VersionSelector.interval_set`) which are disjoint, so a
+        version is contained by at most one interval of each indexed selector.
+        Adding a selector rebuilds the smallest subtree which became unbalanced, so the
+        tree stays ``O(log n)`` deep even when selectors are added in sorted order.
+        Removed selectors are dropped lazily and the tree is rebuilt once it holds more
+        removed intervals than indexed intervals.
+    """
+
+    _selectors: Dict[Hashable, Tuple[int, VersionSelector]] = attr.ib(
+        factory=dict, init=False
+    )
+    _keys: Dict[int, Hashable] = attr.ib(factory=dict, init=False)
+    _root: Optional[_SelectorNode] = attr.ib(default=None, init=False)
+    _next_id: int = attr.ib(default=0, init=False)
+    _size: int = attr.ib(default=0, init=False)
+    _removed: int = attr.ib(default=0, init=False)
+
+    @classmethod
+    def from_selectors(
+        cls,
+        selectors: Union[
+            Dict[Hashable, VersionSelector], Iterable[Tuple[Hashable, VersionSelector]]
+        ],
+    ) -> "SelectorIndex":
+        """Build a new index from the given keyed selectors.
+
+        :param Union[Dict[Hashable, VersionSelector], Iterable[Tuple[Hashable, \
+            VersionSelector]]] selectors: The selectors to index by their keys
+        :return: A new SelectorIndex instance
+        :rtype: SelectorIndex
+        """
+
+        index = cls()
+        items = selectors.items() if isinstance(selectors, dict) else selectors
+        for key, selector in items:
+            index._register(key, selector)
+
+        index.rebuild()
+        return index
+
+    def __repr__(self) -> str:
+        """Produce a developer readable string to describe the index.
+
+        :return: A developer readable string
+        :rtype: str
+        """
+
+        return f"{self.__class__.__qualname__!s}(<{len(self)!s} selectors>)"
+
+    def __len__(self) -> int:
+        """Get the number of selectors in the index.
+
+        :return: The number of selectors in the index
+        :rtype: int
+        """
+
+        return len(self._selectors)
+
+    def __contains__(self, key: Any) -> bool:
+        """Check if a selector is indexed with the given key.
+
+        :param Any key: The key to check
+        :return: True if a selector is indexed with the given key, otherwise False
+        :rtype: bool
+        """
+
+        return key in self._selectors
+
+    def __getitem__(self, key: Hashable) -> VersionSelector:
+        """Get the selector indexed with the given key.
+
+        :param Hashable key: The key of the selector
+        :raises KeyError: If no selector is indexed with the given key
+        :return: The indexed selector
+        :rtype: VersionSelector
+        """
+
+        return self._selectors[key][1]
+
+    def _register(self, key: Hashable, selector: VersionSelector) -> int:
+        """Register the given selector under the given key without indexing it.
+
+        :param Hashable key: The key of the selector
+        :param VersionSelector selector: The selector to register
+        :return: The id of the registered selector's entries
+        :rtype: int
+        """
+
+        if key in self._selectors:
+            self.remove(key)
+
+        entry_id = self._next_id
+        self._next_id += 1
+        self._selectors[key] = (entry_id, selector)
+        self._keys[entry_id] = key
+        return entry_id
+
+    def _insert(self, lower: Cut_T, upper: Cut_T, entry_id: int):
+        """Insert a single interval into the tree, rebalancing it if required.
+
+        :param Tuple[Tuple[Any, ...], int] lower: The lower cut of the interval
+        :param Tuple[Tuple[Any, ...], int] upper: The upper cut of the interval
+        :param int entry_id: The id of the interval's selector
+        """
+
+        self._size += 1
+        if self._root is None:
+            self._root = _SelectorNode(center=lower)
+
+        path: List[_SelectorNode] = []
+        node = self._root
+        while True:
+            node.size += 1
+            path.append(node)
+            if upper <= node.center:
+                if node.left is None:
+                    node.left = _SelectorNode(center=lower)
+                node = node.left
+            elif node.center < lower:
+                if node.right is None:
+                    node.right = _SelectorNode(center=lower)
+                node = node.right
+            else:
+                insort(node.by_lower, (lower, upper, entry_id))
+                insort(node.by_upper, (upper, entry_id))
+                break
+
+        if len(path) > 1 + math.log(self._size) / -math.log(_BALANCE):
+            self._rebalance(path)
+
+    def _rebalance(self, path: List[_SelectorNode]):
+        """Rebuild the lowest unbalanced subtree along the given path from the root.
+
+        .. note:: If the path is deeper than the depth allowed by :data:`_BALANCE`,
+            at least one node along it must have a child holding more than that
+            fraction of its entries.
+
+        :param List[_SelectorNode] path: The nodes visited while inserting an entry
+        """
+
+        for position in range(len(path) - 1, -1, -1):
+            node = path[position]
+            if max(_get_node_size(node.left), _get_node_size(node.right)) <= (
+                _BALANCE * node.size
+            ):
+                continue
+
+            keys = self._keys
+            entries = [
+                entry for entry in _iter_node_entries(node) if entry[-1] in keys
+            ]
+            entries.sort()
+            rebuilt = _build_selector_node(entries)
+
+            # NOTE: intervals of removed selectors are dropped while rebuilding, so the
+            # sizes of the ancestors of the rebuilt subtree must be reduced
+            dropped = node.size - len(entries)
+            self._size -= dropped
+            self._removed -= dropped
+            for ancestor in path[:position]:
+                ancestor.size -= dropped
+
+            if position == 0:
+                self._root = rebuilt
+            elif path[position - 1].left is node:
+                path[position - 1].left = rebuilt
+            else:
+                path[position - 1].right = rebuilt
+            return
+
+    def rebuild(self):
+        """Rebuild the balanced tree from the currently indexed selectors."""
+
+        entries: List[_Entry_T] = [
+            (interval.lower, interval.upper, entry_id)
+            for entry_id, selector in self._selectors.values()
+            for interval in selector.interval_set
+        ]
+        entries.sort()
+
+        self._root = _build_selector_node(entries)
+        self._size = len(entries)
+        self._removed = 0
+
+    def add(self, key: Hashable, selector: VersionSelector):
+        """Add a single selector to the index, replacing any selector with the same key.
+
+        :param Hashable key: The key of the selector
+        :param VersionSelector selector: The selector to add
+        """
+
+        entry_id = self._register(key, selector)
+        for interval in selector.interval_set:
+            self._insert(interval.lower, interval.upper, entry_id)
+
+    def remove(self, key: Hashable):
+        """Remove the selector indexed with the given key.
+
+        :param Hashable key: The key of the selector to remove
+        :raises KeyError: If no selector is indexed with the given key
+        """
+
+        entry_id, selector = self._selectors.pop(key)
+        del self._keys[entry_id]
+
+        # NOTE: the intervals of removed selectors are skipped while querying until
+        # the tree is next rebuilt
+        self._removed += len(selector.interval_set)
+        if self._removed > self._size - self._removed:
+            self.rebuild()
+
+    def matching(self, version: Union[str, PartialVersion]) -> List[Hashable]:
+        """Get the keys of the indexed selectors satisfied by the given version.
+
+        .. note:: This visits ``O(log n)`` nodes of the tree and only the intervals
+            within them which contain the given version.
+
+        :param Union[str, PartialVersion] version: The version to check
+        :raises ValueError: If the given string is not a valid partial semantic version
+        :return: The keys of the satisfied selectors
+        :rtype: List[Hashable]
+        """
+
+        # NOTE: canonical intervals only place cuts before keys, so they contain the
+        # version if ``lower <= cut < upper``
+        cut = (_version_key(version), 0)
+        keys = self._keys
+        matched: List[Hashable] = []
+
+        node = self._root
+        while node is not None:
+            if cut < node.center:
+                for lower, _, entry_id in node.by_lower:
+                    if cut < lower:
+                        break
+                    if entry_id in keys:
+                        matched.append(keys[entry_id])
+                node = node.left
+            else:
+                for upper, entry_id in reversed(node.by_upper):
+                    if upper <= cut:
+                        break
+                    if entry_id in keys:
+                        matched.append(keys[entry_id])
+                node = node.right
+
+        return matched
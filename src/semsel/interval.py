@@ -0,0 +1,472 @@
+# -*- encoding: utf-8 -*-
+# Copyright (c) 2020 Modist Team <admin@modist.io>
+# ISC License <https://choosealicense.com/licenses/isc>
+
+"""Contains the interval representation of version conditions, ranges, and clauses.
+
+Every condition, range, and clause of AND conditions within a selector describes a
+single contiguous interval of versions. Intervals are described by a pair of *cuts*
+which are positioned either directly before or directly after a version's precedence
+key. A cut is a tuple of ``(key, flag)`` where a flag of ``0`` places the cut before
+the key and a flag of ``1`` places the cut after the key:
+
+- an inclusive lower bound of ``1.0.0`` is the cut ``(key(1.0.0), 0)``
+- an exclusive lower bound of ``1.0.0`` is the cut ``(key(1.0.0), 1)``
+- an inclusive upper bound of ``2.0.0`` is the cut ``(key(2.0.0), 1)``
+- an exclusive upper bound of ``2.0.0`` is the cut ``(key(2.0.0), 0)``
+
+This makes every bound check a plain tuple comparison. A version with the key ``k`` is
+contained within an interval if ``lower <= (k, 0)`` and ``(k, 1) <= upper``.
+
+Every version has a directly following version (``1.0.1-0`` follows ``1.0.0`` and
+``1.0.0-alpha.0`` follows ``1.0.0-alpha``) so a cut placed after a key can always be
+moved before the following key. A *normalized* interval only uses cuts placed before a
+key which makes intervals (and sets of intervals) that contain the same versions equal.
+
+.. note:: Partial versions are compared with any missing minor and patch versions
+    filled with zeros (the same way :meth:`~.version.PartialVersion.compare` does) so
+    the condition ``<1.2`` is equivalent to the condition ``<1.2.0``. Build metadata
+    never affects precedence. Prereleases are only ordered by precedence, so the
+    condition ``<2`` contains the prerelease ``2.0.0-rc.1``. Major and minor
+    constrained conditions (``^1`` and ``~1.2``) end directly before the lowest
+    possible prerelease of the next major or minor version (``2.0.0-0`` and
+    ``1.3.0-0``) so they never contain a version with a different major or minor.
+"""
+
+from typing import Any, List, Tuple, Union, Iterable, Optional, Sequence
+
+import attr
+
+from .utils import cache_attribute, cached_slot_property
+from .version import (
+    PACKED_LIMIT,
+    PACKED_FIELD_BITS,
+    PACKED_FIELD_LIMIT,
+    SortKey_T,
+    PartialVersion,
+    _pack_release,
+)
+
+Key_T = SortKey_T
+Cut_T = Tuple[Key_T, int]
+
+MIN_CUT: Cut_T = ((-1,), 0)
+MAX_CUT: Cut_T = ((float("inf"),), 1)
+
+# NOTE: ``0.0.0-0`` is the lowest possible version, so any lower cut before it is
+# equivalent to the minimum cut
+LOWEST_KEY: Key_T = (0, 0, 0, 0, (0, 0))
+LOWEST_CUT: Cut_T = (LOWEST_KEY, 0)
+
+
+def _version_key(version: Union[str, PartialVersion]) -> Key_T:
+    """Get the Semver precedence key of the given version.
+
+    .. note:: This is the :attr:`~.version.PartialVersion.sort_key` of the version,
+        version strings are parsed (and interned) first.
+
+    :param Union[str, PartialVersion] version: The version to get the key of
+    :return: The precedence key of the given version
+    :rtype: Tuple[Any, ...]
+    """
+
+    if isinstance(version, str):
+        version = PartialVersion.from_string(version)
+
+    return version.sort_key
+
+
+def _successor_key(key: Key_T) -> Key_T:
+    """Get the precedence key of the version directly following the given key.
+
+    :param Tuple[Any, ...] key: The precedence key to get the successor of
+    :return: The precedence key of the directly following version
+    :rtype: Tuple[Any, ...]
+    """
+
+    major, minor, patch, release, *_ = key
+    if release:
+        return (major, minor, patch + 1, 0, (0, 0))
+
+    return (*key, (0, 0))
+
+
+def _predecessor_key(key: Key_T) -> Optional[Key_T]:
+    """Get the precedence key of the version directly preceding the given key.
+
+    .. note:: Only versions which are the successor of another version (such as
+        ``1.0.1-0`` or ``1.0.0-alpha.0``) have a directly preceding version.
+
+    :param Tuple[Any, ...] key: The precedence key to get the predecessor of
+    :return: The precedence key of the directly preceding version, or None if no
+        version directly precedes the given key
+    :rtype: Optional[Tuple[Any, ...]]
+    """
+
+    major, minor, patch, release, *identifiers = key
+    if release or identifiers[-1] != (0, 0):
+        return None
+    elif len(identifiers) > 1:
+        return key[:-1]
+    elif patch > 0:
+        return (major, minor, patch - 1, 1)
+
+    return None
+
+
+def _normalize_cut(cut: Cut_T) -> Cut_T:
+    """Move the given cut before a key if it is placed after a key.
+
+    :param Tuple[Tuple[Any, ...], int] cut: The cut to normalize
+    :return: The equivalent cut placed before a key
+    :rtype: Tuple[Tuple[Any, ...], int]
+    """
+
+    key, flag = cut
+    if not flag or cut == MAX_CUT:
+        return cut
+
+    return (_successor_key(key), 0)
+
+
+def _packed_cut(cut: Cut_T) -> int:
+    """Get the packed key of the lowest release that can be packed above the given cut.
+
+    Releases that can be packed (see :meth:`~.version.PartialVersion.to_packed`) are
+    above a lower cut and below an upper cut exactly when their packed key is at
+    least the packed lower cut and less than the packed upper cut. Cuts above every
+    release that can be packed are packed as :data:`~.version.PACKED_LIMIT`.
+
+    :param Tuple[Tuple[Any, ...], int] cut: The cut to get the packed key of
+    :return: The packed key of the lowest release that can be packed above the cut
+    :rtype: int
+    """
+
+    if cut == MIN_CUT:
+        return 0
+    elif cut == MAX_CUT:
+        return PACKED_LIMIT
+
+    (major, minor, patch, release, *_), flag = cut
+    if major >= PACKED_FIELD_LIMIT:
+        return PACKED_LIMIT
+    elif minor >= PACKED_FIELD_LIMIT:
+        return (major + 1) << (2 * PACKED_FIELD_BITS)
+    elif patch >= PACKED_FIELD_LIMIT:
+        return _pack_release(major, minor, 0) + (1 << PACKED_FIELD_BITS)
+
+    # NOTE: prereleases are below the release of the same version numbers, so any cut
+    # at a prerelease is below that release as well
+    packed = _pack_release(major, minor, patch)
+    return packed + 1 if release and flag else packed
+
+
+def _key_version(key: Key_T) -> PartialVersion:
+    """Get the (interned) partial version of the given precedence key.
+
+    :param Tuple[Any, ...] key: The precedence key to get the version of
+    :return: The version with the given precedence key
+    :rtype: PartialVersion
+    """
+
+    major, minor, patch, release, *identifiers = key
+    return PartialVersion.intern(
+        major,
+        minor,
+        patch,
+        None if release else ".".join(str(value) for _, value in identifiers),
+    )
+
+
+def _format_key(key: Key_T) -> str:
+    """Format the given precedence key as a version string.
+
+    :param Tuple[Any, ...] key: The precedence key to format
+    :return: The version string of the given key
+    :rtype: str
+    """
+
+    major, minor, patch, release, *identifiers = key
+    version = f"{major!s}.{minor!s}.{patch!s}"
+    if not release:
+        version += "-" + ".".join(str(value) for _, value in identifiers)
+
+    return version
+
+
+@attr.s(frozen=True, slots=True)
+class VersionInterval:
+    """Describes a contiguous interval of versions through a lower and upper cut.
+
+    >>> from semsel.interval import VersionInterval
+    >>> interval = VersionInterval.from_bounds(
+    ...     PartialVersion(1), PartialVersion(2), end_inclusive=False
+    ... )
+    >>> str(interval)
+        '[1.0.0, 2.0.0)'
+    >>> PartialVersion(1, 4) in interval
+        True
+    """
+
+    lower: Cut_T = attr.ib(default=MIN_CUT)
+    upper: Cut_T = attr.ib(default=MAX_CUT)
+    _packed_bounds: Optional[Tuple[int, int]] = cache_attribute()
+
+    @classmethod
+    def from_bounds(
+        cls,
+        start: Optional[Union[str, PartialVersion]] = None,
+        end: Optional[Union[str, PartialVersion]] = None,
+        start_inclusive: bool = True,
+        end_inclusive: bool = True,
+    ) -> "VersionInterval":
+        """Build a new interval from the given bounding versions.
+
+        :param Optional[Union[str, PartialVersion]] start: The starting version of the
+            interval, defaults to None (unbounded)
+        :param Optional[Union[str, PartialVersion]] end: The ending version of the
+            interval, defaults to None (unbounded)
+        :param bool start_inclusive: Whether the starting version is included in the
+            interval, defaults to True
+        :param bool end_inclusive: Whether the ending version is included in the
+            interval, defaults to True
+        :return: A new VersionInterval instance
+        :rtype: VersionInterval
+        """
+
+        return cls(
+            lower=(
+                MIN_CUT
+                if start is None
+                else (_version_key(start), 0 if start_inclusive else 1)
+            ),
+            upper=(
+                MAX_CUT
+                if end is None
+                else (_version_key(end), 1 if end_inclusive else 0)
+            ),
+        )
+
+    @property
+    def is_empty(self) -> bool:
+        """Whether the interval does not contain any versions."""
+
+        return self.upper <= self.lower
+
+    def normalize(self) -> "VersionInterval":
+        """Build the equivalent normalized interval.
+
+        Both cuts of a normalized interval are placed before a key and an empty
+        normalized interval always has the minimum cut as its lower and upper cut.
+
+        >>> str(VersionInterval.from_bounds("1.0.0", "2.0.0").normalize())
+            '[1.0.0, 2.0.1-0)'
+
+        :return: The equivalent normalized interval
+        :rtype: VersionInterval
+        """
+
+        lower, upper = _normalize_cut(self.lower), _normalize_cut(self.upper)
+        if lower <= LOWEST_CUT:
+            lower = MIN_CUT
+        if upper <= lower or upper <= LOWEST_CUT:
+            lower = upper = MIN_CUT
+
+        return VersionInterval(lower=lower, upper=upper)
+
+    def contains_key(self, key: Key_T) -> bool:
+        """Check if a version with the given precedence key is within the interval.
+
+        :param Tuple[Any, ...] key: The precedence key of the version to check
+        :return: True if the version is within the interval, otherwise False
+        :rtype: bool
+        """
+
+        return self.lower <= (key, 0) and (key, 1) <= self.upper
+
+    @cached_slot_property
+    def packed_bounds(self) -> Tuple[int, int]:
+        """The packed lower and upper bounds of the releases within the interval.
+
+        Releases that can be packed (see :meth:`~.version.PartialVersion.to_packed`)
+        are within the interval exactly when their packed key is at least the lower
+        bound and less than the upper bound.
+        """
+
+        return (_packed_cut(self.lower), _packed_cut(self.upper))
+
+    def __contains__(self, version: Union[str, PartialVersion]) -> bool:
+        """Check if the given version is within the interval.
+
+        :param Union[str, PartialVersion] version: The version to check
+        :return: True if the version is within the interval, otherwise False
+        :rtype: bool
+        """
+
+        if isinstance(version, str):
+            version = PartialVersion.from_string(version)
+
+        packed = version.packed_key
+        if packed < 0:
+            return self.contains_key(version.sort_key)
+
+        lower, upper = self.packed_bounds
+        return lower <= packed < upper
+
+    def intersection(self, other: "VersionInterval") -> "VersionInterval":
+        """Build the interval of versions within both this and the given interval.
+
+        :param VersionInterval other: The interval to intersect with
+        :return: The intersecting (and possibly empty) interval
+        :rtype: VersionInterval
+        """
+
+        return VersionInterval(
+            lower=max(self.lower, other.lower), upper=min(self.upper, other.upper)
+        )
+
+    def __and__(self, other: "VersionInterval") -> "VersionInterval":
+        """Build the interval of versions within both this and the given interval.
+
+        :param VersionInterval other: The interval to intersect with
+        :return: The intersecting (and possibly empty) interval
+        :rtype: VersionInterval
+        """
+
+        return self.intersection(other)
+
+    def __str__(self) -> str:
+        """Produce a human readable string to describe this interval.
+
+        :return: A human readable string
+        :rtype: str
+        """
+
+        if self.is_empty:
+            return "{}"
+
+        (lower_key, lower_flag), (upper_key, upper_flag) = self.lower, self.upper
+        start = "(-inf"
+        if self.lower != MIN_CUT:
+            start = ("(" if lower_flag else "[") + _format_key(lower_key)
+
+        end = "inf)"
+        if self.upper != MAX_CUT:
+            end = _format_key(upper_key) + ("]" if upper_flag else ")")
+
+        return f"{start!s}, {end!s}"
+
+
+def _union_intervals(
+    intervals: Iterable[VersionInterval],
+) -> Tuple[VersionInterval, ...]:
+    """Build the canonical set of intervals containing the versions of any interval.
+
+    The canonical set is the sorted tuple of disjoint, non-adjacent, non-empty, and
+    normalized intervals. Two canonical sets are equal if and only if they contain the
+    same versions.
+
+    :param Iterable[VersionInterval] intervals: The intervals to join
+    :return: The canonical set of intervals
+    :rtype: Tuple[VersionInterval, ...]
+    """
+
+    normalized = sorted(
+        (interval.normalize() for interval in intervals),
+        key=lambda interval: interval.lower,
+    )
+
+    merged: List[VersionInterval] = []
+    for interval in normalized:
+        if interval.is_empty:
+            continue
+
+        # NOTE: normalized intervals which share a cut are adjacent, so they are
+        # merged as well as overlapping intervals
+        if merged and interval.lower <= merged[-1].upper:
+            if merged[-1].upper < interval.upper:
+                merged[-1] = VersionInterval(
+                    lower=merged[-1].lower, upper=interval.upper
+                )
+        else:
+            merged.append(interval)
+
+    return tuple(merged)
+
+
+def _intersect_intervals(
+    source: Sequence[VersionInterval], target: Sequence[VersionInterval]
+) -> Tuple[VersionInterval, ...]:
+    """Build the canonical set of intervals containing the versions of both sets.
+
+    :param Sequence[VersionInterval] source: The first canonical set of intervals
+    :param Sequence[VersionInterval] target: The second canonical set of intervals
+    :return: The canonical set of intervals
+    :rtype: Tuple[VersionInterval, ...]
+    """
+
+    intersection: List[VersionInterval] = []
+    source_index, target_index = 0, 0
+    while source_index < len(source) and target_index < len(target):
+        source_interval, target_interval = source[source_index], target[target_index]
+        interval = source_interval & target_interval
+        if not interval.is_empty:
+            intersection.append(interval)
+
+        if source_interval.upper < target_interval.upper:
+            source_index += 1
+        else:
+            target_index += 1
+
+    return tuple(intersection)
+
+
+def _complement_intervals(
+    intervals: Sequence[VersionInterval],
+) -> Tuple[VersionInterval, ...]:
+    """Build the canonical set of intervals containing the versions not in the set.
+
+    :param Sequence[VersionInterval] intervals: The canonical set of intervals
+    :return: The canonical set of intervals
+    :rtype: Tuple[VersionInterval, ...]
+    """
+
+    complement: List[VersionInterval] = []
+    lower = MIN_CUT
+    for interval in intervals:
+        if lower < interval.lower:
+            complement.append(VersionInterval(lower=lower, upper=interval.lower))
+        lower = interval.upper
+
+    if lower != MAX_CUT:
+        complement.append(VersionInterval(lower=lower, upper=MAX_CUT))
+
+    return tuple(complement)
+
+
+def _is_subset_intervals(
+    source: Sequence[VersionInterval], target: Sequence[VersionInterval]
+) -> bool:
+    """Check if every version of a canonical set of intervals is in another set.
+
+    .. note:: Since intervals of a canonical set are disjoint and non-adjacent, every
+        interval of the source set must be within a single interval of the target set.
+
+    :param Sequence[VersionInterval] source: The canonical set of intervals to check
+    :param Sequence[VersionInterval] target: The canonical set of intervals to check
+        against
+    :return: True if the source set is a subset of the target set, otherwise False
+    :rtype: bool
+    """
+
+    target_index = 0
+    for interval in source:
+        while (
+            target_index < len(target) and target[target_index].upper < interval.upper
+        ):
+            target_index += 1
+
+        if target_index >= len(target) or interval.lower < target[target_index].lower:
+            return False
+
+    return True
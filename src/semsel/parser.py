@@ -4,18 +4,50 @@
 
 """Contains Semver selector parsers, transformers, and grammars."""
 
-from typing import Any, List, Tuple, Union
+import os
+import re
+import sys
+import hashlib
+import tempfile
+from enum import Enum
+from typing import (
+    Any,
+    Set,
+    Dict,
+    List,
+    Match,
+    Tuple,
+    Union,
+    Callable,
+    Iterable,
+    FrozenSet,
+    Generator,
+    Optional,
+    NamedTuple,
+    TYPE_CHECKING,
+)
+from pathlib import Path
+from warnings import warn
+from functools import partial, lru_cache
+from itertools import repeat
+from collections import OrderedDict
 
 import attr
-from lark import Lark, Tree, Token, Transformer
 from cached_property import cached_property
-from lark.exceptions import VisitError, UnexpectedEOF, UnexpectedCharacters
 
+from .utils import get_cache_dir
 from .version import PartialVersion
 from .selector import VersionRange, VersionSelector, VersionCondition, ConditionOperator
-from .exceptions import ParseFailure, InvalidExpression
+from .exceptions import ParseFailure, SemselException, InvalidExpression
 
-GRAMMAR = """
+# NOTE: Lark is only imported once a Lark based parser is first built to keep the
+# import of this module (and the package) cheap for non-parsing usage
+if TYPE_CHECKING:  # pragma: no cover
+    from lark import Lark, Tree, Transformer
+
+ParseOutcome_T = Union[VersionSelector, ParseFailure, InvalidExpression]
+
+_BASE_GRAMMAR = """
 WS: (" " | /\t/)
 
 OP_EQ: "="
@@ -48,220 +80,686 @@ version_range: version " - " version
 version_condition: OPERATOR? " "? version
 version_clause: (version_condition | version_range) \
     (" " (version_condition | version_range))*
+"""
 
+GRAMMAR = (
+    _BASE_GRAMMAR
+    + """
 selector: version_clause (" "? "||" " "? version_clause)*
 ?start: selector
 """
+)
+
+# NOTE: the optional spaces surrounding the "||" delimiter are ambiguous for LALR as
+# a single space may be the start of either a new condition or the OR delimiter.
+# Folding the optional spaces into a single (filtered) terminal lets the contextual
+# lexer resolve this by longest match while still accepting the same language.
+LALR_GRAMMAR = (
+    _BASE_GRAMMAR
+    + r"""
+_OR: / ?\|\| ?/
+
+selector: version_clause (_OR version_clause)*
+?start: selector
+"""
+)
+
+# NOTE: these terminals mirror the terminals (and their names) that Lark compiles from
+# the provided GRAMMAR, they are only used to diagnose native parsing failures
+_NATIVE_TERMINALS = {
+    "OPERATOR": re.compile(r">=|<=|=|>|<|\^|~"),
+    "SPACE": re.compile(r" "),
+    "DOT": re.compile(r"\."),
+    "HYPHEN": re.compile(r"-"),
+    "PLUS": re.compile(r"\+"),
+    "MAJOR": re.compile(r"[0-9]+"),
+    "MINOR": re.compile(r"[0-9]+"),
+    "PATCH": re.compile(r"[0-9]+"),
+    "PRERELEASE": re.compile(r"[0-9a-zA-Z-]+(?:\.[0-9a-zA-Z-]+)*"),
+    "BUILD": re.compile(r"[0-9a-zA-Z-]+(?:\.[0-9a-zA-Z-]+)*"),
+    "__ANON_0": re.compile(r" - "),
+    "__ANON_1": re.compile(r"\|\|"),
+}
+_NATIVE_VERSION_PATTERN = re.compile(
+    r"([0-9]+)(?:\.([0-9]+)(?:\.([0-9]+)"
+    r"(?:-([0-9a-zA-Z-]+(?:\.[0-9a-zA-Z-]+)*))?"
+    r"(?:\+([0-9a-zA-Z-]+(?:\.[0-9a-zA-Z-]+)*))?)?)?"
+)
+_NATIVE_OPERATOR_CHARACTERS = frozenset("=<>^~")
+
+
+def _build_native_transitions() -> Dict[str, Tuple[Tuple[str, str], ...]]:
+    """Build the terminal transitions of the GRAMMAR as a nondeterministic automaton.
+
+    :return: A dictionary of state names to a tuple of (terminal name, next state name)
+        transitions
+    :rtype: Dict[str, Tuple[Tuple[str, str], ...]]
+    """
+
+    item_start = (
+        ("OPERATOR", "operator"),
+        ("SPACE", "condition_space"),
+        ("MAJOR", "condition_major"),
+        ("MAJOR", "range_start_major"),
+    )
+    item_end = (("SPACE", "clause_space"), ("SPACE", "or_space"), ("__ANON_1", "or"))
+    transitions = {
+        "start": item_start,
+        "operator": (("SPACE", "condition_space"), ("MAJOR", "condition_major")),
+        "condition_space": (("MAJOR", "condition_major"),),
+        "range_space": (("MAJOR", "range_end_major"),),
+        "clause_space": item_start,
+        "or_space": (("__ANON_1", "or"),),
+        "or": (("SPACE", "or_trailing_space"),) + item_start,
+        "or_trailing_space": item_start,
+    }
+
+    for context, follow in (
+        ("condition", item_end),
+        ("range_start", (("__ANON_0", "range_space"),)),
+        ("range_end", item_end),
+    ):
+        transitions.update(
+            {
+                f"{context}_major": (("DOT", f"{context}_minor_dot"),) + follow,
+                f"{context}_minor_dot": (("MINOR", f"{context}_minor"),),
+                f"{context}_minor": (("DOT", f"{context}_patch_dot"),) + follow,
+                f"{context}_patch_dot": (("PATCH", f"{context}_patch"),),
+                f"{context}_patch": (
+                    ("HYPHEN", f"{context}_prerelease_hyphen"),
+                    ("PLUS", f"{context}_build_plus"),
+                )
+                + follow,
+                f"{context}_prerelease_hyphen": (
+                    ("PRERELEASE", f"{context}_prerelease"),
+                ),
+                f"{context}_prerelease": (("PLUS", f"{context}_build_plus"),) + follow,
+                f"{context}_build_plus": (("BUILD", f"{context}_build"),),
+                f"{context}_build": follow,
+            }
+        )
 
+    return transitions
 
-class SemselTransformer(Transformer):
-    """Transforms a tokenized Semver selection expression to a standard instance.
 
-    The goal of this transformer is to take a tokenized Semver selector expression and
-    produce the corresponding :class:`~.selector.VersionSelector` instance that can
-    be used for evaluation.
+_NATIVE_TRANSITIONS = _build_native_transitions()
 
-    This transformer should only really be applied to tokenized trees from the provided
-    grammar in order to avoid breakages. This transfomer is automatically included and
-    used during calls to :meth:`~.SemselParser.parse`. To use this transformer outside
-    of the parser usage, you need to have a tree that needs to be transformed.
-    Assuming you have a Lark produced :class:`lark.Tree` structure, you can use this
-    transfomer like the following:
 
-    >>> from semsel.parser import SemselTransformer
-    >>> version_selector = SemeselTransformer(visit_tokens=True).transform(MY_TREE)
-    >>> version_selector
-        VersionSelector()
+@lru_cache(maxsize=None)
+def _get_native_step(
+    states: FrozenSet[str],
+) -> Tuple[Tuple[str, Callable[..., Optional[Match]], FrozenSet[str]], ...]:
+    """Get the terminal transitions of a set of automaton states grouped by terminal.
 
-    .. important:: Without the ``visit_tokens`` flag being set to ``True`` during the
-        initialization of the transformer, this transformer will fail as we rely on
-        the visiting of the version fragments (MAJOR, MINOR, and PATCH) for casting
-        before we build the proper :class:`~.version.PartialVersion` instance.
-        We also rely on this flag for properly parsing out and constructing the
-        :class:`~.selector.ConditionOperator` for conditioned version expressions.
+    .. note:: Grouping the transitions by terminal ensures each terminal is matched
+        only once per position, regardless of how many states expect the terminal.
 
-        Please be sure you set this flag to ``True`` if you intend to use this
-        transformer outside of a :class:`~.SemselParser` instance.
+    :param FrozenSet[str] states: The names of the automaton states
+    :return: A tuple of terminal names, the terminal's match function, and the names
+        of the states reached after matching the terminal
+    :rtype: Tuple[Tuple[str, Callable[..., Optional[Match]], FrozenSet[str]], ...]
     """
 
-    def __cast_to_int(self, token: Token) -> int:
-        """Cast a given digit token to be an integer instead of a string.
+    next_states: Dict[str, Set[str]] = {}
+    for state in states:
+        for terminal, next_state in _NATIVE_TRANSITIONS[state]:
+            next_states.setdefault(terminal, set()).add(next_state)
 
-        .. note:: To be safe for future udpates to the lark parser API we are
-            mangling this method name to avoid future collisions.
+    return tuple(
+        (terminal, _NATIVE_TERMINALS[terminal].match, frozenset(terminal_states))
+        for terminal, terminal_states in sorted(next_states.items())
+    )
 
-        :param Token token: The token to update from a string to an integer
-        :return: The updated token instance
-        :rtype: int
-        """
 
-        return token.update(value=int(token.value))
+def _format_unexpected_characters(
+    content: str, expected: Iterable[str], line: int, column: int
+) -> str:
+    """Format the failure message for an expression with unexpected characters.
+
+    :param str content: The expression that failed to parse
+    :param Iterable[str] expected: The names of the terminals that were expected
+    :param int line: The line the unexpected characters were found on
+    :param int column: The column the unexpected characters were found at
+    :return: A human readable failure message
+    :rtype: str
+    """
 
-    def MAJOR(self, token: Token) -> Token:
-        """Ensure that ``MAJOR`` tokens are casted down to an ``int``.
+    return (
+        f"Parsing expression {content!r} encountered unexpected characters. "
+        f"Expected to see one of {set(expected)!r} at line {line!s} "
+        f"column {column!s}"
+    )
 
-        :param Token token: The MAJOR token instance
-        :return: A Token that has had it's value casted to an int
-        :rtype: Token
-        """
 
-        return self.__cast_to_int(token)
+def _format_unexpected_end(content: str, expected: Iterable[str]) -> str:
+    """Format the failure message for an expression which unexpectedly ended.
 
-    def MINOR(self, token: Token) -> int:
-        """Ensure that ``MINOR`` tokens are casted down to an ``int``.
+    :param str content: The expression that failed to parse
+    :param Iterable[str] expected: The names of the terminals that were expected
+    :return: A human readable failure message
+    :rtype: str
+    """
+
+    return (
+        f"Parsing expression {content!r} unexpectedly ended. "
+        f"Expected to see one of {set(expected)!r} next, "
+        "but reached the end of the expression"
+    )
+
+
+def _get_grammar_cache_path(
+    cache_dir: Union[str, Path], grammar: str, options: Dict[str, Any]
+) -> Path:
+    """Get the path a compiled grammar should be cached at.
+
+    :param Union[str, Path] cache_dir: The directory compiled grammars are cached in
+    :param str grammar: The grammar being compiled
+    :param Dict[str, Any] options: The options the grammar is being compiled with
+    :return: The path of the compiled grammar's cache file
+    :rtype: Path
+    """
+
+    from lark import __version__ as LARK_VERSION
+
+    digest = hashlib.sha256(
+        "\0".join(
+            (
+                grammar,
+                LARK_VERSION,
+                repr(sys.version_info[:2]),
+                repr(sorted(options.items())),
+            )
+        ).encode("utf-8")
+    ).hexdigest()
+    return Path(cache_dir) / f"grammar-{digest!s}.pickle"
+
+
+def _load_cached_grammar(
+    path: Path, transformer: Optional["Transformer"] = None
+) -> Optional["Lark"]:
+    """Load a compiled grammar from the given cache file.
+
+    .. note:: A cache file which fails to load for any reason is removed so the
+        grammar can be compiled and cached again. The cache must never prevent a
+        parser from being built.
+
+    :param Path path: The path of the compiled grammar's cache file
+    :param Optional[Transformer] transformer: The transformer to attach to the loaded
+        parser, defaults to None
+    :return: The loaded parser, or None if the cache file is missing or unreadable
+    :rtype: Optional[Lark]
+    """
+
+    from lark import Lark
+
+    try:
+        with path.open("rb") as cache_file:
+            # NOTE: a cached grammar may have been dumped by a parser with an attached
+            # transformer, so the transformer is always explicitly (re)attached.
+            # Lark.load does not accept any parser options but the underlying loader
+            # does for exactly this purpose (since lark-parser 0.8.6). The loader is
+            # private, so it is missing from the type stubs shipped with lark-parser.
+            return Lark.__new__(Lark)._load(  # type: ignore[attr-defined]
+                cache_file, transformer=transformer
+            )
+    except FileNotFoundError:
+        return None
+    except Exception as exc:
+        warn(f"Failed to load cached grammar from {path!s}, {exc!s}")
+        try:
+            path.unlink()
+        except OSError:
+            pass
+        return None
 
-        :param Token token: The MINOR token instance
-        :return: A Token that has had it's value casted to an int
-        :rtype: Token
-        """
 
-        return self.__cast_to_int(token)
+def _dump_cached_grammar(path: Path, parser: "Lark"):
+    """Dump a compiled grammar to the given cache file.
 
-    def PATCH(self, token: Token) -> int:
-        """Ensure that ``PATCH`` tokens are casted down to an ``int``.
+    .. note:: The grammar is first written to a temporary file in the same directory
+        and then atomically moved into place. This ensures that concurrent processes
+        never see a partially written cache file.
 
-        :param Token token: The PATCH token instance
-        :return: A Token that has had it's value casted to an int
-        :rtype: Token
+    :param Path path: The path of the compiled grammar's cache file
+    :param Lark parser: The compiled parser to cache
+    """
+
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        file_descriptor, temp_path = tempfile.mkstemp(
+            prefix=f"{path.name!s}.", suffix=".tmp", dir=path.parent
+        )
+        try:
+            with os.fdopen(file_descriptor, "wb") as cache_file:
+                # NOTE: Lark.save is missing from the type stubs shipped with
+                # lark-parser
+                parser.save(cache_file)  # type: ignore[attr-defined]
+            os.replace(temp_path, path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+    except OSError as exc:
+        warn(f"Failed to cache grammar to {path!s}, {exc!s}")
+
+
+class CacheInfo(NamedTuple):
+    """Describes the statistics of a :class:`~SemselParser` selector cache."""
+
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+class ParserEngine(Enum):
+    """Enumeration of available parsing engines for the :class:`~SemselParser`."""
+
+    EARLEY = "earley"
+    LALR = "lalr"
+    NATIVE = "native"
+
+
+class ParseErrorKind(Enum):
+    """Enumeration of the kinds of failures described by a :class:`~ParseResult`."""
+
+    UNEXPECTED_CHARACTERS = "unexpected_characters"
+    UNEXPECTED_END = "unexpected_end"
+    INVALID_SYNTAX = "invalid_syntax"
+    INVALID_EXPRESSION = "invalid_expression"
+
+
+@attr.s(frozen=True)
+class ParseResult:
+    """Describes the result of a non-raising :meth:`~SemselParser.try_parse` call.
+
+    Successful results hold the parsed :class:`~.selector.VersionSelector` while
+    failed results hold the kind of failure and (for syntax failures) the position
+    within the stripped expression the failure was found at. Building failure
+    messages is comparatively expensive, so the message of a failed result is only
+    built once it is first requested.
+
+    >>> result = SemselParser().try_parse("1.2.")
+    >>> result.ok, result.kind, result.position
+        (False, <ParseErrorKind.UNEXPECTED_END: 'unexpected_end'>, 4)
+    >>> result.message
+        "Parsing expression '1.2.' unexpectedly ended. ..."
+    """
+
+    content: str = attr.ib()
+    selector: Optional[VersionSelector] = attr.ib(default=None)
+    kind: Optional[ParseErrorKind] = attr.ib(default=None)
+    position: Optional[int] = attr.ib(default=None)
+    _describe: Optional[Callable[[], str]] = attr.ib(
+        default=None, repr=False, eq=False
+    )
+    _exception: Optional[SemselException] = attr.ib(
+        default=None, repr=False, eq=False
+    )
+
+    @classmethod
+    def from_exception(
+        cls, content: str, exception: Union[ParseFailure, InvalidExpression]
+    ) -> "ParseResult":
+        """Build a failed result from an already raised parsing error.
+
+        :param str content: The selector string that failed to parse
+        :param Union[ParseFailure, InvalidExpression] exception: The raised error
+        :return: A failed result describing the given error
+        :rtype: ParseResult
         """
 
-        return self.__cast_to_int(token)
+        return cls(
+            content=content,
+            kind=(
+                ParseErrorKind.INVALID_EXPRESSION
+                if isinstance(exception, InvalidExpression)
+                else ParseErrorKind.INVALID_SYNTAX
+            ),
+            exception=exception,
+        )
+
+    @property
+    def ok(self) -> bool:
+        """Whether the selector string was successfully parsed."""
 
-    def OPERATOR(self, token: Token) -> ConditionOperator:
-        """Ensure that :class:`~.selector.ConditionOperator` are created.
+        return self.selector is not None
 
-        :param Token token: A token matching the given operator
-        :return: The corresponding ConditionOperator for the passed in token
-        :rtype: ConditionOperator
+    def __bool__(self) -> bool:
+        """Check if the selector string was successfully parsed.
+
+        :return: True if the selector string was successfully parsed, otherwise False
+        :rtype: bool
         """
 
-        return ConditionOperator(token.value)
+        return self.ok
+
+    @cached_property
+    def message(self) -> Optional[str]:
+        """The human readable failure message, None for successful results."""
+
+        if self._exception is not None:
+            return self._exception.message
+        if self._describe is not None:
+            return self._describe()
+
+        return None
+
+    @property
+    def error(self) -> Optional[SemselException]:
+        """The error :meth:`~SemselParser.parse` raises, None for successful results."""
+
+        if self.ok:
+            return None
+        if self._exception is not None:
+            return self._exception
+        if self.kind == ParseErrorKind.INVALID_EXPRESSION:
+            return InvalidExpression(self.message)
+
+        return ParseFailure(self.message)
+
+
+class SemselNativeParser:
+    """Parses a Semver selection expression directly to a standard instance.
 
-    def version(self, tokens: List[Token]) -> PartialVersion:
-        """Ensure that :class:`~.version.PartialVersion` instances are created.
+    This parser is a hand-written, single-pass scanner which accepts the exact same
+    language as the provided :data:`~GRAMMAR`. Instead of building a
+    :class:`lark.Tree` which is then transformed by the :class:`~SemselTransformer`,
+    conditions and ranges are built as soon as they are scanned. It is used by the
+    :class:`~SemselParser` when using the ``native`` engine.
 
-        :param List[Token] tokens: A list of tokens which make up a single version.
-        :return: A built version which can be compared and evaluated
+    >>> from semsel.parser import SemselNativeParser
+    >>> SemselNativeParser().parse(">2.3.4 <2.4 || 2.3.9")
+        >2.3.4 <2.4 || 2.3.9
+
+    .. note:: The Lark based engines remain the reference implementation of the
+        grammar. When scanning fails, this parser replays the expression through an
+        automaton built from the grammar's terminals so that the raised
+        :class:`~.exceptions.ParseFailure` describes the failure exactly like the
+        Earley engine would.
+    """
+
+    def _build_version(self, match: Match) -> PartialVersion:
+        """Build a :class:`~.version.PartialVersion` from a scanned version match.
+
+        :param Match match: The match of a version within the expression
+        :return: The matching partial version
         :rtype: PartialVersion
         """
 
-        return PartialVersion.from_dict(
-            {fragment.type.lower(): fragment.value for fragment in tokens}
+        major, minor, patch, prerelease, build = match.groups()
+        return PartialVersion.intern(
+            int(major),
+            int(minor) if minor is not None else None,
+            int(patch) if patch is not None else None,
+            prerelease,
+            build,
         )
 
-    def version_condition(
-        self, tokens: List[Union[ConditionOperator, PartialVersion]]
-    ) -> VersionCondition:
-        """Ensure that :class:`~.selector.VersionCondition` instances are created.
-
-        .. note:: If no :class:`~.selector.ConditionOperator` is provided in the built
-            tokens, the user has not included an operator for the condition. In this
-            case we **IMPLICILTY ASSUME** that the user intends the provided version
-            to be matched explicilty with an equality operator.
-
-            For example, the version specifier ``1`` will be interepreted as ``=1``
-            implicilty. This *feature* is part of the standard Semver selector
-            specification.
-
-        :param List[Union[ConditionOperator, PartialVersion]] data: A list \
-            **POTENTIALLY** containing an :class:`~.selector.ConditionOperator` and \
-            **ALWAYS** containing a :class:`~.version.PartialVersion`
-        :raises ParseFailure: If either we fail to extract the operator or version \
-            from the provided tokens
-        :return: A matching condition statement for a given condition token set
-        :rtype: VersionCondition
+    def _scan_item(
+        self, expression: str, index: int
+    ) -> Optional[
+        Tuple[
+            int,
+            Optional[Union[VersionCondition, VersionRange]],
+            Optional[InvalidExpression],
+        ]
+    ]:
+        """Scan a single condition or range starting at the given index.
+
+        :param str expression: The stripped expression to scan
+        :param int index: The index of the expression to start scanning from
+        :return: None if no valid condition or range starts at the given index,
+            otherwise a tuple of the index following the scanned item, the built item,
+            and the error raised while building the item
+        :rtype: Optional[Tuple[int, Optional[Union[VersionCondition, VersionRange]], \
+            Optional[InvalidExpression]]]
         """
 
-        condition_tuple: Tuple[ConditionOperator, PartialVersion]
-        if len(tokens) == 1:
-            if not isinstance(tokens[0], PartialVersion):
-                raise ParseFailure(
-                    f"failed to extract expected version from {tokens!r}"
+        operator: Optional[str] = None
+        leading_space = expression[index] == " "
+        if expression[index] in _NATIVE_OPERATOR_CHARACTERS:
+            operator_length = 2 if expression.startswith(("<=", ">="), index) else 1
+            operator = expression[index : index + operator_length]
+            index += operator_length
+            if expression.startswith(" ", index):
+                index += 1
+        elif leading_space:
+            index += 1
+
+        match = _NATIVE_VERSION_PATTERN.match(expression, index)
+        if match is None:
+            return None
+        index = match.end()
+
+        if (
+            operator is None
+            and not leading_space
+            and expression.startswith(" - ", index)
+        ):
+            end_match = _NATIVE_VERSION_PATTERN.match(expression, index + 3)
+            if end_match is None:
+                return None
+
+            try:
+                return (
+                    end_match.end(),
+                    VersionRange(
+                        version_start=self._build_version(match),
+                        version_end=self._build_version(end_match),
+                    ),
+                    None,
                 )
+            except InvalidExpression as exc:
+                return end_match.end(), None, exc
+
+        try:
+            return (
+                index,
+                VersionCondition.intern(
+                    (
+                        ConditionOperator(operator)
+                        if operator is not None
+                        else ConditionOperator.EQ
+                    ),
+                    self._build_version(match),
+                ),
+                None,
+            )
+        except InvalidExpression as exc:
+            return index, None, exc
+
+    def _scan(
+        self, expression: str
+    ) -> Optional[
+        Tuple[
+            List[List[Union[VersionCondition, VersionRange]]],
+            Optional[InvalidExpression],
+        ]
+    ]:
+        """Scan a stripped expression into its clauses.
+
+        .. note:: Since the Lark engines only transform an expression once it has been
+            completely parsed, the first error raised while building a condition or
+            range is deferred until the expression is known to be syntactically valid.
+
+        :param str expression: The stripped expression to scan
+        :return: None if the expression is not syntactically valid, otherwise a tuple
+            of the scanned clauses and the first error raised while building them
+        :rtype: Optional[Tuple[List[List[Union[VersionCondition, VersionRange]]], \
+            Optional[InvalidExpression]]]
+        """
 
-            # NOTE: we assume that if NO operator symbol is provided in the condition,
-            # then the user intends the version to have an IMPLICIT equals condition
-            return VersionCondition(operator=ConditionOperator.EQ, version=tokens[0])
+        length = len(expression)
+        clauses: List[List[Union[VersionCondition, VersionRange]]] = []
+        clause: List[Union[VersionCondition, VersionRange]] = []
+        error: Optional[InvalidExpression] = None
+        index = 0
+
+        while True:
+            scanned = self._scan_item(expression, index) if index < length else None
+            if scanned is None:
+                return None
+
+            index, item, item_error = scanned
+            error = error or item_error
+            clause.append(item)  # type: ignore
+
+            if index == length:
+                clauses.append(clause)
+                return clauses, error
+
+            if expression.startswith(" ||", index):
+                index += 3
+            elif expression.startswith("||", index):
+                index += 2
+            elif expression[index] == " ":
+                index += 1
+                continue
+            else:
+                return None
+
+            clauses.append(clause)
+            clause = []
+            if expression.startswith(" ", index):
+                index += 1
+
+    def _locate(self, expression: str) -> Tuple[int, FrozenSet[str], bool]:
+        """Locate where and why a given expression failed to be scanned.
+
+        This replays the expression through the grammar's terminal automaton, matching
+        terminals the same way that Lark's dynamic Earley lexer does, to find the
+        furthest position any possible parse reached and the terminals expected there.
+
+        :param str expression: The stripped expression that failed to be scanned
+        :raises ValueError: If the given expression does not fail to be scanned
+        :return: A tuple of the index of the failure, the names of the terminals
+            expected at that index, and whether the expression unexpectedly ended
+        :rtype: Tuple[int, FrozenSet[str], bool]
+        """
 
-        elif len(tokens) == 2:
-            operator, version = tokens
-            if not isinstance(operator, ConditionOperator):
-                raise ParseFailure(
-                    f"failed to extract expected operator from {tokens!r}"
-                )
-            if not isinstance(version, PartialVersion):
-                raise ParseFailure(
-                    f"failed to extract expected version from {tokens!r}"
-                )
+        length = len(expression)
+        pending: Dict[int, Set[str]] = {0: {"start"}}
+        while pending:
+            index = min(pending)
+            step = _get_native_step(frozenset(pending.pop(index)))
+            if index >= length:
+                return index, frozenset(terminal for terminal, *_ in step), True
 
-            return VersionCondition(operator=operator, version=version)
+            for _, match_terminal, next_states in step:
+                match = match_terminal(expression, index)
+                if match:
+                    pending.setdefault(match.end(), set()).update(next_states)
 
-        else:
-            raise ParseFailure(
-                f"failed to extract expected operator and version from {tokens!r}"
-            )
+            if not pending:
+                return index, frozenset(terminal for terminal, *_ in step), False
 
-    def version_range(self, tokens: List[PartialVersion]) -> VersionRange:
-        """Ensure that :class:`~.selector.VersionRange` instances are created.
+        raise ValueError(f"Expression {expression!r} was not expected to fail parsing")
 
-        :param List[PartialVersion] tokens: A lsit of multiple versions, the first one \
-            being the starting version and the last one being the ending version
-        :raises ParseFailure: If we fail to find both a starting and ending version
-        :return: A matching version range instance for the given range token set
-        :rtype: VersionRange
+    def _diagnose(self, content: str, expression: str) -> ParseFailure:
+        """Diagnose why a given expression failed to be scanned.
+
+        :param str content: The original expression that failed to parse
+        :param str expression: The stripped expression that failed to be scanned
+        :return: A parse failure describing the failure
+        :rtype: ParseFailure
         """
 
-        if len(tokens) != 2:
-            raise ParseFailure(
-                f"failed to extract expected start and end versions from {tokens!r}"
-            )
+        index, expected, ended = self._locate(expression)
+        if ended:
+            return ParseFailure(_format_unexpected_end(content, expected))
 
-        version_start, version_end = tokens
-        return VersionRange(version_start=version_start, version_end=version_end)
+        return ParseFailure(
+            _format_unexpected_characters(content, expected, 1, index + 1)
+        )
 
-    def version_clause(
-        self, tokens: List[Union[VersionCondition, VersionRange]]
-    ) -> List[Union[VersionCondition, VersionRange]]:
-        """Ensure that clauses are passed back simply as their tokens.
+    def check(self, content: str, validate: bool = True) -> bool:
+        """Check if a given Semver selector string is valid without raising errors.
 
-        .. note:: This is a necessary transformation to ensure we are not including
-            token instances but instead are resolving clauses to simply be the list of
-            parsed and transformed conditions and ranges from the tokenzied statements.
+        .. note:: Unlike :meth:`~SemselNativeParser.try_parse`, this never replays
+            invalid expressions to locate the failure, so checking invalid
+            expressions is just as cheap as checking valid expressions.
 
-        :param List[Union[VersionCondition, VersionRange]] tokens: A list of tokens \
-            making up the parsed version clause
-        :return: A list of tokens making up the parsed version clause
-        :rtype: List[Union[VersionCondition, VersionRange]]
+        :param str content: The selector string to check
+        :param bool validate: Whether to validate the parsed expression
+        :return: True if the selector string is valid, otherwise False
+        :rtype: bool
         """
 
-        return tokens
+        scanned = self._scan(content.strip())
+        if scanned is None or scanned[1] is not None:
+            return False
 
-    def selector(
-        self, tokens: List[List[Union[VersionCondition, VersionRange]]]
-    ) -> VersionSelector:
-        """Ensure that a :class:`~.selector.VersionSelector` instance is created.
+        try:
+            VersionSelector(clauses=scanned[0], validate=validate)
+        except InvalidExpression:
+            return False
 
-        :param List[List[Union[VersionCondition, VersionRange]]] tokens: A list of \
-            clause tokens that can be used directly in the \
-            :class:`~.selector.VersionSelector` class
-        :return: A new version selector instance to use for various comparisons
-        :rtype: VersionSelector
+        return True
+
+    def try_parse(self, content: str, validate: bool = True) -> ParseResult:
+        """Parse a given Semver selector string without raising any parsing errors.
+
+        :param str content: The selector string to parse
+        :param bool validate: Whether to validate the parsed expression
+        :return: The result describing either the parsed selector or the failure
+        :rtype: ParseResult
         """
 
-        return VersionSelector(clauses=tokens, validate=self.__validate)
+        expression = content.strip()
+        scanned = self._scan(expression)
+        if scanned is None:
+            index, expected, ended = self._locate(expression)
+            if ended:
+                return ParseResult(
+                    content=content,
+                    kind=ParseErrorKind.UNEXPECTED_END,
+                    position=index,
+                    describe=partial(_format_unexpected_end, content, expected),
+                )
+
+            return ParseResult(
+                content=content,
+                kind=ParseErrorKind.UNEXPECTED_CHARACTERS,
+                position=index,
+                describe=partial(
+                    _format_unexpected_characters, content, expected, 1, index + 1
+                ),
+            )
+
+        clauses, error = scanned
+        if error is not None:
+            return ParseResult.from_exception(content, error)
 
-    def transform(self, tree: Tree, validate: bool = True) -> Any:
-        """Transform the given tree to a :class:`~.selector.VersionSelector`.
+        try:
+            return ParseResult(
+                content=content,
+                selector=VersionSelector(clauses=clauses, validate=validate),
+            )
+        except InvalidExpression as exc:
+            return ParseResult.from_exception(content, exc)
+
+    def parse(self, content: str, validate: bool = True) -> VersionSelector:
+        """Parse a given Semver selector string to the matching selector instance.
 
-        :param Tree tree: The ``selector`` tree to transform
-        :param bool validate: Whether validation should be performed on the built
-            version selector, optional, defaults to True
-        :return: The result of the transformed tree
-        :rtype: Any
+        :param str content: The selector string to parse
+        :param bool validate: Whether to validate the parsed expression
+        :raises ParseFailure: If the given selector string is not valid
+        :return: The matching :class:`~.selector.VersionSelector` instance for the \
+            provided selector string
+        :rtype: VersionSelector
         """
 
-        self.__validate = validate
-        return super().transform(tree)
+        expression = content.strip()
+        scanned = self._scan(expression)
+        if scanned is None:
+            raise self._diagnose(content, expression)
+
+        clauses, error = scanned
+        if error is not None:
+            raise error
+
+        return VersionSelector(clauses=clauses, validate=validate)
 
 
 @attr.s
@@ -293,24 +791,175 @@ class SemselParser:
     >>> version_selector = parser.parse(">2.3.4 <2.4 || 2.3.9")
     >>> version_selector
         >2.3.4 <2.4 || 2.3.9
+
+    By default expressions are parsed using Lark's Earley engine. If you are parsing a
+    large number of expressions, the LALR engine is significantly faster and produces
+    the exact same :class:`~.selector.VersionSelector` instances. When no explicit
+    grammar is given, the LALR engine uses the compatible :data:`~LALR_GRAMMAR`.
+
+    >>> parser = SemselParser(engine="lalr")
+    >>> parser.parse(">2.3.4 <2.4 || 2.3.9")
+        >2.3.4 <2.4 || 2.3.9
+
+    The LALR engine can also persist its compiled parser tables to disk by providing
+    ``grammar_cache`` as either ``True`` (to use the user's cache directory) or the
+    path of a directory. This avoids compiling the grammar in every new process.
+
+    >>> parser = SemselParser(engine="lalr", grammar_cache=True)
+
+    The LALR engine can additionally build selectors while the expression is being
+    parsed by providing ``inline_transform=True``. This attaches the transformer to
+    the parser itself so that no intermediate :class:`lark.Tree` is ever built.
+    :meth:`~SemselParser.tokenize` is still available and builds trees as usual.
+
+    >>> parser = SemselParser(engine="lalr", inline_transform=True)
+
+    Large batches of expressions can be parsed in parallel using
+    :meth:`~SemselParser.parse_many`, which returns results in the order of the given
+    expressions and reports failures as exception instances rather than raising them.
+
+    >>> parser.parse_many(["^1", "1 -", "^1"], workers=2)
+        [VersionSelector(...), ParseFailure(...), VersionSelector(...)]
+
+    If the same expressions are parsed repeatedly, a bounded LRU cache of parsed
+    selectors can be enabled by providing a ``cache_size``. Since selectors are
+    immutable, cached selectors are returned as is and shared between callers.
+
+    >>> parser = SemselParser(cache_size=1024)
+    >>> parser.parse("^1.2") is parser.parse(" ^1.2 ")
+        True
+    >>> parser.cache_info()
+        CacheInfo(hits=1, misses=1, evictions=0, maxsize=1024, currsize=1)
+
+    The fastest option is the ``native`` engine which uses the hand-written
+    :class:`~SemselNativeParser` to avoid building a :class:`lark.Tree` entirely.
+    Because it always implements the language of the provided :data:`~GRAMMAR`, any
+    custom grammar is only used for :meth:`~SemselParser.tokenize` with this engine.
     """
 
-    grammar: str = attr.ib(default=GRAMMAR)
+    grammar: Optional[str] = attr.ib(default=None)
     debug: bool = attr.ib(default=False)
+    engine: ParserEngine = attr.ib(default=ParserEngine.EARLEY, converter=ParserEngine)
+    cache_size: int = attr.ib(default=0)
+    grammar_cache: Union[bool, str, Path, None] = attr.ib(default=False)
+    inline_transform: bool = attr.ib(default=False)
+
+    _cache: "OrderedDict[Tuple[str, bool], VersionSelector]" = attr.ib(
+        init=False, factory=OrderedDict, repr=False, eq=False
+    )
+    _cache_hits: int = attr.ib(init=False, default=0, repr=False, eq=False)
+    _cache_misses: int = attr.ib(init=False, default=0, repr=False, eq=False)
+    _cache_evictions: int = attr.ib(init=False, default=0, repr=False, eq=False)
+
+    def __attrs_post_init__(self):
+        """Resolve the default grammar for the selected parsing engine."""
+
+        if self.grammar is None:
+            self.grammar = LALR_GRAMMAR if self.engine == ParserEngine.LALR else GRAMMAR
+
+    @grammar_cache.validator
+    def _check_grammar_cache(self, attribute: attr.Attribute, value: Any):
+        """Ensure that grammar caching is only requested for the LALR engine.
+
+        :param attr.Attribute attribute: The attribute being validated
+        :param Any value: The value of the attribute being validated
+        :raises ValueError: If grammar caching is requested for another engine
+        """
+
+        if value and self.engine != ParserEngine.LALR:
+            raise ValueError(
+                f"Grammar caching is only supported by the {ParserEngine.LALR.value!r} "
+                f"engine, not the {self.engine.value!r} engine"
+            )
+
+    @inline_transform.validator
+    def _check_inline_transform(self, attribute: attr.Attribute, value: Any):
+        """Ensure that inline transformation is only requested for the LALR engine.
+
+        :param attr.Attribute attribute: The attribute being validated
+        :param Any value: The value of the attribute being validated
+        :raises ValueError: If inline transformation is requested for another engine
+        """
+
+        if value and self.engine != ParserEngine.LALR:
+            raise ValueError(
+                "Inline transformation is only supported by the "
+                f"{ParserEngine.LALR.value!r} engine, not the {self.engine.value!r} "
+                "engine"
+            )
+
+    def _build_parser(self, transformer: Optional["Transformer"] = None) -> "Lark":
+        """Build (or load from the grammar cache) a Lark parser for the grammar.
+
+        :param Optional[Transformer] transformer: The transformer to attach to the
+            built parser, defaults to None
+        :return: The built parser
+        :rtype: Lark
+        """
+
+        from lark import Lark
+
+        # NOTE: the grammar always defaults to the engine's grammar after
+        # initialization, so it is only optional for the attrs initializer
+        grammar = self.grammar
+        assert grammar is not None
+
+        # NOTE: the native engine has no Lark equivalent, so tokenization falls back to
+        # the reference Earley engine
+        options: Dict[str, Any] = dict(
+            parser=(
+                ParserEngine.EARLEY.value
+                if self.engine == ParserEngine.NATIVE
+                else self.engine.value
+            ),
+            debug=self.debug,
+        )
+        if not self.grammar_cache:
+            return Lark(grammar, transformer=transformer, **options)
+
+        # NOTE: the attached transformer does not affect the compiled grammar, so it is
+        # not included in the key of the cached grammar
+        cache_path = _get_grammar_cache_path(
+            get_cache_dir() if self.grammar_cache is True else self.grammar_cache,
+            grammar,
+            options,
+        )
+        parser = _load_cached_grammar(cache_path, transformer=transformer)
+        if parser is None:
+            parser = Lark(grammar, transformer=transformer, **options)
+            _dump_cached_grammar(cache_path, parser)
+
+        return parser
 
     @cached_property
-    def parser(self) -> Lark:
+    def parser(self) -> "Lark":
         """:class:`lark.Lark` parser instance for string tokenization."""
 
-        return Lark(self.grammar, debug=self.debug)
+        return self._build_parser()
+
+    @cached_property
+    def inline_parser(self) -> "Lark":
+        """:class:`lark.Lark` parser instance with an attached inline transformer."""
+
+        from .transformer import SemselInlineTransformer
+
+        return self._build_parser(transformer=SemselInlineTransformer())
 
     @cached_property
-    def transformer(self) -> Transformer:
+    def transformer(self) -> "Transformer":
         """:class:`~.SemselTransformer` transformer instance for tree transformation."""
 
+        from .transformer import SemselTransformer
+
         return SemselTransformer(visit_tokens=True)
 
-    def tokenize(self, content: str) -> Tree:
+    @cached_property
+    def native_parser(self) -> SemselNativeParser:
+        """:class:`~.SemselNativeParser` instance for the ``native`` engine."""
+
+        return SemselNativeParser()
+
+    def tokenize(self, content: str) -> "Tree":
         """Tokenize a given Semver selector string according to the provided grammar.
 
         :param str content: The selector string to tokenize
@@ -320,9 +969,34 @@ class SemselParser:
 
         return self.parser.parse(content.strip())
 
+    def cache_info(self) -> CacheInfo:
+        """Get the statistics of the parsed selector cache.
+
+        :return: The current hits, misses, evictions, and size of the cache
+        :rtype: CacheInfo
+        """
+
+        return CacheInfo(
+            hits=self._cache_hits,
+            misses=self._cache_misses,
+            evictions=self._cache_evictions,
+            maxsize=self.cache_size,
+            currsize=len(self._cache),
+        )
+
+    def clear_cache(self):
+        """Clear the parsed selector cache and reset its statistics."""
+
+        self._cache.clear()
+        self._cache_hits = self._cache_misses = self._cache_evictions = 0
+
     def parse(self, content: str, validate: bool = True) -> VersionSelector:
         """Parse a given Semver selector string to the matching selector instance.
 
+        .. note:: If the parser was given a ``cache_size``, the parsed selector is
+            cached by the stripped selector string and the given ``validate`` flag.
+            Failures are never cached.
+
         :param str content: The selector string to parse
         :param bool validate: Whether to validate the parsed expression
         :return: The matching :class:`~.selector.VresionSelector` instance for the \
@@ -330,23 +1004,444 @@ class SemselParser:
         :rtype: VersionSelector
         """
 
-        try:
-            return self.transformer.transform(self.tokenize(content), validate=validate)
-        except UnexpectedCharacters as exc:
-            raise ParseFailure(
-                f"Parsing expression {content!r} encountered unexpected characters. "
-                f"Expected to see one of {set(exc.allowed)!r} at line {exc.line!s} "
-                f"column {exc.column!s}"
+        if self.cache_size <= 0:
+            return self._parse(content, validate=validate)
+
+        key = (content.strip(), validate)
+        selector = self._get_cached(key)
+        if selector is None:
+            selector = self._parse(content, validate=validate)
+            self._set_cached(key, selector)
+
+        return selector
+
+    def try_parse(self, content: str, validate: bool = True) -> ParseResult:
+        """Parse a given Semver selector string without raising any parsing errors.
+
+        Rather than raising a :class:`~.exceptions.ParseFailure` or
+        :class:`~.exceptions.InvalidExpression`, failures are described by the
+        returned :class:`~ParseResult`. The failure message is only built once it is
+        first requested, which makes this considerably cheaper than catching the
+        errors raised by :meth:`~SemselParser.parse` for largely invalid inputs.
+
+        >>> result = parser.try_parse(">=1 <2 ||")
+        >>> result.ok
+            False
+        >>> result.kind, result.position
+            (<ParseErrorKind.UNEXPECTED_END: 'unexpected_end'>, 9)
+
+        :param str content: The selector string to parse
+        :param bool validate: Whether to validate the parsed expression
+        :return: The result describing either the parsed selector or the failure
+        :rtype: ParseResult
+        """
+
+        if self.cache_size <= 0:
+            return self._try_parse(content, validate=validate)
+
+        key = (content.strip(), validate)
+        selector = self._get_cached(key)
+        if selector is not None:
+            return ParseResult(content=content, selector=selector)
+
+        result = self._try_parse(content, validate=validate)
+        if result.selector is not None:
+            self._set_cached(key, result.selector)
+
+        return result
+
+    def check(self, content: str, validate: bool = True) -> bool:
+        """Check if a given Semver selector string is valid without raising errors.
+
+        :param str content: The selector string to check
+        :param bool validate: Whether to validate the parsed expression
+        :return: True if the selector string is valid, otherwise False
+        :rtype: bool
+        """
+
+        if self.engine == ParserEngine.NATIVE and self.cache_size <= 0:
+            return self.native_parser.check(content, validate=validate)
+
+        return self.try_parse(content, validate=validate).ok
+
+    def _get_cached(self, key: Tuple[str, bool]) -> Optional[VersionSelector]:
+        """Get a selector from the parsed selector cache.
+
+        :param Tuple[str, bool] key: The stripped selector string and validate flag
+        :return: The cached selector, or None if the selector is not cached
+        :rtype: Optional[VersionSelector]
+        """
+
+        selector = self._cache.get(key)
+        if selector is None:
+            self._cache_misses += 1
+            return None
+
+        self._cache.move_to_end(key)
+        self._cache_hits += 1
+        return selector
+
+    def _set_cached(self, key: Tuple[str, bool], selector: VersionSelector):
+        """Add a selector to the parsed selector cache, evicting the oldest selector.
+
+        :param Tuple[str, bool] key: The stripped selector string and validate flag
+        :param VersionSelector selector: The selector to cache
+        """
+
+        self._cache[key] = selector
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+            self._cache_evictions += 1
+
+    def parse_many(
+        self,
+        contents: Iterable[str],
+        validate: bool = True,
+        workers: Optional[int] = None,
+        chunksize: int = 256,
+    ) -> List[ParseOutcome_T]:
+        """Parse many Semver selector strings, optionally using multiple processes.
+
+        Duplicate selector strings are only parsed once. The unique selector strings
+        are split into chunks which are parsed by a pool of worker processes, each
+        holding a single warmed up parser built with the same options as this parser.
+
+        :param Iterable[str] contents: The selector strings to parse
+        :param bool validate: Whether to validate the parsed expressions
+        :param Optional[int] workers: The number of worker processes to use, defaults
+            to the number of available CPUs, a value of 1 parses all selector strings
+            in the current process
+        :param int chunksize: The number of unique selector strings sent to a worker
+            process at a time, defaults to 256
+        :raises ValueError: If either the given number of workers or the given chunk
+            size is less than 1
+        :return: The matching :class:`~.selector.VersionSelector` instances, or the
+            :class:`~.exceptions.ParseFailure` and
+            :class:`~.exceptions.InvalidExpression` instances raised while parsing
+            them, in the order of the given selector strings
+        :rtype: List[Union[VersionSelector, ParseFailure, InvalidExpression]]
+        """
+
+        if workers is not None and workers < 1:
+            raise ValueError(f"Expected at least 1 worker process, but got {workers!r}")
+        if chunksize < 1:
+            raise ValueError(
+                f"Expected a chunk size of at least 1, but got {chunksize!r}"
             )
-        except UnexpectedEOF as exc:
-            print(exc.expected[0])
-            raise ParseFailure(
-                f"Parsing expression {content!r} unexpectedly ended. "
-                f"Expected to see one of {set(_.name for _ in exc.expected)!r} next, "
-                "but reached the end of the expression"
+
+        contents = list(contents)
+        unique_contents = list(dict.fromkeys(contents))
+        chunks = [
+            unique_contents[index : index + chunksize]
+            for index in range(0, len(unique_contents), chunksize)
+        ]
+        workers = min(
+            (os.cpu_count() or 1) if workers is None else workers, len(chunks)
+        )
+
+        if workers <= 1:
+            parsed: Iterable[ParseOutcome_T] = (
+                _parse_or_error(self, content, validate) for content in unique_contents
             )
-        except VisitError as exc:
-            if isinstance(exc.orig_exc, (ParseFailure, InvalidExpression,)):
-                raise exc.orig_exc
+            results = dict(zip(unique_contents, parsed))
+        else:
+            from concurrent.futures import ProcessPoolExecutor
+
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_initialize_worker,
+                initargs=(
+                    dict(
+                        grammar=self.grammar,
+                        debug=self.debug,
+                        engine=self.engine,
+                        grammar_cache=self.grammar_cache,
+                        inline_transform=self.inline_transform,
+                    ),
+                ),
+            ) as executor:
+                parsed = (
+                    result
+                    for chunk_results in executor.map(
+                        _parse_chunk, chunks, repeat(validate)
+                    )
+                    for result in chunk_results
+                )
+                results = dict(zip(unique_contents, parsed))
+
+        return [results[content] for content in contents]
+
+    def parse_stream(
+        self,
+        lines: Iterable[str],
+        validate: bool = True,
+        key_separator: Optional[str] = None,
+        comment_prefix: str = "#",
+    ) -> Generator[Tuple[int, Optional[str], ParseOutcome_T], None, None]:
+        """Lazily parse Semver selector strings from a file object or iterable of lines.
+
+        Blank lines and lines starting with the given comment prefix are skipped.
+        Parsing failures never stop the stream, they are yielded in place of the
+        selector instead.
+
+        >>> with open("requirements.txt", "r") as requirements_file:
+        ...     for line_no, key, selector in parser.parse_stream(
+        ...         requirements_file, key_separator=":"
+        ...     ):
+        ...         print(line_no, key, selector)
+
+        :param Iterable[str] lines: The file object or iterable of lines to parse
+        :param bool validate: Whether to validate the parsed expressions
+        :param Optional[str] key_separator: The separator between a leading key and
+            the selector string of each line, defaults to None (no keys)
+        :param str comment_prefix: The prefix of lines that should be skipped,
+            defaults to "#"
+        :return: A generator of line numbers (starting at 1), keys (None if no
+            ``key_separator`` is given) and the matching
+            :class:`~.selector.VersionSelector` instances or the
+            :class:`~.exceptions.ParseFailure` and
+            :class:`~.exceptions.InvalidExpression` instances raised while parsing
+        :rtype: Generator[Tuple[int, Optional[str], Union[VersionSelector, \
+            ParseFailure, InvalidExpression]], None, None]
+        """
 
-            raise
+        for line_no, line in enumerate(lines, start=1):
+            content = line.strip()
+            if not content or (comment_prefix and content.startswith(comment_prefix)):
+                continue
+
+            key: Optional[str] = None
+            if key_separator is not None:
+                key, separator, content = content.partition(key_separator)
+                key, content = key.strip(), content.strip()
+                if not separator:
+                    yield (
+                        line_no,
+                        None,
+                        ParseFailure(
+                            f"Missing key separator {key_separator!r} in line "
+                            f"{line_no!s}, {line.rstrip()!r}"
+                        ),
+                    )
+                    continue
+
+            yield (line_no, key, _parse_or_error(self, content, validate))
+
+    def _transform(self, content: str, validate: bool = True) -> VersionSelector:
+        """Parse and transform a given Semver selector string using Lark.
+
+        :param str content: The selector string to parse
+        :param bool validate: Whether to validate the parsed expression
+        :return: The matching :class:`~.selector.VersionSelector` instance for the \
+            provided selector string
+        :rtype: VersionSelector
+        """
+
+        if self.inline_transform:
+            return VersionSelector(
+                clauses=self.inline_parser.parse(content.strip()), validate=validate
+            )
+
+        return self.transformer.transform(self.tokenize(content), validate=validate)
+
+    def _parse(self, content: str, validate: bool = True) -> VersionSelector:
+        """Parse a given Semver selector string without using the selector cache.
+
+        :param str content: The selector string to parse
+        :param bool validate: Whether to validate the parsed expression
+        :return: The matching :class:`~.selector.VresionSelector` instance for the \
+            provided selector string
+        :rtype: VersionSelector
+        """
+
+        if self.engine == ParserEngine.NATIVE:
+            return self.native_parser.parse(content, validate=validate)
+
+        from lark.exceptions import VisitError, UnexpectedInput
+
+        try:
+            return self._transform(content, validate=validate)
+        except (UnexpectedInput, VisitError) as exc:
+            result = _get_lark_failure(content, exc)
+            if result is None:
+                raise
+
+            raise result.error  # type: ignore
+
+    def _try_parse(self, content: str, validate: bool = True) -> ParseResult:
+        """Parse a given Semver selector string without using the selector cache.
+
+        :param str content: The selector string to parse
+        :param bool validate: Whether to validate the parsed expression
+        :return: The result describing either the parsed selector or the failure
+        :rtype: ParseResult
+        """
+
+        if self.engine == ParserEngine.NATIVE:
+            return self.native_parser.try_parse(content, validate=validate)
+
+        from lark.exceptions import VisitError, UnexpectedInput
+
+        try:
+            selector = self._transform(content, validate=validate)
+        except InvalidExpression as exc:
+            return ParseResult.from_exception(content, exc)
+        except (UnexpectedInput, VisitError) as exc:
+            result = _get_lark_failure(content, exc)
+            if result is None:
+                raise
+
+            return result
+
+        return ParseResult(content=content, selector=selector)
+
+
+def _get_lark_failure(content: str, exc: Exception) -> Optional[ParseResult]:
+    """Describe an error raised while parsing with Lark as a failed parse result.
+
+    .. note:: The failure message is only built once the result's message is first
+        requested.
+
+    :param str content: The selector string that failed to parse
+    :param Exception exc: The error raised by Lark
+    :return: The failed parse result, or None if the error is not a parsing failure
+    :rtype: Optional[ParseResult]
+    """
+
+    from lark.exceptions import (
+        VisitError,
+        UnexpectedEOF,
+        UnexpectedToken,
+        UnexpectedCharacters,
+    )
+
+    if isinstance(exc, UnexpectedCharacters):
+        return ParseResult(
+            content=content,
+            kind=ParseErrorKind.UNEXPECTED_CHARACTERS,
+            position=exc.column - 1,
+            describe=partial(
+                _format_unexpected_characters,
+                content,
+                exc.allowed,
+                exc.line,
+                exc.column,
+            ),
+        )
+    elif isinstance(exc, UnexpectedToken):
+        # NOTE: the LALR engine reports both unexpected characters and the
+        # unexpected end of an expression as an unexpected token
+        # NOTE: the token is set by every unexpected token error but is missing from
+        # the type stubs shipped with lark-parser
+        if exc.token.type == "$END":  # type: ignore[attr-defined]
+            return ParseResult(
+                content=content,
+                kind=ParseErrorKind.UNEXPECTED_END,
+                position=len(content.strip()),
+                describe=partial(_format_unexpected_end, content, exc.expected),
+            )
+
+        return ParseResult(
+            content=content,
+            kind=ParseErrorKind.UNEXPECTED_CHARACTERS,
+            position=exc.column - 1,
+            describe=partial(
+                _format_unexpected_characters,
+                content,
+                exc.expected,
+                exc.line,
+                exc.column,
+            ),
+        )
+    elif isinstance(exc, UnexpectedEOF):
+        # NOTE: depending on the installed version of Lark, the expected terminals
+        # are given as either terminal instances or as terminal names
+        return ParseResult(
+            content=content,
+            kind=ParseErrorKind.UNEXPECTED_END,
+            position=len(content.strip()),
+            describe=partial(
+                _format_unexpected_end,
+                content,
+                [getattr(_, "name", _) for _ in exc.expected],
+            ),
+        )
+    elif isinstance(exc, VisitError) and isinstance(
+        exc.orig_exc, (ParseFailure, InvalidExpression)
+    ):
+        return ParseResult.from_exception(content, exc.orig_exc)
+
+    return None
+
+
+_WORKER_PARSER: Optional[SemselParser] = None
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily import the Lark dependent members of this module.
+
+    :param str name: The name of the requested module member
+    :raises AttributeError: If the requested member does not exist
+    :return: The requested module member
+    :rtype: Any
+    """
+
+    if name == "SemselTransformer":
+        from .transformer import SemselTransformer
+
+        return SemselTransformer
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# NOTE: see the Python 3.7 note in the package ``__init__``, only the transformer is
+# lazy here as it is the one member of this module which subclasses a Lark class
+if sys.version_info < (3, 7):  # pragma: no cover
+    SemselTransformer = __getattr__("SemselTransformer")
+
+
+def _parse_or_error(
+    parser: SemselParser, content: str, validate: bool = True
+) -> ParseOutcome_T:
+    """Parse a selector string, returning any raised parsing errors instead.
+
+    :param SemselParser parser: The parser to parse the selector string with
+    :param str content: The selector string to parse
+    :param bool validate: Whether to validate the parsed expression
+    :return: The matching selector instance or the raised parsing error
+    :rtype: Union[VersionSelector, ParseFailure, InvalidExpression]
+    """
+
+    try:
+        return parser.parse(content, validate=validate)
+    except (ParseFailure, InvalidExpression) as exc:
+        return exc
+
+
+def _initialize_worker(parser_options: Dict[str, Any]):
+    """Initialize the warmed up parser of a :meth:`~SemselParser.parse_many` worker.
+
+    :param Dict[str, Any] parser_options: The options to build the parser with
+    """
+
+    global _WORKER_PARSER
+    _WORKER_PARSER = SemselParser(**parser_options)
+    if _WORKER_PARSER.inline_transform:
+        _WORKER_PARSER.inline_parser
+    elif _WORKER_PARSER.engine != ParserEngine.NATIVE:
+        _WORKER_PARSER.parser
+
+
+def _parse_chunk(contents: List[str], validate: bool = True) -> List[ParseOutcome_T]:
+    """Parse a chunk of selector strings in a :meth:`~SemselParser.parse_many` worker.
+
+    :param List[str] contents: The selector strings to parse
+    :param bool validate: Whether to validate the parsed expressions
+    :return: The matching selector instances or raised parsing errors
+    :rtype: List[Union[VersionSelector, ParseFailure, InvalidExpression]]
+    """
+
+    return [
+        _parse_or_error(_WORKER_PARSER, content, validate)  # type: ignore
+        for content in contents
+    ]
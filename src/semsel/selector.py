@@ -5,14 +5,29 @@
 """Contains version selector and comparator types and logic."""
 
 from enum import Enum
-from typing import List, Tuple, Union, Generator
+from typing import Any, List, Tuple, Union, TypeVar, Iterable, Optional, Generator
+from weakref import WeakValueDictionary
 from warnings import warn
-from itertools import combinations
 
 import attr
 
-from .utils import cmp
+from .utils import cmp, cache_attribute, cached_slot_property
 from .version import PartialVersion
+from .interval import (
+    MAX_CUT,
+    MIN_CUT,
+    LOWEST_KEY,
+    Key_T,
+    VersionInterval,
+    _key_version,
+    _version_key,
+    _successor_key,
+    _predecessor_key,
+    _union_intervals,
+    _is_subset_intervals,
+    _complement_intervals,
+    _intersect_intervals,
+)
 from .exceptions import InvalidExpression
 
 
@@ -28,7 +43,17 @@ class ConditionOperator(Enum):
     MINOR = "~"
 
 
-@attr.s(order=False)
+Version_T = TypeVar("Version_T", str, PartialVersion)
+
+# NOTE: conditions are interned like versions (see ``_INTERNED_VERSIONS``), but keyed
+# on the version data rather than the version instance so conditions built from
+# separately parsed copies of the same version are still shared
+_INTERNED_CONDITIONS: "WeakValueDictionary[Tuple[Any, ...], VersionCondition]" = (
+    WeakValueDictionary()
+)
+
+
+@attr.s(order=False, frozen=True, slots=True)
 class VersionCondition:
     """Describes a constrained version statement for a single version.
 
@@ -48,6 +73,7 @@ class VersionCondition:
 
     operator: ConditionOperator = attr.ib()
     version: PartialVersion = attr.ib()
+    _interval: Optional[VersionInterval] = cache_attribute()
 
     __condition_comparisons = {
         ConditionOperator.EQ: (0,),
@@ -87,6 +113,77 @@ class VersionCondition:
 
         return f"{self.operator.value!s}{self.version!s}"
 
+    @cached_slot_property
+    def interval(self) -> VersionInterval:
+        """The :class:`~.interval.VersionInterval` of versions satisfying the condition.
+
+        .. note:: Major constrained conditions (``^1.2.3``) allow any version up to
+            the next major version (``>=1.2.3 <2.0.0-0``) while minor constrained
+            conditions (``~1.2.3``) allow any version up to the next minor version
+            (``>=1.2.3 <1.3.0-0``). The prereleases of the next major or minor version
+            have a different major or minor version, so they are excluded as well.
+        """
+
+        version = self.version
+        if self.operator == ConditionOperator.GT:
+            return VersionInterval.from_bounds(start=version, start_inclusive=False)
+        elif self.operator == ConditionOperator.GE:
+            return VersionInterval.from_bounds(start=version)
+        elif self.operator == ConditionOperator.LT:
+            return VersionInterval.from_bounds(end=version, end_inclusive=False)
+        elif self.operator == ConditionOperator.LE:
+            return VersionInterval.from_bounds(end=version)
+        elif self.operator == ConditionOperator.MAJOR:
+            return VersionInterval.from_bounds(
+                start=version,
+                end=PartialVersion(version.major + 1, 0, 0, "0"),
+                end_inclusive=False,
+            )
+        elif self.operator == ConditionOperator.MINOR:
+            return VersionInterval.from_bounds(
+                start=version,
+                end=PartialVersion(version.major, (version.minor or 0) + 1, 0, "0"),
+                end_inclusive=False,
+            )
+
+        return VersionInterval.from_bounds(start=version, end=version)
+
+    @classmethod
+    def intern(
+        cls, operator: ConditionOperator, version: PartialVersion
+    ) -> "VersionCondition":
+        """Get the shared version condition instance for the given operator and version.
+
+        Interned conditions are kept in a weak-value table keyed on the operator and
+        the version data, so an identical condition is only built once for as long as
+        it is still in use.
+
+        :param ConditionOperator operator: The operator of the condition
+        :param PartialVersion version: The version of the condition
+        :raises InvalidExpression: When a minor constrained version does not include an
+            explicit minor version
+        :return: The shared VersionCondition instance
+        :rtype: VersionCondition
+        """
+
+        key = (
+            cls,
+            operator,
+            type(version),
+            version.major,
+            version.minor,
+            version.patch,
+            version.prerelease,
+            version.build,
+        )
+        condition = _INTERNED_CONDITIONS.get(key)
+        if condition is None:
+            condition = _INTERNED_CONDITIONS.setdefault(
+                key, cls(operator=operator, version=version)
+            )
+
+        return condition
+
     def _match_minor(self, version_condition: "VersionCondition") -> bool:
         """Match a given version condition agains the minor constrained version.
 
@@ -270,7 +367,7 @@ class VersionCondition:
         )
 
 
-@attr.s(order=False)
+@attr.s(order=False, frozen=True, slots=True)
 class VersionRange:
     """Describes a version set constrained by a range of versions.
 
@@ -287,6 +384,7 @@ class VersionRange:
 
     version_start: PartialVersion = attr.ib()
     version_end: PartialVersion = attr.ib()
+    _interval: Optional[VersionInterval] = cache_attribute()
 
     def __attrs_post_init__(self):
         """Handle basic validation after class initialization.
@@ -312,6 +410,14 @@ class VersionRange:
 
         return f"{self.version_start!s} - {self.version_end!s}"
 
+    @cached_slot_property
+    def interval(self) -> VersionInterval:
+        """The :class:`~.interval.VersionInterval` of versions within the range."""
+
+        return VersionInterval.from_bounds(
+            start=self.version_start, end=self.version_end
+        )
+
     def _match_condition(self, version_condition: "VersionCondition") -> bool:
         """Match a the current version range against a given version condition.
 
@@ -358,7 +464,64 @@ class VersionRange:
         )
 
 
-@attr.s
+def _freeze_clauses(
+    clauses: Iterable[Iterable[Union[VersionCondition, VersionRange]]]
+) -> Tuple[Tuple[Union[VersionCondition, VersionRange], ...], ...]:
+    """Freeze the given nested clauses into nested tuples.
+
+    :param Iterable[Iterable[Union[VersionCondition, VersionRange]]] clauses: The
+        OR clauses of AND conditions or ranges to freeze
+    :return: The frozen clauses
+    :rtype: Tuple[Tuple[Union[VersionCondition, VersionRange], ...], ...]
+    """
+
+    return tuple(tuple(clause) for clause in clauses)
+
+
+def _build_interval_clause(interval: VersionInterval) -> Tuple[VersionCondition, ...]:
+    """Build the clause of conditions describing the given normalized interval.
+
+    :param VersionInterval interval: The non-empty normalized interval to describe
+    :return: A clause of conditions satisfied by the versions of the interval
+    :rtype: Tuple[VersionCondition, ...]
+    """
+
+    (lower_key, _), (upper_key, _) = interval.lower, interval.upper
+    if (
+        interval.lower != MIN_CUT
+        and interval.upper != MAX_CUT
+        and upper_key == _successor_key(lower_key)
+    ):
+        return (VersionCondition.intern(ConditionOperator.EQ, _key_version(lower_key)),)
+
+    conditions: List[VersionCondition] = []
+    if interval.lower != MIN_CUT:
+        predecessor = _predecessor_key(lower_key)
+        conditions.append(
+            VersionCondition.intern(ConditionOperator.GE, _key_version(lower_key))
+            if predecessor is None
+            else VersionCondition.intern(
+                ConditionOperator.GT, _key_version(predecessor)
+            )
+        )
+    if interval.upper != MAX_CUT:
+        predecessor = _predecessor_key(upper_key)
+        conditions.append(
+            VersionCondition.intern(ConditionOperator.LT, _key_version(upper_key))
+            if predecessor is None
+            else VersionCondition.intern(
+                ConditionOperator.LE, _key_version(predecessor)
+            )
+        )
+    if not conditions:
+        conditions.append(
+            VersionCondition.intern(ConditionOperator.GE, _key_version(LOWEST_KEY))
+        )
+
+    return tuple(conditions)
+
+
+@attr.s(eq=False, frozen=True, slots=True)
 class VersionSelector:
     """Describes a group of condition / range clauses that make up a selector expression.
 
@@ -370,14 +533,26 @@ class VersionSelector:
     So either a version greater than 1 AND less than 1.3 OR a version exactly equal to
     1.5.2 wil satisfy this selector.
 
-    The data within this selector is structured as a list of lists containing either
+    The data within this selector is structured as a tuple of tuples containing either
     :class:`~VersionCondition` or :class:`~VersionRange` instances which are used for
-    comparison and evaluation. The top-level list is the applicable OR clauses while the
-    nested lists are the applicable AND clauses.
+    comparison and evaluation. The top-level tuple is the applicable OR clauses while
+    the nested tuples are the applicable AND clauses. Any given nested iterables are
+    frozen to tuples as selectors (and everything they contain) are immutable.
+
+    .. note:: Selectors are compared and hashed by their canonical interval set (see
+        :attr:`~VersionSelector.interval_set`) rather than by their clauses. Selectors
+        satisfied by the same versions (such as ``^1`` and ``>=1.0.0 <2.0.0-0``) are
+        equal and can be used interchangeably as dictionary keys.
     """
 
-    clauses: List[List[Union[VersionCondition, VersionRange]]] = attr.ib()
+    clauses: Tuple[Tuple[Union[VersionCondition, VersionRange], ...], ...] = attr.ib(
+        converter=_freeze_clauses
+    )
     validate: bool = attr.ib(default=True)
+    _intervals: Optional[Tuple[VersionInterval, ...]] = cache_attribute()
+    _interval_set: Optional[Tuple[VersionInterval, ...]] = cache_attribute()
+    _canonical: Optional[str] = cache_attribute()
+    _packed_bounds: Optional[Tuple[Tuple[int, int], ...]] = cache_attribute()
 
     def __attrs_post_init__(self):
         """Handle clause validation after class initialization."""
@@ -388,24 +563,54 @@ class VersionSelector:
     def _validate(self):
         """Validate the current selector's clauses.
 
+        Each clause is folded into a single interval one expression at a time. The
+        first expression which leaves the interval empty conflicts with the expression
+        which last tightened the bound it crosses, so every clause is validated in a
+        single linear pass. A clause consisting of a single expression without any
+        versions (such as the canonical empty selector ``<0.0.0-0``) is allowed, but
+        the same expression conflicts with any other expression in a clause.
+
         :raises InvalidExpression: When an clause expression is found to conflict with
             another expression in the selector statement
         """
 
         for clause in self.clauses:
-            for source, target in combinations(clause, 2):
-                if not source.match(target):
+            if len(clause) < 2:
+                continue
+
+            interval = VersionInterval()
+            lower_source: Optional[Union[VersionCondition, VersionRange]] = None
+            upper_source: Optional[Union[VersionCondition, VersionRange]] = None
+            for expression in clause:
+                bound = expression.interval.normalize()
+                folded = interval & bound
+                if folded.is_empty:
+                    source = (
+                        lower_source if bound.upper <= interval.lower else upper_source
+                    )
+                    if source is None:
+                        # NOTE: an expression without any versions conflicts with the
+                        # clause's other expressions even if none of them came before
+                        source = next(
+                            other for other in clause if other is not expression
+                        )
                     raise InvalidExpression(
                         f"Expression {source!s} conflicts with expression "
-                        f"{target!s} in clause {self._format_clause(clause)!r}"
+                        f"{expression!s} in clause {self._format_clause(clause)!r}"
                     )
 
+                if interval.lower < folded.lower:
+                    lower_source = expression
+                if folded.upper < interval.upper:
+                    upper_source = expression
+                interval = folded
+
     def _format_clause(
-        self, clause: List[Union[VersionCondition, VersionRange]]
+        self, clause: Tuple[Union[VersionCondition, VersionRange], ...]
     ) -> str:
         """Format a given clause as a human readable string.
 
-        :param List[Union[VersionCondition, VersionRange]] clause: The list of
+        :param Tuple[Union[VersionCondition, VersionRange], ...] clause: The tuple of
             conditions or ranges to format
         :return: A human readable string representation of a clause
         :rtype: str
@@ -414,12 +619,13 @@ class VersionSelector:
         return " ".join([str(expression) for expression in clause])
 
     def _format_clause_group(
-        self, clause_group: List[List[Union[VersionCondition, VersionRange]]]
+        self,
+        clause_group: Tuple[Tuple[Union[VersionCondition, VersionRange], ...], ...],
     ) -> str:
-        """Format a given list of clauses (caluse group) as a human readable string.
+        """Format a given tuple of clauses (caluse group) as a human readable string.
 
-        :param List[List[Union[VersionCondition, VersionRange]]] clause_group: The list
-            of clauses to format
+        :param Tuple[Tuple[Union[VersionCondition, VersionRange], ...], ...] \
+            clause_group: The tuple of clauses to format
         :return: A human readable string representation of a clause group
         :rtype: str
         """
@@ -434,3 +640,406 @@ class VersionSelector:
         """
 
         return self._format_clause_group(self.clauses)
+
+    def __eq__(self, other: Any) -> bool:
+        """Compare if the given selector is satisfied by the same versions.
+
+        :param Any other: The selector to compare equality with
+        :return: True if both selectors are satisfied by the same versions, otherwise
+            False
+        :rtype: bool
+        """
+
+        if not isinstance(other, VersionSelector):
+            return NotImplemented
+
+        return self.interval_set == other.interval_set
+
+    def __ne__(self, other: Any) -> bool:
+        """Compare if the given selector is not satisfied by the same versions.
+
+        :param Any other: The selector to compare inequality with
+        :return: True if the selectors are satisfied by different versions, otherwise
+            False
+        :rtype: bool
+        """
+
+        if not isinstance(other, VersionSelector):
+            return NotImplemented
+
+        return self.interval_set != other.interval_set
+
+    def __hash__(self) -> int:
+        """Hash the selector by its canonical interval set.
+
+        :return: The hash of the selector's canonical interval set
+        :rtype: int
+        """
+
+        return hash(self.interval_set)
+
+    @cached_slot_property
+    def intervals(self) -> Tuple[VersionInterval, ...]:
+        """The :class:`~.interval.VersionInterval` of each of the selector's clauses.
+
+        .. note:: Each clause is only compiled into its interval once, the first time
+            the intervals are requested.
+        """
+
+        intervals = []
+        for clause in self.clauses:
+            interval = VersionInterval()
+            for expression in clause:
+                interval &= expression.interval
+            intervals.append(interval)
+
+        return tuple(intervals)
+
+    @cached_slot_property
+    def interval_set(self) -> Tuple[VersionInterval, ...]:
+        """The canonical set of intervals of versions satisfying the selector.
+
+        The canonical set is the sorted tuple of disjoint, non-adjacent, non-empty, and
+        normalized (see :meth:`~.interval.VersionInterval.normalize`) intervals. Two
+        selectors are satisfied by the same versions if and only if their canonical
+        sets are equal.
+        """
+
+        return _union_intervals(self.intervals)
+
+    @cached_slot_property
+    def packed_bounds(self) -> Tuple[Tuple[int, int], ...]:
+        """The :attr:`~.interval.VersionInterval.packed_bounds` of each clause.
+
+        .. note:: Releases that can be packed (see
+            :meth:`~.version.PartialVersion.to_packed`) are checked against these
+            bounds with integer comparisons rather than comparing their sort keys
+            against the cuts of each clause. Clauses without any releases are left out.
+        """
+
+        return tuple(
+            bounds
+            for bounds in (interval.packed_bounds for interval in self.intervals)
+            if bounds[0] < bounds[1]
+        )
+
+    @classmethod
+    def from_intervals(cls, intervals: Iterable[VersionInterval]) -> "VersionSelector":
+        """Build a new selector satisfied by the versions of any of the given intervals.
+
+        >>> from semsel.interval import VersionInterval
+        >>> str(VersionSelector.from_intervals([
+        ...     VersionInterval.from_bounds("1.0.0", "2.0.0", end_inclusive=False),
+        ...     VersionInterval.from_bounds("1.5.0", "3.0.0"),
+        ... ]))
+            '>=1.0.0 <=3.0.0'
+
+        .. note:: A selector built from intervals without any versions consists of the
+            single condition ``<0.0.0-0`` which is never satisfied.
+
+        :param Iterable[VersionInterval] intervals: The intervals of versions
+            satisfying the selector
+        :return: A new VersionSelector instance
+        :rtype: VersionSelector
+        """
+
+        clauses = [
+            _build_interval_clause(interval) for interval in _union_intervals(intervals)
+        ]
+        if not clauses:
+            clauses.append(
+                (
+                    VersionCondition.intern(
+                        ConditionOperator.LT, _key_version(LOWEST_KEY)
+                    ),
+                )
+            )
+
+        # NOTE: clauses built from intervals are always satisfiable and never need to
+        # be validated
+        return cls(clauses=clauses, validate=False)
+
+    @cached_slot_property
+    def canonical(self) -> str:
+        """The canonical string of the selector.
+
+        Selectors satisfied by the same versions always have the same canonical string
+        which can be parsed back into the :meth:`~VersionSelector.simplify` selector.
+        """
+
+        return str(self.simplify())
+
+    def simplify(self) -> "VersionSelector":
+        """Build the equivalent selector with the fewest clauses and conditions.
+
+        Redundant conditions are dropped and overlapping or adjacent clauses are merged
+        so the simplified selector has a single clause of at most two conditions for
+        each disjoint interval of satisfying versions.
+
+        >>> selector = SemselParser().parse(">=1 >=1.2 <3 <2.5 || >=1.3 <2")
+        >>> str(selector.simplify())
+            '>=1.2.0 <2.5.0'
+
+        :return: A new VersionSelector instance
+        :rtype: VersionSelector
+        """
+
+        return VersionSelector.from_intervals(self.interval_set)
+
+    def is_empty(self) -> bool:
+        """Check if the selector can never be satisfied by any version.
+
+        :return: True if no version satisfies the selector, otherwise False
+        :rtype: bool
+        """
+
+        return not self.interval_set
+
+    def issubset(self, other: "VersionSelector") -> bool:
+        """Check if every version satisfying the selector satisfies the given selector.
+
+        >>> parser = SemselParser()
+        >>> parser.parse("~1.2.3").issubset(parser.parse("^1.2"))
+            True
+
+        :param VersionSelector other: The selector to check against
+        :return: True if the selector is narrower than or equivalent to the given
+            selector, otherwise False
+        :rtype: bool
+        """
+
+        return _is_subset_intervals(self.interval_set, other.interval_set)
+
+    def issuperset(self, other: "VersionSelector") -> bool:
+        """Check if every version satisfying the given selector satisfies the selector.
+
+        :param VersionSelector other: The selector to check against
+        :return: True if the selector is wider than or equivalent to the given
+            selector, otherwise False
+        :rtype: bool
+        """
+
+        return _is_subset_intervals(other.interval_set, self.interval_set)
+
+    def equivalent(self, other: "VersionSelector") -> bool:
+        """Check if the selector is satisfied by exactly the same versions as another.
+
+        >>> parser = SemselParser()
+        >>> parser.parse("^1.2 || 1.5.0").equivalent(parser.parse(">=1.2.0 <2.0.0-0"))
+            True
+
+        :param VersionSelector other: The selector to check against
+        :return: True if both selectors are satisfied by the same versions, otherwise
+            False
+        :rtype: bool
+        """
+
+        return self.interval_set == other.interval_set
+
+    def intersection(self, other: "VersionSelector") -> "VersionSelector":
+        """Build the selector satisfied by versions satisfying both selectors.
+
+        >>> parser = SemselParser()
+        >>> str(parser.parse("^1.2 || ^3") & parser.parse(">=1.4 <3.1"))
+            '>=1.4.0 <2.0.0-0 || >=3.0.0 <3.1.0'
+
+        :param VersionSelector other: The selector to intersect with
+        :return: A new VersionSelector instance
+        :rtype: VersionSelector
+        """
+
+        return VersionSelector.from_intervals(
+            _intersect_intervals(self.interval_set, other.interval_set)
+        )
+
+    def union(self, other: "VersionSelector") -> "VersionSelector":
+        """Build the selector satisfied by versions satisfying either selector.
+
+        :param VersionSelector other: The selector to join with
+        :return: A new VersionSelector instance
+        :rtype: VersionSelector
+        """
+
+        return VersionSelector.from_intervals(self.interval_set + other.interval_set)
+
+    def complement(self) -> "VersionSelector":
+        """Build the selector satisfied by versions not satisfying the selector.
+
+        :return: A new VersionSelector instance
+        :rtype: VersionSelector
+        """
+
+        return VersionSelector.from_intervals(_complement_intervals(self.interval_set))
+
+    def __and__(self, other: Any) -> "VersionSelector":
+        """Build the selector satisfied by versions satisfying both selectors.
+
+        :param VersionSelector other: The selector to intersect with
+        :return: A new VersionSelector instance
+        :rtype: VersionSelector
+        """
+
+        if not isinstance(other, VersionSelector):
+            return NotImplemented
+
+        return self.intersection(other)
+
+    def __or__(self, other: Any) -> "VersionSelector":
+        """Build the selector satisfied by versions satisfying either selector.
+
+        :param VersionSelector other: The selector to join with
+        :return: A new VersionSelector instance
+        :rtype: VersionSelector
+        """
+
+        if not isinstance(other, VersionSelector):
+            return NotImplemented
+
+        return self.union(other)
+
+    def __invert__(self) -> "VersionSelector":
+        """Build the selector satisfied by versions not satisfying the selector.
+
+        :return: A new VersionSelector instance
+        :rtype: VersionSelector
+        """
+
+        return self.complement()
+
+    def contains(self, version: Union[str, PartialVersion]) -> bool:
+        """Check if the given version satisfies the selector.
+
+        >>> selector = SemselParser().parse(">=1.2 <2 || ^3")
+        >>> selector.contains("1.4.0")
+            True
+        >>> PartialVersion(2, 1) in selector
+            False
+
+        :param Union[str, PartialVersion] version: The version to check
+        :return: True if the version satisfies any of the selector's clauses,
+            otherwise False
+        :rtype: bool
+        """
+
+        if isinstance(version, str):
+            version = PartialVersion.from_string(version)
+
+        packed = version.packed_key
+        if packed >= 0:
+            for lower, upper in self.packed_bounds:
+                if lower <= packed < upper:
+                    return True
+
+            return False
+
+        lower_cut = (version.sort_key, 0)
+        upper_cut = (lower_cut[0], 1)
+        for interval in self.intervals:
+            if interval.lower <= lower_cut and upper_cut <= interval.upper:
+                return True
+
+        return False
+
+    def __contains__(self, version: Union[str, PartialVersion]) -> bool:
+        """Check if the given version satisfies the selector.
+
+        :param Union[str, PartialVersion] version: The version to check
+        :return: True if the version satisfies the selector, otherwise False
+        :rtype: bool
+        """
+
+        return self.contains(version)
+
+    def _iter_satisfying(
+        self, versions: Iterable[Version_T]
+    ) -> Generator[Tuple[PartialVersion, Version_T], None, None]:
+        """Iterate over the given versions which satisfy the selector.
+
+        :param Iterable[Union[str, PartialVersion]] versions: The versions to check
+        :return: A generator of parsed versions and the given versions satisfying the
+            selector
+        :rtype: Generator[Tuple[PartialVersion, Union[str, PartialVersion]], None, \
+            None]
+        """
+
+        packed_bounds = self.packed_bounds
+        bounds = [
+            (interval.lower, interval.upper)
+            for interval in self.intervals
+            if not interval.is_empty
+        ]
+        for version in versions:
+            parsed = (
+                PartialVersion.from_string(version)
+                if isinstance(version, str)
+                else version
+            )
+            packed = parsed.packed_key
+            if packed >= 0:
+                for packed_lower, packed_upper in packed_bounds:
+                    if packed_lower <= packed < packed_upper:
+                        yield parsed, version
+                        break
+                continue
+
+            key = parsed.sort_key
+            lower_cut, upper_cut = (key, 0), (key, 1)
+            for lower, upper in bounds:
+                if lower <= lower_cut and upper_cut <= upper:
+                    yield parsed, version
+                    break
+
+    def filter(self, versions: Iterable[Version_T]) -> Generator[Version_T, None, None]:
+        """Lazily filter the given versions to only those which satisfy the selector.
+
+        >>> selector = SemselParser().parse("^1.2")
+        >>> list(selector.filter(["1.1.0", "1.2.0", PartialVersion(1, 9), "2.0.0"]))
+            ['1.2.0', PartialVersion(major=1, minor=9, ...)]
+
+        :param Iterable[Union[str, PartialVersion]] versions: The versions (or version
+            strings) to filter
+        :raises ValueError: If a given string is not a valid partial semantic version
+        :return: A generator of the given versions which satisfy the selector
+        :rtype: Generator[Union[str, PartialVersion], None, None]
+        """
+
+        for _, version in self._iter_satisfying(versions):
+            yield version
+
+    def max_satisfying(self, versions: Iterable[Version_T]) -> Optional[Version_T]:
+        """Get the greatest of the given versions which satisfies the selector.
+
+        :param Iterable[Union[str, PartialVersion]] versions: The versions (or version
+            strings) to check
+        :raises ValueError: If a given string is not a valid partial semantic version
+        :return: The greatest satisfying version, or None if no version satisfies the
+            selector
+        :rtype: Optional[Union[str, PartialVersion]]
+        """
+
+        best_version: Optional[PartialVersion] = None
+        best: Optional[Version_T] = None
+        for parsed, version in self._iter_satisfying(versions):
+            if best_version is None or parsed > best_version:
+                best_version, best = parsed, version
+
+        return best
+
+    def min_satisfying(self, versions: Iterable[Version_T]) -> Optional[Version_T]:
+        """Get the least of the given versions which satisfies the selector.
+
+        :param Iterable[Union[str, PartialVersion]] versions: The versions (or version
+            strings) to check
+        :raises ValueError: If a given string is not a valid partial semantic version
+        :return: The least satisfying version, or None if no version satisfies the
+            selector
+        :rtype: Optional[Union[str, PartialVersion]]
+        """
+
+        best_version: Optional[PartialVersion] = None
+        best: Optional[Version_T] = None
+        for parsed, version in self._iter_satisfying(versions):
+            if best_version is None or parsed < best_version:
+                best_version, best = parsed, version
+
+        return best
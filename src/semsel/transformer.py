@@ -0,0 +1,352 @@
+# -*- encoding: utf-8 -*-
+# Copyright (c) 2019 Stephen Bunn <stephen@bunn.io>
+# ISC License <https://choosealicense.com/licenses/isc>
+
+"""Contains the Lark transformer for tokenized Semver selector expressions.
+
+.. note:: This module imports :mod:`lark` and is only imported once a Lark based
+    :class:`~.parser.SemselParser` is first built (or when the transformer is
+    explicitly requested).
+"""
+
+from typing import Any, Dict, List, Tuple, Union
+
+import attr
+from lark import Tree, Token, Transformer
+
+from .version import PartialVersion
+from .selector import VersionRange, VersionSelector, VersionCondition, ConditionOperator
+from .exceptions import ParseFailure, InvalidExpression
+
+
+class SemselTransformer(Transformer):
+    """Transforms a tokenized Semver selection expression to a standard instance.
+
+    The goal of this transformer is to take a tokenized Semver selector expression and
+    produce the corresponding :class:`~.selector.VersionSelector` instance that can
+    be used for evaluation.
+
+    This transformer should only really be applied to tokenized trees from the provided
+    grammar in order to avoid breakages. This transfomer is automatically included and
+    used during calls to :meth:`~.SemselParser.parse`. To use this transformer outside
+    of the parser usage, you need to have a tree that needs to be transformed.
+    Assuming you have a Lark produced :class:`lark.Tree` structure, you can use this
+    transfomer like the following:
+
+    >>> from semsel.transformer import SemselTransformer
+    >>> version_selector = SemeselTransformer(visit_tokens=True).transform(MY_TREE)
+    >>> version_selector
+        VersionSelector()
+
+    .. important:: Without the ``visit_tokens`` flag being set to ``True`` during the
+        initialization of the transformer, this transformer will fail as we rely on
+        the visiting of the version fragments (MAJOR, MINOR, and PATCH) for casting
+        before we build the proper :class:`~.version.PartialVersion` instance.
+        We also rely on this flag for properly parsing out and constructing the
+        :class:`~.selector.ConditionOperator` for conditioned version expressions.
+
+        Please be sure you set this flag to ``True`` if you intend to use this
+        transformer outside of a :class:`~.SemselParser` instance.
+    """
+
+    def __cast_to_int(self, token: Token) -> int:
+        """Cast a given digit token to be an integer instead of a string.
+
+        .. note:: To be safe for future udpates to the lark parser API we are
+            mangling this method name to avoid future collisions.
+
+        :param Token token: The token to update from a string to an integer
+        :return: The updated token instance
+        :rtype: int
+        """
+
+        return token.update(value=int(token.value))
+
+    def MAJOR(self, token: Token) -> Token:
+        """Ensure that ``MAJOR`` tokens are casted down to an ``int``.
+
+        :param Token token: The MAJOR token instance
+        :return: A Token that has had it's value casted to an int
+        :rtype: Token
+        """
+
+        return self.__cast_to_int(token)
+
+    def MINOR(self, token: Token) -> int:
+        """Ensure that ``MINOR`` tokens are casted down to an ``int``.
+
+        :param Token token: The MINOR token instance
+        :return: A Token that has had it's value casted to an int
+        :rtype: Token
+        """
+
+        return self.__cast_to_int(token)
+
+    def PATCH(self, token: Token) -> int:
+        """Ensure that ``PATCH`` tokens are casted down to an ``int``.
+
+        :param Token token: The PATCH token instance
+        :return: A Token that has had it's value casted to an int
+        :rtype: Token
+        """
+
+        return self.__cast_to_int(token)
+
+    def OPERATOR(self, token: Token) -> ConditionOperator:
+        """Ensure that :class:`~.selector.ConditionOperator` are created.
+
+        :param Token token: A token matching the given operator
+        :return: The corresponding ConditionOperator for the passed in token
+        :rtype: ConditionOperator
+        """
+
+        return ConditionOperator(token.value)
+
+    def version(self, tokens: List[Token]) -> PartialVersion:
+        """Ensure that :class:`~.version.PartialVersion` instances are created.
+
+        :param List[Token] tokens: A list of tokens which make up a single version.
+        :return: A built version which can be compared and evaluated
+        :rtype: PartialVersion
+        """
+
+        return PartialVersion.intern(
+            **{fragment.type.lower(): fragment.value for fragment in tokens}
+        )
+
+    def version_condition(
+        self, tokens: List[Union[Token, ConditionOperator, PartialVersion]]
+    ) -> VersionCondition:
+        """Ensure that :class:`~.selector.VersionCondition` instances are created.
+
+        .. note:: If no :class:`~.selector.ConditionOperator` is provided in the built
+            tokens, the user has not included an operator for the condition. In this
+            case we **IMPLICILTY ASSUME** that the user intends the provided version
+            to be matched explicilty with an equality operator.
+
+            For example, the version specifier ``1`` will be interepreted as ``=1``
+            implicilty. This *feature* is part of the standard Semver selector
+            specification.
+
+        :param List[Union[Token, ConditionOperator, PartialVersion]] data: A list \
+            **POTENTIALLY** containing an :class:`~.selector.ConditionOperator` and \
+            **ALWAYS** containing a :class:`~.version.PartialVersion`
+        :raises ParseFailure: If either we fail to extract the operator or version \
+            from the provided tokens
+        :return: A matching condition statement for a given condition token set
+        :rtype: VersionCondition
+        """
+
+        condition_tuple: Tuple[ConditionOperator, PartialVersion]
+        if len(tokens) == 1:
+            if not isinstance(tokens[0], PartialVersion):
+                raise ParseFailure(
+                    f"failed to extract expected version from {tokens!r}"
+                )
+
+            # NOTE: we assume that if NO operator symbol is provided in the condition,
+            # then the user intends the version to have an IMPLICIT equals condition
+            return VersionCondition.intern(ConditionOperator.EQ, tokens[0])
+
+        elif len(tokens) == 2:
+            operator, version = tokens
+            if not isinstance(operator, ConditionOperator):
+                raise ParseFailure(
+                    f"failed to extract expected operator from {tokens!r}"
+                )
+            if not isinstance(version, PartialVersion):
+                raise ParseFailure(
+                    f"failed to extract expected version from {tokens!r}"
+                )
+
+            return VersionCondition.intern(operator, version)
+
+        else:
+            raise ParseFailure(
+                f"failed to extract expected operator and version from {tokens!r}"
+            )
+
+    def version_range(self, tokens: List[PartialVersion]) -> VersionRange:
+        """Ensure that :class:`~.selector.VersionRange` instances are created.
+
+        :param List[PartialVersion] tokens: A lsit of multiple versions, the first one \
+            being the starting version and the last one being the ending version
+        :raises ParseFailure: If we fail to find both a starting and ending version
+        :return: A matching version range instance for the given range token set
+        :rtype: VersionRange
+        """
+
+        if len(tokens) != 2:
+            raise ParseFailure(
+                f"failed to extract expected start and end versions from {tokens!r}"
+            )
+
+        version_start, version_end = tokens
+        return VersionRange(version_start=version_start, version_end=version_end)
+
+    def version_clause(
+        self, tokens: List[Union[VersionCondition, VersionRange]]
+    ) -> List[Union[VersionCondition, VersionRange]]:
+        """Ensure that clauses are passed back simply as their tokens.
+
+        .. note:: This is a necessary transformation to ensure we are not including
+            token instances but instead are resolving clauses to simply be the list of
+            parsed and transformed conditions and ranges from the tokenzied statements.
+
+        :param List[Union[VersionCondition, VersionRange]] tokens: A list of tokens \
+            making up the parsed version clause
+        :return: A list of tokens making up the parsed version clause
+        :rtype: List[Union[VersionCondition, VersionRange]]
+        """
+
+        return tokens
+
+    def selector(
+        self, tokens: List[List[Union[VersionCondition, VersionRange]]]
+    ) -> VersionSelector:
+        """Ensure that a :class:`~.selector.VersionSelector` instance is created.
+
+        :param List[List[Union[VersionCondition, VersionRange]]] tokens: A list of \
+            clause tokens that can be used directly in the \
+            :class:`~.selector.VersionSelector` class
+        :return: A new version selector instance to use for various comparisons
+        :rtype: VersionSelector
+        """
+
+        return VersionSelector(clauses=tokens, validate=self.__validate)
+
+    def transform(self, tree: Tree, validate: bool = True) -> Any:
+        """Transform the given tree to a :class:`~.selector.VersionSelector`.
+
+        :param Tree tree: The ``selector`` tree to transform
+        :param bool validate: Whether validation should be performed on the built
+            version selector, optional, defaults to True
+        :return: The result of the transformed tree
+        :rtype: Any
+        """
+
+        self.__validate = validate
+        return super().transform(tree)
+
+
+@attr.s(frozen=True, slots=True)
+class _DeferredExpression:
+    """Describes a condition or range which failed to be built while parsing.
+
+    The inline transformer builds expressions before the whole selector is known to be
+    syntactically valid, so the error is only raised once parsing has succeeded.
+    """
+
+    error: InvalidExpression = attr.ib()
+
+
+class SemselInlineTransformer(SemselTransformer):
+    """Builds selector clauses while a LALR parser reduces the grammar's rules.
+
+    This transformer is attached directly to a LALR :class:`lark.Lark` parser (through
+    its ``transformer`` option) so that no intermediate :class:`lark.Tree` is ever
+    built. Rather than a :class:`~.selector.VersionSelector`, parsing results in the
+    list of clauses for the selector so that the caller can decide whether the built
+    selector should be validated.
+
+    .. important:: Lark registers any transformer method named after a terminal as a
+        lexer callback, and lexer callbacks must return tokens. Because of this, the
+        terminal methods of the :class:`~SemselTransformer` are disabled and their
+        casting is instead done while reducing the ``version`` and
+        ``version_condition`` rules.
+
+    .. note:: Conditions and ranges are built before the rest of the expression is
+        parsed, so the first :class:`~.exceptions.InvalidExpression` raised while
+        building them is deferred until the ``selector`` rule is reduced. Syntax errors
+        later in the expression are then raised as a parse failure, just like with
+        the other engines.
+    """
+
+    MAJOR = MINOR = PATCH = OPERATOR = None  # type: ignore
+
+    def version(self, tokens: List[Token]) -> PartialVersion:
+        """Ensure that :class:`~.version.PartialVersion` instances are created.
+
+        :param List[Token] tokens: A list of tokens which make up a single version.
+        :return: A built version which can be compared and evaluated
+        :rtype: PartialVersion
+        """
+
+        fragments: Dict[str, Any] = {
+            fragment.type.lower(): (
+                int(fragment.value)
+                if fragment.type in ("MAJOR", "MINOR", "PATCH")
+                else fragment.value
+            )
+            for fragment in tokens
+        }
+        return PartialVersion.intern(**fragments)
+
+    # NOTE: the following overrides intentionally break the return types of the
+    # SemselTransformer methods, conditions and ranges which fail to be built are
+    # returned as deferred expressions and the selector rule results in its clauses
+    def version_condition(  # type: ignore[override]
+        self, tokens: List[Union[Token, ConditionOperator, PartialVersion]]
+    ) -> Union[VersionCondition, _DeferredExpression]:
+        """Ensure that :class:`~.selector.VersionCondition` instances are created.
+
+        :param List[Union[Token, ConditionOperator, PartialVersion]] tokens: A list \
+            **POTENTIALLY** containing an ``OPERATOR`` token and **ALWAYS** containing \
+            a :class:`~.version.PartialVersion`
+        :raises ParseFailure: If either we fail to extract the operator or version \
+            from the provided tokens
+        :return: A matching condition statement for a given condition token set, or
+            the deferred error raised while building it
+        :rtype: Union[VersionCondition, _DeferredExpression]
+        """
+
+        try:
+            return super().version_condition(
+                [
+                    ConditionOperator(token.value)
+                    if isinstance(token, Token) and token.type == "OPERATOR"
+                    else token
+                    for token in tokens
+                ]
+            )
+        except InvalidExpression as exc:
+            return _DeferredExpression(exc)
+
+    def version_range(  # type: ignore[override]
+        self, tokens: List[PartialVersion]
+    ) -> Union[VersionRange, _DeferredExpression]:
+        """Ensure that :class:`~.selector.VersionRange` instances are created.
+
+        :param List[PartialVersion] tokens: A list of multiple versions, the first one \
+            being the starting version and the last one being the ending version
+        :raises ParseFailure: If we fail to find both a starting and ending version
+        :return: A matching version range instance for the given range token set, or
+            the deferred error raised while building it
+        :rtype: Union[VersionRange, _DeferredExpression]
+        """
+
+        try:
+            return super().version_range(tokens)
+        except InvalidExpression as exc:
+            return _DeferredExpression(exc)
+
+    def selector(  # type: ignore[override]
+        self, tokens: List[List[Union[VersionCondition, VersionRange]]]
+    ) -> List[List[Union[VersionCondition, VersionRange]]]:
+        """Ensure that the parsed clauses are passed back simply as their tokens.
+
+        :param List[List[Union[VersionCondition, VersionRange]]] tokens: A list of \
+            clause tokens that can be used directly in the \
+            :class:`~.selector.VersionSelector` class
+        :raises InvalidExpression: If building any of the parsed conditions or ranges
+            failed
+        :return: The given list of clause tokens
+        :rtype: List[List[Union[VersionCondition, VersionRange]]]
+        """
+
+        for clause in tokens:
+            for expression in clause:
+                if isinstance(expression, _DeferredExpression):
+                    raise expression.error
+
+        return tokens
@@ -4,7 +4,15 @@
 
 """Contains module-wide utility functions."""
 
-from typing import Any
+import os
+import sys
+from typing import Any, TypeVar, Callable
+from pathlib import Path
+from functools import wraps
+
+import attr
+
+T = TypeVar("T")
 
 
 def cmp(source: Any, target: Any) -> int:
@@ -17,3 +25,63 @@ def cmp(source: Any, target: Any) -> int:
     """
 
     return (source > target) - (source < target)
+
+
+def cache_attribute() -> Any:
+    """Build an attribute slot to hold the value of a :func:`cached_slot_property`.
+
+    The attribute is excluded from the initializer, representation, and equality of
+    the class so it never changes the behavior of the instance.
+
+    :return: A new :mod:`attr` attribute defaulting to None
+    :rtype: Any
+    """
+
+    return attr.ib(default=None, init=False, repr=False, eq=False)
+
+
+def cached_slot_property(method: Callable[[Any], T]) -> T:
+    """Build a property computed once and cached in a :func:`cache_attribute` slot.
+
+    Slotted classes don't have an instance ``__dict__`` for ``cached_property`` to
+    write to, so the computed value is written to the attribute named after the
+    method with a leading underscore (``interval`` is cached in ``_interval``) instead.
+    This also works for frozen classes as the attribute is set on the object directly.
+
+    :param Callable[[Any], T] method: The method computing the property's value
+    :return: A property computing and caching the value of the given method
+    :rtype: T
+    """
+
+    slot = f"_{method.__name__!s}"
+
+    @wraps(method)
+    def getter(instance: Any) -> T:
+        value = getattr(instance, slot)
+        if value is None:
+            value = method(instance)
+            object.__setattr__(instance, slot, value)
+
+        return value
+
+    return property(getter)  # type: ignore
+
+
+def get_cache_dir(name: str = "semsel") -> Path:
+    """Get the user-level cache directory for the given application name.
+
+    .. note:: The directory is only resolved, it is not created.
+
+    :param str name: The name of the application to get the cache directory for
+    :return: The path to the user's cache directory for the application
+    :rtype: Path
+    """
+
+    if sys.platform.startswith("win"):
+        base = os.environ.get("LOCALAPPDATA") or Path.home() / "AppData" / "Local"
+    elif sys.platform == "darwin":
+        base = Path.home() / "Library" / "Caches"
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+
+    return Path(base) / name
@@ -0,0 +1,284 @@
+# -*- encoding: utf-8 -*-
+# Copyright (c) 2020 Modist Team <admin@modist.io>
+# ISC License <https://choosealicense.com/licenses/isc>
+
+"""Contains vectorized evaluation of selectors over large arrays of versions.
+
+.. important:: This module requires :mod:`numpy` which is an optional dependency of
+    this package, install it with ``pip install semsel[vector]``.
+
+Versions are encoded as four ``int64`` columns (major, minor, patch, and prerelease
+rank) so the bounds of every clause of a selector can be checked with vectorized
+comparisons rather than comparing each version individually.
+
+Prereleases are ranked by their precedence among the distinct prereleases of the
+array. The ``i``-th prerelease has the rank ``2 * i + 1`` and releases have the rank
+``2 * n + 2`` (for ``n`` distinct prereleases). A prerelease within a selector's bounds
+that is not in the array takes the even rank between its neighbors, so every bound
+can be compared against the rank column without ranking the array again.
+"""
+
+from bisect import bisect_left
+from typing import List, Tuple, Union, Iterable, Optional, Sequence
+
+import attr
+
+from .version import PartialVersion, _prerelease_key
+from .interval import MAX_CUT, MIN_CUT, Cut_T, Key_T
+from .selector import VersionSelector
+
+try:
+    import numpy
+except ImportError as exc:  # pragma: no cover
+    raise ImportError(
+        "semsel.vector requires numpy, install it with `pip install semsel[vector]`"
+    ) from exc
+
+
+def _compare_bound(
+    columns: Sequence["numpy.ndarray"],
+    bound: Sequence[int],
+    greater: bool,
+    inclusive: bool,
+) -> "numpy.ndarray":
+    """Lexicographically compare the given columns against the given bound.
+
+    :param Sequence[numpy.ndarray] columns: The columns to compare
+    :param Sequence[int] bound: The value to compare each column against
+    :param bool greater: True to check if the columns are greater than the bound,
+        False to check if the columns are less than the bound
+    :param bool inclusive: True to also accept columns equal to the bound
+    :return: A boolean mask of the rows satisfying the comparison
+    :rtype: numpy.ndarray
+    """
+
+    strict, loose = (
+        (numpy.greater, numpy.greater_equal)
+        if greater
+        else (numpy.less, numpy.less_equal)
+    )
+    result = (loose if inclusive else strict)(columns[-1], bound[-1])
+    for column, value in zip(reversed(columns[:-1]), reversed(bound[:-1])):
+        result = strict(column, value) | ((column == value) & result)
+
+    return result
+
+
+@attr.s(frozen=True, repr=False)
+class VersionArray:
+    """Describes a column encoded array of versions for vectorized selector checks.
+
+    >>> from semsel.vector import VersionArray
+    >>> versions = VersionArray.from_versions(["1.0.0", "1.4.0-rc.1", "2.0.0"])
+    >>> versions.contains(SemselParser().parse("^1"))
+        array([ True,  True, False])
+
+    .. note:: The masks built by :meth:`~VersionArray.contains` are always identical to
+        checking each version with :meth:`~.selector.VersionSelector.contains`.
+    """
+
+    major: "numpy.ndarray" = attr.ib()
+    minor: "numpy.ndarray" = attr.ib()
+    patch: "numpy.ndarray" = attr.ib()
+    prerelease: "numpy.ndarray" = attr.ib()
+    prereleases: Tuple[Key_T, ...] = attr.ib(default=tuple())
+
+    @classmethod
+    def from_columns(
+        cls,
+        major: Iterable[int],
+        minor: Optional[Iterable[int]] = None,
+        patch: Optional[Iterable[int]] = None,
+        prerelease: Optional[Iterable[Optional[str]]] = None,
+    ) -> "VersionArray":
+        """Build a new array from columns of version data.
+
+        .. note:: Each distinct prerelease is only keyed once, so this is the fastest
+            way to encode a large number of versions.
+
+        :param Iterable[int] major: The major version of each version
+        :param Optional[Iterable[int]] minor: The minor version of each version,
+            defaults to None (all zeros)
+        :param Optional[Iterable[int]] patch: The patch version of each version,
+            defaults to None (all zeros)
+        :param Optional[Iterable[Optional[str]]] prerelease: The prerelease of each
+            version (where None or an empty string is a release), defaults to None
+            (all releases)
+        :return: A new VersionArray instance
+        :rtype: VersionArray
+        """
+
+        major_column = numpy.asarray(major, dtype=numpy.int64)
+        minor_column, patch_column = (
+            (
+                numpy.zeros_like(major_column)
+                if column is None
+                else numpy.asarray(column, dtype=numpy.int64)
+            )
+            for column in (minor, patch)
+        )
+
+        if prerelease is None:
+            return cls(
+                major=major_column,
+                minor=minor_column,
+                patch=patch_column,
+                prerelease=numpy.full_like(major_column, 2),
+            )
+
+        values = numpy.asarray(prerelease)
+        if values.dtype.kind != "U":
+            values = numpy.array(values, dtype=object)
+            values[numpy.equal(values, None)] = ""
+            values = values.astype(str)
+
+        texts, inverse = numpy.unique(values, return_inverse=True)
+
+        keys = [_prerelease_key(text) if text else None for text in texts.tolist()]
+        prereleases = sorted(key for key in keys if key is not None)
+        release_rank = 2 * len(prereleases) + 2
+        ranks = numpy.array(
+            [
+                release_rank if key is None else 2 * bisect_left(prereleases, key) + 1
+                for key in keys
+            ],
+            dtype=numpy.int64,
+        )
+
+        return cls(
+            major=major_column,
+            minor=minor_column,
+            patch=patch_column,
+            prerelease=ranks[inverse.reshape(-1)],
+            prereleases=tuple(prereleases),
+        )
+
+    @classmethod
+    def from_versions(
+        cls, versions: Iterable[Union[str, PartialVersion]]
+    ) -> "VersionArray":
+        """Build a new array from the given versions.
+
+        :param Iterable[Union[str, PartialVersion]] versions: The versions (or version
+            strings) to encode
+        :raises ValueError: If a given string is not a valid partial semantic version
+        :return: A new VersionArray instance
+        :rtype: VersionArray
+        """
+
+        rows: List[Tuple[int, int, int, Optional[str]]] = []
+        for version in versions:
+            if isinstance(version, str):
+                version = PartialVersion.from_string(version)
+            rows.append(
+                (
+                    version.major,
+                    version.minor or 0,
+                    version.patch or 0,
+                    version.prerelease,
+                )
+            )
+
+        major, minor, patch, prerelease = zip(*rows) if rows else ((), (), (), ())
+        return cls.from_columns(major, minor, patch, prerelease)
+
+    def __repr__(self) -> str:
+        """Produce a developer readable string to describe the array.
+
+        :return: A developer readable string
+        :rtype: str
+        """
+
+        return f"{self.__class__.__qualname__!s}(<{len(self)!s} versions>)"
+
+    def __len__(self) -> int:
+        """Get the number of versions in the array.
+
+        :return: The number of versions in the array
+        :rtype: int
+        """
+
+        return len(self.major)
+
+    def _encode_key(self, key: Key_T) -> Tuple[int, int, int, int]:
+        """Encode the given precedence key with the prerelease ranks of the array.
+
+        :param Tuple[Any, ...] key: The precedence key to encode
+        :return: A tuple of the major, minor, patch, and prerelease rank
+        :rtype: Tuple[int, int, int, int]
+        """
+
+        major, minor, patch, release, *identifiers = key
+        if release:
+            return (major, minor, patch, 2 * len(self.prereleases) + 2)
+
+        prerelease = tuple(identifiers)
+        position = bisect_left(self.prereleases, prerelease)
+        rank = 2 * position
+        if (
+            position < len(self.prereleases)
+            and self.prereleases[position] == prerelease
+        ):
+            rank += 1
+
+        return (major, minor, patch, rank)
+
+    def _contains_cuts(self, lower: Cut_T, upper: Cut_T) -> "numpy.ndarray":
+        """Build the mask of versions between the given lower and upper cuts.
+
+        :param Tuple[Tuple[Any, ...], int] lower: The lower cut of the interval
+        :param Tuple[Tuple[Any, ...], int] upper: The upper cut of the interval
+        :return: A boolean mask of the versions within the cuts
+        :rtype: numpy.ndarray
+        """
+
+        columns = (self.major, self.minor, self.patch, self.prerelease)
+        mask: "numpy.ndarray" = numpy.ones(len(self), dtype=bool)
+        if lower != MIN_CUT:
+            lower_key, lower_flag = lower
+            mask &= _compare_bound(
+                columns, self._encode_key(lower_key), True, not lower_flag
+            )
+        if upper != MAX_CUT:
+            upper_key, upper_flag = upper
+            mask &= _compare_bound(
+                columns, self._encode_key(upper_key), False, bool(upper_flag)
+            )
+
+        return mask
+
+    def contains(self, selector: VersionSelector) -> "numpy.ndarray":
+        """Build the mask of versions which satisfy the given selector.
+
+        :param VersionSelector selector: The selector to check
+        :return: A boolean mask of the versions satisfying any of the selector's
+            clauses
+        :rtype: numpy.ndarray
+        """
+
+        mask: "numpy.ndarray" = numpy.zeros(len(self), dtype=bool)
+        for interval in selector.intervals:
+            if not interval.is_empty:
+                mask |= self._contains_cuts(interval.lower, interval.upper)
+
+        return mask
+
+
+def contains(
+    selector: VersionSelector, versions: Iterable[Union[str, PartialVersion]]
+) -> "numpy.ndarray":
+    """Build the mask of the given versions which satisfy the given selector.
+
+    :param VersionSelector selector: The selector to check
+    :param Iterable[Union[str, PartialVersion]] versions: The versions (or version
+        strings) to check, or an already encoded :class:`~VersionArray`
+    :return: A boolean mask of the versions satisfying the selector
+    :rtype: numpy.ndarray
+    """
+
+    array = (
+        versions
+        if isinstance(versions, VersionArray)
+        else VersionArray.from_versions(versions)
+    )
+    return array.contains(selector)
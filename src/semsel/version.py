@@ -5,11 +5,24 @@
 """Contains version management constants and classes."""
 
 import re
-from typing import Any, Dict, List, Type, Tuple, Union, Optional
+from typing import (
+    Any,
+    Dict,
+    List,
+    Type,
+    Tuple,
+    Union,
+    Hashable,
+    Iterable,
+    Optional,
+    cast,
+)
+from weakref import WeakValueDictionary
+from functools import lru_cache
 
 import attr
 
-from .utils import cmp
+from .utils import cmp, cache_attribute, cached_slot_property
 
 MAJOR_PATTERN = r"(?P<major>0|[1-9][0-9]*)"
 MINOR_PATTERN = r"(?P<minor>0|[1-9][0-9]*)"
@@ -35,17 +48,164 @@ PARTIAL_VERSION_PATTERN = (
 
 VersionTuple_T = Tuple[int, int, int, Optional[str], Optional[str]]
 VersionDict_T = Dict[str, Union[int, Optional[str]]]
+SortKey_T = Tuple[Any, ...]
+
+_NUMERIC_PATTERN = re.compile(r"[0-9]+")
+_DIGITS = "0123456789"
+
+# NOTE: prerelease tags (such as ``rc.1`` or ``beta.12``) repeat heavily across the
+# versions of a registry, so only the keys of the most recently used tags are kept
+PRERELEASE_CACHE_SIZE = 1024
+
+# NOTE: versions are commonly compared against the same string literals in hot loops,
+# so the most recently parsed version strings are kept alongside their versions
+VERSION_CACHE_SIZE = 4096
+
+# NOTE: releases are packed into a single integer as ``major << 42 | minor << 21 |
+# patch`` with 21 bits for each version number, so packed keys always fit in a signed
+# 64-bit integer and are ordered the same as the releases they are packed from
+PACKED_FIELD_BITS = 21
+PACKED_FIELD_LIMIT = 1 << PACKED_FIELD_BITS
+PACKED_LIMIT = 1 << (3 * PACKED_FIELD_BITS)
+
+# NOTE: interned versions are only kept alive for as long as something else references
+# them, so the table never grows beyond the versions that are actually in use
+_INTERNED_VERSIONS: "WeakValueDictionary[Tuple[Any, ...], PartialVersion]" = (
+    WeakValueDictionary()
+)
+
+
+@lru_cache(maxsize=PRERELEASE_CACHE_SIZE)
+def _prerelease_key(prerelease: str) -> SortKey_T:
+    """Get the Semver precedence key of the given prerelease text.
+
+    Each dot separated prerelease identifier is keyed as ``(0, int)`` if numeric or
+    ``(1, str)`` otherwise. This orders numeric identifiers before alphanumeric
+    identifiers, and fewer identifiers before more identifiers.
+
+    .. note:: Keys are cached by their prerelease text and shared between every
+        caller, which is safe as the returned keys are immutable.
 
+    :param str prerelease: The prerelease text to get the key of
+    :return: The precedence key of the given prerelease
+    :rtype: Tuple[Any, ...]
+    """
 
-@attr.s(eq=False, order=False)
+    return tuple(
+        (
+            (0, int(identifier))
+            if _NUMERIC_PATTERN.fullmatch(identifier)
+            else (1, identifier)
+        )
+        for identifier in prerelease.split(".")
+    )
+
+
+def _pack_release(major: int, minor: int, patch: int) -> int:
+    """Pack the given release version numbers into a single integer.
+
+    .. note:: The version numbers are not checked, each of them must be less than
+        :data:`PACKED_FIELD_LIMIT` for the packed integer to be a valid packed key.
+
+    :param int major: The major version number
+    :param int minor: The minor version number
+    :param int patch: The patch version number
+    :return: The packed integer of the version numbers
+    :rtype: int
+    """
+
+    return (major << (2 * PACKED_FIELD_BITS)) | (minor << PACKED_FIELD_BITS) | patch
+
+
+def _plain_version_fields(
+    version: str,
+) -> Optional[Tuple[int, Optional[int], Optional[int]]]:
+    """Get the version numbers of a plain ``X``, ``X.Y``, or ``X.Y.Z`` version string.
+
+    :param str version: The version string to get the version numbers of
+    :return: The major, minor, and patch numbers of the version string (missing
+        numbers are None), or None if the string is not a plain version string (and
+        must be matched by the full version pattern)
+    :rtype: Optional[Tuple[int, Optional[int], Optional[int]]]
+    """
+
+    parts = version.split(".", 3)
+    if len(parts) > 3:
+        return None
+
+    for part in parts:
+        # NOTE: only ASCII digits are valid, :meth:`str.isdigit` would also accept
+        # other unicode digits that :func:`int` happily converts
+        if not part or part.lstrip(_DIGITS) or (part[0] == "0" and len(part) > 1):
+            return None
+
+    numbers = [int(part) for part in parts]
+    return (
+        numbers[0],
+        numbers[1] if len(numbers) > 1 else None,
+        numbers[2] if len(numbers) > 2 else None,
+    )
+
+
+@lru_cache(maxsize=VERSION_CACHE_SIZE)
+def _parse_version(
+    version_class: Type["PartialVersion"], version: str
+) -> "PartialVersion":
+    """Parse the given version string into an interned version of the given class.
+
+    :param Type[PartialVersion] version_class: The class of the version to build
+    :param str version: The version string to parse
+    :raises ValueError: If the given string is not a valid partial semantic version
+    :return: The shared version instance
+    :rtype: PartialVersion
+    """
+
+    fields = _plain_version_fields(version)
+    if fields is not None:
+        return version_class.intern(*fields)
+
+    match = version_class._pattern.fullmatch(version)
+    if not match:
+        raise ValueError(f"{version!r} is not a valid partial semantic version")
+
+    major, minor, patch, prerelease, build = match.groups()
+    return version_class.intern(
+        int(major),
+        int(minor) if minor else None,
+        int(patch) if patch else None,
+        prerelease,
+        build,
+    )
+
+
+@attr.s(eq=False, order=False, frozen=True, slots=True)
 class PartialVersion:
-    """Describes a partial Semver version that can be compared with eachother."""
+    """Describes a partial Semver version that can be compared with eachother.
+
+    .. note:: Partial versions are immutable so they can be safely shared between
+        multiple selectors (such as the selectors cached by a
+        :class:`~.parser.SemselParser`). Use :func:`attr.evolve` to build a modified
+        copy of a version instead. Identical versions built by the parsers (and by
+        :meth:`~PartialVersion.from_string`) are shared through
+        :meth:`~PartialVersion.intern`.
+
+        Versions are hashed consistently with their semantic equality, so versions
+        which compare equal (such as ``1.2`` and ``1.2.0+build.1``) are the same
+        dictionary key. Versions are only ever equal to (and ordered against) other
+        versions, use :meth:`~PartialVersion.compare` to compare a version against
+        version data (such as ``"1.0.0"``).
+
+        Versions are slotted (without an instance ``__dict__``) to keep large numbers
+        of versions small in memory.
+    """
 
     major: int = attr.ib()
-    minor: int = attr.ib(default=None)
-    patch: int = attr.ib(default=None)
+    minor: Optional[int] = attr.ib(default=None)
+    patch: Optional[int] = attr.ib(default=None)
     prerelease: Optional[str] = attr.ib(default=None)
     build: Optional[str] = attr.ib(default=None)
+    _sort_key: Optional[SortKey_T] = cache_attribute()
+    _packed_key: Optional[int] = cache_attribute()
 
     _pattern = re.compile(PARTIAL_VERSION_PATTERN)
 
@@ -71,12 +231,28 @@ class PartialVersion:
     def __eq__(self, other: Any) -> bool:
         """Compare equality between versions.
 
+        .. note:: Only other versions can be equal to the version, version data (such
+            as the string ``"1.0.0"``) is never coerced so equality stays consistent
+            with the version's hash.
+
         :param Any other: The partial version to compare equality with
         :return: True if equal, otherwise False
         :rtype: bool
         """
 
-        return self.compare(other) == 0
+        if not isinstance(other, PartialVersion):
+            return NotImplemented
+
+        return self.sort_key == other.sort_key
+
+    def __hash__(self) -> int:
+        """Hash the version consistently with its semantic equality.
+
+        :return: The hash of the version's sort key
+        :rtype: int
+        """
+
+        return hash(self.sort_key)
 
     def __ne__(self, other: Any) -> bool:
         """Compare inequality between versions.
@@ -86,7 +262,10 @@ class PartialVersion:
         :rtype: bool
         """
 
-        return self.compare(other) != 0
+        if not isinstance(other, PartialVersion):
+            return NotImplemented
+
+        return self.sort_key != other.sort_key
 
     def __lt__(self, other: "PartialVersion") -> bool:
         """Compare if a given version is less than the current version.
@@ -97,7 +276,10 @@ class PartialVersion:
         :rtype: bool
         """
 
-        return self.compare(other) < 0
+        if not isinstance(other, PartialVersion):
+            return NotImplemented
+
+        return self.sort_key < other.sort_key
 
     def __le__(self, other: "PartialVersion") -> bool:
         """Compare if a given version is less than or equal to the version.
@@ -108,7 +290,10 @@ class PartialVersion:
         :rtype: bool
         """
 
-        return self.compare(other) <= 0
+        if not isinstance(other, PartialVersion):
+            return NotImplemented
+
+        return self.sort_key <= other.sort_key
 
     def __gt__(self, other: "PartialVersion") -> bool:
         """Compare if a given version is greather than the version.
@@ -119,7 +304,10 @@ class PartialVersion:
         :rtype: bool
         """
 
-        return self.compare(other) > 0
+        if not isinstance(other, PartialVersion):
+            return NotImplemented
+
+        return self.sort_key > other.sort_key
 
     def __ge__(self, other: "PartialVersion") -> bool:
         """Compare if a given version is greater than or equal to the current version.
@@ -130,7 +318,10 @@ class PartialVersion:
         :rtype: bool
         """
 
-        return self.compare(other) >= 0
+        if not isinstance(other, PartialVersion):
+            return NotImplemented
+
+        return self.sort_key >= other.sort_key
 
     def __major__(self, other: "PartialVersion") -> bool:
         """Compare if a given version is within the major bounds of the current version.
@@ -154,6 +345,54 @@ class PartialVersion:
 
         return other.major == self.major and (other.minor or 0) <= (self.minor or 0)
 
+    @cached_slot_property
+    def sort_key(self) -> SortKey_T:
+        """The Semver precedence key of the version.
+
+        Releases are keyed as ``(major, minor, patch, 1)`` while prereleases are keyed
+        as ``(major, minor, patch, 0, *identifiers)`` where each dot separated
+        prerelease identifier is keyed as ``(0, int)`` if numeric or ``(1, str)``
+        otherwise. Missing minor and patch versions are filled with zeros and build
+        metadata is ignored, so versions are ordered by plain tuple comparison of
+        their keys.
+
+        .. note:: The key is only computed once, the first time it is requested.
+        """
+
+        if not self.prerelease:
+            return (self.major, self.minor or 0, self.patch or 0, 1)
+
+        return (
+            self.major,
+            self.minor or 0,
+            self.patch or 0,
+            0,
+            *_prerelease_key(self.prerelease),
+        )
+
+    @cached_slot_property
+    def packed_key(self) -> int:
+        """The packed integer key of the version, or -1 if it can't be packed.
+
+        Releases whose version numbers each fit in :data:`PACKED_FIELD_BITS` bits are
+        keyed by the integer built by :meth:`~PartialVersion.to_packed`. Prereleases
+        and larger releases can't be packed and are keyed as -1, so they must be
+        compared by their :attr:`~PartialVersion.sort_key` instead.
+
+        .. note:: The key is only computed once, the first time it is requested.
+        """
+
+        minor, patch = self.minor or 0, self.patch or 0
+        if (
+            self.prerelease
+            or self.major >= PACKED_FIELD_LIMIT
+            or minor >= PACKED_FIELD_LIMIT
+            or patch >= PACKED_FIELD_LIMIT
+        ):
+            return -1
+
+        return _pack_release(self.major, minor, patch)
+
     @staticmethod
     def prerelease_compare(source: Optional[str], target: Optional[str]) -> int:
         """Compare a prerelease string against another prerelease string.
@@ -169,39 +408,49 @@ class PartialVersion:
         :rtype: int
         """
 
-        def cast_fragment(fragment_value: str) -> Union[int, str]:
-            return (
-                int(fragment_value)
-                if re.match(r"^[0-9]+$", fragment_value)
-                else fragment_value
+        return cmp(_prerelease_key(source or ""), _prerelease_key(target or ""))
+
+    @classmethod
+    def intern(
+        cls,
+        major: int,
+        minor: Optional[int] = None,
+        patch: Optional[int] = None,
+        prerelease: Optional[str] = None,
+        build: Optional[str] = None,
+    ) -> "PartialVersion":
+        """Get the shared partial version instance for the given version data.
+
+        Interned versions are kept in a weak-value table keyed on the version data, so
+        an identical version is only built once for as long as it is still in use.
+
+        >>> PartialVersion.intern(1, 2) is PartialVersion.intern(1, 2)
+            True
+
+        :param int major: The major version number
+        :param Optional[int] minor: The minor version number, defaults to None
+        :param Optional[int] patch: The patch version number, defaults to None
+        :param Optional[str] prerelease: The prerelease text, defaults to None
+        :param Optional[str] build: The build text, defaults to None
+        :return: The shared PartialVersion instance
+        :rtype: PartialVersion
+        """
+
+        key = (cls, major, minor, patch, prerelease, build)
+        version = _INTERNED_VERSIONS.get(key)
+        if version is None:
+            version = _INTERNED_VERSIONS.setdefault(
+                key,
+                cls(
+                    major=major,
+                    minor=minor,
+                    patch=patch,
+                    prerelease=prerelease,
+                    build=build,
+                ),
             )
 
-        def get_fragments(value: str) -> List[Union[int, str]]:
-            return [cast_fragment(fragment) for fragment in value.split(".")]
-
-        def compare_part(
-            source: Optional[Union[int, str]], target: Optional[Union[int, str]]
-        ) -> int:
-            if isinstance(source, int) and isinstance(target, int):
-                return cmp(source, target)
-            elif isinstance(source, int):
-                return -1
-            elif isinstance(target, int):
-                return 1
-            else:
-                return cmp(source, target)
-
-        source, target = source or "", target or ""
-        source_fragments, target_fragments = (
-            get_fragments(source),
-            get_fragments(target),
-        )
-        for source_part, target_part in zip(source_fragments, target_fragments):
-            part_comparision = compare_part(source_part, target_part)
-            if part_comparision != 0:
-                return part_comparision
-        else:
-            return cmp(len(source), len(target))
+        return version
 
     @classmethod
     def from_dict(cls, version_dict: VersionDict_T) -> "PartialVersion":
@@ -220,27 +469,44 @@ class PartialVersion:
 
     @classmethod
     def from_string(cls, version: str) -> "PartialVersion":
-        """Build a new partial version from a string.
+        """Build a partial version from a string.
+
+        .. note:: The built version is interned, see :meth:`~PartialVersion.intern`.
+            Plain ``X``, ``X.Y``, and ``X.Y.Z`` strings skip the version pattern and
+            the most recently parsed strings are cached, so parsing the same string
+            again is a single lookup.
 
         :param str version: The version string to build a partial version instance from
         :raises ValueError: If the given string is not a valid partial semantic version
-        :return: A new PartialVersion instance
+        :return: The shared PartialVersion instance
         :rtype: PartialVersion
         """
 
-        match = cls._pattern.fullmatch(version)
-        if not match:
-            raise ValueError(f"{version!r} is not a valid partial semantic version")
-
-        return cls.from_dict(
-            {
-                key: (
-                    int(value)
-                    if value and key in ("major", "minor", "patch",)
-                    else value
-                )
-                for key, value in match.groupdict().items()
-            }
+        # NOTE: version classes are hashable, but mypy checks the unbound instance
+        # __hash__ of the class when checking the arguments of the cached function
+        return _parse_version(cast(Hashable, cls), version)
+
+    @classmethod
+    def from_packed(cls, packed: int) -> "PartialVersion":
+        """Build a release from its packed integer key.
+
+        .. note:: The built version is interned, see :meth:`~PartialVersion.intern`.
+            This is the inverse of the available :meth:`~PartialVersion.to_packed`
+            method.
+
+        :param int packed: The packed integer key of the release
+        :raises ValueError: If the given integer is not a valid packed key
+        :return: The shared PartialVersion instance
+        :rtype: PartialVersion
+        """
+
+        if not isinstance(packed, int) or not 0 <= packed < PACKED_LIMIT:
+            raise ValueError(f"{packed!r} is not a valid packed version key")
+
+        return cls.intern(
+            packed >> (2 * PACKED_FIELD_BITS),
+            (packed >> PACKED_FIELD_BITS) & (PACKED_FIELD_LIMIT - 1),
+            packed & (PACKED_FIELD_LIMIT - 1),
         )
 
     @classmethod
@@ -270,6 +536,32 @@ class PartialVersion:
             major=major, minor=minor, patch=patch, prerelease=prerelease, build=build
         )
 
+    def _coerce(
+        self, version: Union[str, VersionDict_T, VersionTuple_T, "PartialVersion"]
+    ) -> "PartialVersion":
+        """Get the partial version of the given version data.
+
+        :param Union[str, VersionDict_T, VersionTuple_T, PartialVersion] version:
+            Version data or :class:`~PartialVersion` instance to coerce
+        :raises TypeError: If the given version parameter can not be handled
+        :return: The given version as a PartialVersion instance
+        :rtype: PartialVersion
+        """
+
+        if isinstance(version, PartialVersion):
+            return version
+        elif isinstance(version, str):
+            return self.from_string(version)
+        elif isinstance(version, dict):
+            return self.from_dict(version)
+        elif isinstance(version, (tuple, list,)):
+            return self.from_tuple(version)
+
+        raise TypeError(
+            f"Expected str or {self.__class__.__qualname__!s} instance, "
+            f"but got {type(version)!s}"
+        )
+
     def compare(
         self, version: Union[str, VersionDict_T, VersionTuple_T, "PartialVersion"]
     ) -> int:
@@ -283,41 +575,33 @@ class PartialVersion:
         :rtype: int
         """
 
-        other: Optional["PartialVersion"] = None
-        if isinstance(version, type(self)):
-            other = version
-        elif isinstance(version, str):
-            other = self.from_string(version)
-        elif isinstance(version, dict):
-            other = self.from_dict(version)
-        elif isinstance(version, (tuple, list,)):
-            other = self.from_tuple(version)
-        else:
-            raise TypeError(
-                f"Expected str or {self.__class__.__qualname__!s} instance, "
-                f"but got {type(version)!s}"
-            )
+        return cmp(self.sort_key, self._coerce(version).sort_key)
 
-        source = self.to_tuple()[:3]
-        target = other.to_tuple()[:3]
+    def to_packed(self) -> int:
+        """Produce the packed integer key of the current release.
 
-        comparision = cmp(source, target)
-        if comparision:
-            return comparision
+        Releases are packed as ``major << 42 | minor << 21 | patch`` (see
+        :data:`PACKED_FIELD_BITS`) so the packed keys of releases are ordered the same
+        as the releases themselves. Missing minor and patch versions are packed as
+        zeros and build metadata is dropped.
 
-        source_prerelease, target_prerelease = self.prerelease, other.prerelease
-        prerelease_comparison = PartialVersion.prerelease_compare(
-            source_prerelease, target_prerelease
-        )
+        >>> PartialVersion(1, 2, 3).to_packed()
+            4398050705411
 
-        if not prerelease_comparison:
-            return 0
-        if not source_prerelease:
-            return 1
-        if not target_prerelease:
-            return -1
+        :raises ValueError: If the version is a prerelease or any of its version
+            numbers don't fit in the packed key
+        :return: The packed integer key of the release
+        :rtype: int
+        """
+
+        packed = self.packed_key
+        if packed < 0:
+            raise ValueError(
+                f"Version {self!s} can't be packed, only releases with version "
+                f"numbers less than {PACKED_FIELD_LIMIT!s} can be packed"
+            )
 
-        return prerelease_comparison
+        return packed
 
     def to_tuple(self) -> VersionTuple_T:
         """Produce a tuple of version data from the current partial version data.
@@ -347,7 +631,7 @@ class PartialVersion:
         :rtype: VersionDict_T
         """
 
-        return attr.asdict(self)
+        return attr.asdict(self, filter=lambda attribute, _: attribute.init)
 
     def to_semver(self) -> str:
         """Produce a valid Semver string from the current partial version data.
@@ -363,3 +647,41 @@ class PartialVersion:
             semver += f"+{self.build!s}"
 
         return semver
+
+
+def sort_versions(
+    versions: Iterable[Union[str, PartialVersion]], reverse: bool = False
+) -> List[Union[str, PartialVersion]]:
+    """Sort the given versions by their Semver precedence.
+
+    >>> from semsel import sort_versions
+    >>> sort_versions(["1.0.0", "1.0.0-rc.1", PartialVersion(0, 9)])
+        [PartialVersion(major=0, minor=9, ...), '1.0.0-rc.1', '1.0.0']
+
+    .. note:: Each version is only keyed once, versions of the same precedence keep
+        their given order. Lists of releases are sorted by their packed keys (see
+        :meth:`~PartialVersion.to_packed`) rather than their sort keys.
+
+    :param Iterable[Union[str, PartialVersion]] versions: The versions (or version
+        strings) to sort
+    :param bool reverse: True to sort the versions in descending precedence, defaults
+        to False
+    :raises ValueError: If a given string is not a valid partial semantic version
+    :return: A new list of the given versions sorted by precedence
+    :rtype: List[Union[str, PartialVersion]]
+    """
+
+    items = list(versions)
+    parsed = [
+        PartialVersion.from_string(version) if isinstance(version, str) else version
+        for version in items
+    ]
+
+    # NOTE: releases are sorted by their packed keys as plain integers compare faster
+    # than tuples, all versions fall back to sort keys if any of them can't be packed
+    keys: List[Any] = [version.packed_key for version in parsed]
+    if keys and min(keys) < 0:
+        keys = [version.sort_key for version in parsed]
+
+    order = sorted(range(len(items)), key=keys.__getitem__, reverse=reverse)
+    return [items[index] for index in order]
@@ -14,6 +14,7 @@ from hypothesis.strategies import (
     text,
     lists,
     one_of,
+    booleans,
     integers,
     composite,
     from_regex,
@@ -129,6 +130,30 @@ def partial_version(
     )
 
 
+@composite
+def small_version(
+    draw, max_number: int = 3, prereleases: Optional[List[str]] = None
+) -> PartialVersion:
+    """Composite strategy for building a :class:`semsel.version.PartialVersion` from a
+    small pool of close versions.
+    """
+
+    return draw(
+        partial_version(
+            major_strategy=integers(min_value=0, max_value=max_number),
+            minor_strategy=one_of(none(), integers(min_value=0, max_value=max_number)),
+            patch_strategy=one_of(none(), integers(min_value=0, max_value=2)),
+            prerelease_strategy=one_of(
+                none(),
+                sampled_from(
+                    ["0", "alpha", "alpha.0"] if not prereleases else prereleases
+                ),
+            ),
+            build_strategy=none(),
+        )
+    )
+
+
 @composite
 def lark_version_tree(draw, *args, **kwargs) -> Tree:
     """Composite strategy for building a :class:`lark.Tree` for a parital version"""
@@ -217,3 +242,50 @@ def version_selector(
         ),
         validate=False,
     )
+
+
+@composite
+def selector_expression(
+    draw, selector_strategy: Optional[SearchStrategy[VersionSelector]] = None
+) -> str:
+    """Composite strategy for building a selector string with optional whitespace."""
+
+    selector = draw(version_selector() if not selector_strategy else selector_strategy)
+    clauses = []
+    for clause in selector.clauses:
+        expressions = []
+        for expression in clause:
+            if isinstance(expression, VersionRange):
+                expressions.append(str(expression))
+                continue
+
+            operator = expression.operator.value
+            if expression.operator == ConditionOperator.EQ and draw(booleans()):
+                operator = ""
+            spacing = " " if draw(booleans()) else ""
+            expressions.append(f"{operator!s}{spacing!s}{expression.version!s}")
+
+        clauses.append(" ".join(expressions))
+
+    expression = clauses[0]
+    for clause in clauses[1:]:
+        expression += draw(sampled_from(["||", " ||", "|| ", " || "])) + clause
+
+    return expression
+
+
+@composite
+def mutated_selector_expression(
+    draw, expression_strategy: Optional[SearchStrategy[str]] = None
+) -> str:
+    """Composite strategy for building a (likely invalid) mutated selector string."""
+
+    expression = draw(
+        selector_expression() if not expression_strategy else expression_strategy
+    )
+    index = draw(integers(min_value=0, max_value=len(expression)))
+    return (
+        expression[:index]
+        + draw(text(alphabet="0123456789.-+ |<>=^~aZ", max_size=2))
+        + expression[index + draw(integers(min_value=0, max_value=2)) :]
+    )
@@ -0,0 +1,282 @@
+# -*- encoding: utf-8 -*-
+# Copyright (c) 2020 Modist Team <admin@modist.io>
+# ISC License <https://choosealicense.com/licenses/isc>
+
+"""Contains unit tests for the VersionIndex class."""
+
+import math
+from typing import List, Tuple, Optional
+
+import pytest
+from hypothesis import given
+from hypothesis.strategies import (
+    none,
+    lists,
+    one_of,
+    tuples,
+    integers,
+    sampled_from,
+)
+
+from semsel.index import VersionIndex, SelectorIndex, _SelectorNode
+from semsel.parser import SemselParser
+from semsel.version import PartialVersion
+from semsel.interval import _version_key
+
+from .strategies import partial_version
+
+PARSER = SemselParser(engine="native")
+SELECTORS = [
+    "^1.2",
+    "~0.3",
+    ">=1.0.0-alpha <1.0.0",
+    ">=1 <2 || >=1.5 <3 || ^5",
+    "1.0.0 - 1.2.0 || 4",
+    ">2 <1",
+]
+VERSIONS = [
+    "0.3.0",
+    "0.3.9",
+    "0.4.0-rc.1",
+    "1.0.0-alpha",
+    "1.0.0-beta.2",
+    "1.0.0-beta.11",
+    "1.0.0",
+    "1.2.0",
+    "1.2.0+build",
+    "1.9.9",
+    "2.0.0-rc.1",
+    "2.5.0",
+    "4.0.0",
+    "5.1.0",
+]
+
+
+def indexed_version():
+    """Strategy for building partial versions with a few distinct prereleases."""
+
+    return partial_version(
+        prerelease_strategy=one_of(
+            none(), sampled_from(["0", "alpha", "alpha.1", "beta.11", "rc.1"])
+        ),
+        build_strategy=one_of(none(), sampled_from(["a", "b"])),
+    )
+
+
+def test_from_versions_sorts_by_precedence():
+    """Ensure the index keeps its versions sorted by precedence."""
+
+    index = VersionIndex.from_versions(reversed(VERSIONS))
+    assert len(index) == len(VERSIONS)
+    keys = [_version_key(version) for version in index]
+    assert keys == sorted(keys)
+    assert all(isinstance(version, PartialVersion) for version in index)
+
+
+@given(lists(indexed_version(), max_size=20))
+def test_add_matches_from_versions(versions: List[PartialVersion]):
+    """Ensure adding versions one at a time builds the same index as building it."""
+
+    index = VersionIndex()
+    for version in versions:
+        index.add(version)
+
+    assert list(index) == list(VersionIndex.from_versions(versions))
+
+
+@given(lists(indexed_version(), max_size=20))
+def test_add_between_queries_matches_from_versions(versions: List[PartialVersion]):
+    """Ensure versions added between queries are kept in the sorted versions."""
+
+    index = VersionIndex()
+    selector = PARSER.parse(">=1 <2", validate=False)
+    for position, version in enumerate(versions, start=1):
+        index.add(version)
+        assert version in index
+        assert len(index) == position
+        assert list(index.select(selector)) == list(selector.filter(index))
+
+    assert list(index) == list(VersionIndex.from_versions(versions))
+
+
+@given(
+    lists(indexed_version(), min_size=16, max_size=40),
+    lists(lists(indexed_version(), max_size=4), max_size=5),
+)
+def test_update_in_small_batches_matches_from_versions(
+    versions: List[PartialVersion], batches: List[List[PartialVersion]]
+):
+    """Ensure batches inserted one version at a time match sorting the versions."""
+
+    index = VersionIndex.from_versions(versions)
+    for batch in batches:
+        index.update(batch)
+        versions = versions + batch
+
+    assert list(index) == list(VersionIndex.from_versions(versions))
+
+
+def test_add_keeps_equal_precedence_in_order():
+    """Ensure versions of the same precedence are kept in the order they were added."""
+
+    index = VersionIndex.from_versions(["1.0.0+b", "2.0.0"])
+    index.add("1.0.0+a")
+    assert [str(version) for version in index] == ["1.0.0+b", "1.0.0+a", "2.0.0"]
+
+    index.add("1.0.0+c")
+    assert [str(version) for version in index][:3] == ["1.0.0+b", "1.0.0+a", "1.0.0+c"]
+
+
+def test_contains_and_remove():
+    """Ensure versions can be checked for and removed from the index."""
+
+    index = VersionIndex.from_versions(VERSIONS)
+    assert "1.2" in index
+    assert "1.3.0" not in index
+
+    index.remove("1.2.0")
+    assert len(index) == len(VERSIONS) - 1
+    assert "1.2.0" in index
+
+    index.remove("1.2.0")
+    assert "1.2.0" not in index
+    with pytest.raises(ValueError):
+        index.remove("1.2.0")
+
+
+@pytest.mark.parametrize("content", SELECTORS)
+def test_select_matches_filter(content: str):
+    """Ensure selecting from the index matches filtering the versions."""
+
+    selector = PARSER.parse(content, validate=False)
+    index = VersionIndex.from_versions(VERSIONS)
+    expected = sorted(
+        selector.filter(PartialVersion.from_string(version) for version in VERSIONS),
+        key=_version_key,
+    )
+
+    assert list(index.select(selector)) == expected
+    assert index.count(selector) == len(expected)
+
+
+@pytest.mark.parametrize("content", SELECTORS)
+def test_max_min_satisfying_matches_selector(content: str):
+    """Ensure the index finds the same bounding versions as the selector."""
+
+    selector = PARSER.parse(content, validate=False)
+    index = VersionIndex.from_versions(VERSIONS)
+
+    for method in ("max_satisfying", "min_satisfying"):
+        expected = getattr(selector, method)(VERSIONS)
+        result = getattr(index, method)(selector)
+        if expected is None:
+            assert result is None
+        else:
+            assert _version_key(result) == _version_key(expected)
+
+
+@given(lists(indexed_version(), max_size=20), partial_version())
+def test_select_caret_matches_contains(
+    versions: List[PartialVersion], version: PartialVersion
+):
+    """Ensure selecting arbitrary versions agrees with the selector containment."""
+
+    selector = PARSER.parse(f"^{version.major!s} || <{version!s}", validate=False)
+    index = VersionIndex.from_versions(versions)
+    selected = list(index.select(selector))
+
+    assert len(selected) == len([item for item in versions if item in selector])
+    assert all(item in selector for item in selected)
+
+
+def test_empty_index():
+    """Ensure an empty index never selects any versions."""
+
+    index = VersionIndex()
+    selector = PARSER.parse(">=0", validate=False)
+    assert list(index.select(selector)) == []
+    assert index.max_satisfying(selector) is None
+    assert index.min_satisfying(selector) is None
+
+
+def selector_pool():
+    """Strategy for building parsed selectors from a small pool of expressions."""
+
+    return sampled_from(SELECTORS + ["<1 || >=3", ">=0.0.0-0", "=1.0.0-alpha", "^0"])
+
+
+@given(
+    lists(tuples(integers(min_value=0, max_value=20), selector_pool()), max_size=30),
+    lists(integers(min_value=0, max_value=20), max_size=10),
+    indexed_version(),
+)
+def test_selector_index_matches_contains(
+    additions: List[Tuple[int, str]], removals: List[int], version: PartialVersion
+):
+    """Ensure the selector index finds exactly the selectors containing a version."""
+
+    index = SelectorIndex()
+    expected = {}
+    for key, content in additions:
+        selector = PARSER.parse(content, validate=False)
+        index.add(key, selector)
+        expected[key] = selector
+    for key in removals:
+        if key in expected:
+            index.remove(key)
+            del expected[key]
+
+    matched = index.matching(version)
+    assert len(matched) == len(set(matched))
+    assert set(matched) == {
+        key for key, selector in expected.items() if version in selector
+    }
+    assert len(index) == len(expected)
+
+    index.rebuild()
+    assert set(index.matching(version)) == set(matched)
+
+
+def test_selector_index_from_selectors():
+    """Ensure the selector index can be built from keyed selectors and queried."""
+
+    index = SelectorIndex.from_selectors(
+        (content, PARSER.parse(content, validate=False)) for content in SELECTORS
+    )
+    assert len(index) == len(SELECTORS)
+    assert "^1.2" in index
+    assert str(index["^1.2"]) == "^1.2"
+    assert sorted(index.matching("1.2.0+build")) == sorted(
+        ["^1.2", ">=1 <2 || >=1.5 <3 || ^5", "1.0.0 - 1.2.0 || 4"]
+    )
+    assert index.matching("9.0.0") == []
+
+    index.add("^1.2", PARSER.parse("^9", validate=False))
+    assert "^1.2" in index.matching("9.0.0")
+    assert "^1.2" not in index.matching("1.2.0")
+
+    with pytest.raises(KeyError):
+        index.remove("missing")
+
+
+def get_depth(node: Optional[_SelectorNode]) -> int:
+    """Get the number of nodes on the longest path down from a selector index node."""
+
+    if node is None:
+        return 0
+
+    return 1 + max(get_depth(node.left), get_depth(node.right))
+
+
+def test_selector_index_stays_balanced_for_sorted_additions():
+    """Ensure adding selectors in sorted order keeps the tree logarithmically deep."""
+
+    index = SelectorIndex()
+    for major in range(2000):
+        index.add(major, PARSER.parse(f">={major!s} <{major + 1!s}", validate=False))
+        if major % 3 == 0:
+            index.remove(major)
+
+    assert get_depth(index._root) <= 3 * math.log2(2000)
+    assert index.matching("1234.5.6") == [1234]
+    assert index.matching("1233.0.0") == []
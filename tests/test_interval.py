@@ -0,0 +1,268 @@
+# -*- encoding: utf-8 -*-
+# Copyright (c) 2020 Modist Team <admin@modist.io>
+# ISC License <https://choosealicense.com/licenses/isc>
+
+"""Contains unit tests for the VersionInterval class and precedence keys."""
+
+import pytest
+from hypothesis import given
+from hypothesis.strategies import none, one_of, booleans, sampled_from
+
+from semsel.version import PACKED_FIELD_LIMIT, PartialVersion
+from semsel.interval import (
+    MAX_CUT,
+    MIN_CUT,
+    VersionInterval,
+    _format_key,
+    _key_version,
+    _version_key,
+    _successor_key,
+    _predecessor_key,
+    _union_intervals,
+    _complement_intervals,
+    _intersect_intervals,
+)
+
+from .strategies import partial_version
+
+SEMVER_PRECEDENCE = [
+    "1.0.0-alpha",
+    "1.0.0-alpha.1",
+    "1.0.0-alpha.beta",
+    "1.0.0-beta",
+    "1.0.0-beta.2",
+    "1.0.0-beta.11",
+    "1.0.0-rc.1",
+    "1.0.0",
+    "1.0.1-0",
+    "1.0.1",
+    "2.0.0",
+]
+
+
+def packed_edge_version():
+    """Strategy for building versions around the limits of the packed encoding."""
+
+    edges = sampled_from([0, 1, PACKED_FIELD_LIMIT - 1, PACKED_FIELD_LIMIT])
+    return partial_version(
+        major_strategy=edges,
+        minor_strategy=edges,
+        patch_strategy=edges,
+        prerelease_strategy=one_of(none(), sampled_from(["0", "rc.1"])),
+        build_strategy=none(),
+    )
+
+
+def test_version_key_follows_semver_precedence():
+    """
+    Ensures precedence keys order versions as described by the Semver specification.
+    """
+
+    keys = [_version_key(version) for version in SEMVER_PRECEDENCE]
+    assert keys == sorted(keys)
+    assert len(set(keys)) == len(keys)
+
+
+@given(
+    partial_version(prerelease_strategy=none()),
+    partial_version(prerelease_strategy=none()),
+)
+def test_version_key_matches_release_comparison(
+    source: PartialVersion, target: PartialVersion
+):
+    """
+    Ensures precedence keys of releases compare the same way as the versions do.
+    """
+
+    source_key, target_key = _version_key(source), _version_key(target)
+    assert source.compare(target) == (source_key > target_key) - (
+        source_key < target_key
+    )
+
+
+@given(partial_version())
+def test_version_key_ignores_build_and_fills_zeros(version: PartialVersion):
+    """
+    Ensures precedence keys ignore build metadata and zero-fill partial versions.
+    """
+
+    assert _version_key(version) == _version_key(version.to_semver().split("+")[0])
+    assert _format_key(_version_key(version)) == version.to_semver().split("+")[0]
+
+
+@pytest.mark.parametrize(
+    "start_inclusive, end_inclusive, expected",
+    [
+        (True, True, [False, True, True, True, False]),
+        (False, True, [False, False, True, True, False]),
+        (True, False, [False, True, True, False, False]),
+        (False, False, [False, False, True, False, False]),
+    ],
+)
+def test_interval_contains_respects_inclusivity(
+    start_inclusive: bool, end_inclusive: bool, expected: list
+):
+    """
+    Ensures intervals include or exclude their bounding versions as requested.
+    """
+
+    interval = VersionInterval.from_bounds(
+        "1.0.0",
+        "2.0.0",
+        start_inclusive=start_inclusive,
+        end_inclusive=end_inclusive,
+    )
+    assert [
+        version in interval
+        for version in ("0.9.9", "1.0.0", "1.5.0", "2.0.0", "2.0.1")
+    ] == expected
+
+
+def test_interval_defaults_to_all_versions():
+    """
+    Ensures an interval without bounds contains every version.
+    """
+
+    interval = VersionInterval()
+    assert (interval.lower, interval.upper) == (MIN_CUT, MAX_CUT)
+    assert "0.0.0-0" in interval
+    assert PartialVersion(999999, 1, 2) in interval
+    assert str(interval) == "(-inf, inf)"
+
+
+def test_interval_intersection():
+    """
+    Ensures intersecting intervals keeps the tightest bounds and detects emptiness.
+    """
+
+    first = VersionInterval.from_bounds("1.0.0", "2.0.0", end_inclusive=False)
+    second = VersionInterval.from_bounds("1.5.0", start_inclusive=False)
+
+    assert str(first & second) == "(1.5.0, 2.0.0)"
+    assert not (first & second).is_empty
+    assert (first & VersionInterval.from_bounds("2.0.0")).is_empty
+    assert not (first & VersionInterval.from_bounds(end="1.0.0")).is_empty
+    assert str(first & VersionInterval.from_bounds(end="1.0.0")) == "[1.0.0, 1.0.0]"
+    assert str(first & VersionInterval.from_bounds("3.0.0")) == "{}"
+
+
+@pytest.mark.parametrize(
+    "key, successor",
+    [
+        ("1.0.0", "1.0.1-0"),
+        ("1.0.0-alpha", "1.0.0-alpha.0"),
+        ("1.0.0-0", "1.0.0-0.0"),
+    ],
+)
+def test_successor_and_predecessor_keys(key: str, successor: str):
+    """
+    Ensures successor keys directly follow their key and can be reversed.
+    """
+
+    assert _successor_key(_version_key(key)) == _version_key(successor)
+    assert _predecessor_key(_version_key(successor)) == _version_key(key)
+    assert _key_version(_version_key(key)) == PartialVersion.from_string(key)
+
+
+@pytest.mark.parametrize("key", ["1.0.0", "1.0.0-alpha", "1.0.0-0", "1.2.0-0"])
+def test_predecessor_key_is_only_defined_for_successors(key: str):
+    """
+    Ensures keys which are not the successor of another key have no predecessor.
+    """
+
+    assert _predecessor_key(_version_key(key)) is None
+
+
+@pytest.mark.parametrize(
+    "interval, expected",
+    [
+        (VersionInterval.from_bounds("1.0.0", "2.0.0"), "[1.0.0, 2.0.1-0)"),
+        (
+            VersionInterval.from_bounds("1.0.0", "2.0.0", start_inclusive=False),
+            "[1.0.1-0, 2.0.1-0)",
+        ),
+        (VersionInterval.from_bounds(end="0.0.0-0", end_inclusive=False), "{}"),
+        (VersionInterval.from_bounds("0.0.0-0"), "(-inf, inf)"),
+        (
+            VersionInterval.from_bounds(
+                "1.0.0", "1.0.1-0", start_inclusive=False, end_inclusive=False
+            ),
+            "{}",
+        ),
+    ],
+)
+def test_interval_normalize(interval: VersionInterval, expected: str):
+    """
+    Ensures normalized intervals only place cuts before keys.
+    """
+
+    normalized = interval.normalize()
+    assert str(normalized) == expected
+    assert normalized.lower[1] == 0
+    if normalized.is_empty:
+        assert (normalized.lower, normalized.upper) == (MIN_CUT, MIN_CUT)
+
+
+def test_interval_set_operations():
+    """
+    Ensures canonical interval sets are merged, intersected, and complemented.
+    """
+
+    intervals = _union_intervals(
+        [
+            VersionInterval.from_bounds("2.0.0", "3.0.0"),
+            VersionInterval.from_bounds("1.0.0", "1.5.0"),
+            VersionInterval.from_bounds("1.5.0", "1.8.0", start_inclusive=False),
+            VersionInterval.from_bounds("5.0.0", "4.0.0"),
+        ]
+    )
+    assert [str(interval) for interval in intervals] == [
+        "[1.0.0, 1.8.1-0)",
+        "[2.0.0, 3.0.1-0)",
+    ]
+    assert [str(interval) for interval in _complement_intervals(intervals)] == [
+        "(-inf, 1.0.0)",
+        "[1.8.1-0, 2.0.0)",
+        "[3.0.1-0, inf)",
+    ]
+    assert [
+        str(interval)
+        for interval in _intersect_intervals(
+            intervals, _union_intervals([VersionInterval.from_bounds("1.5.0", "2.5.0")])
+        )
+    ] == ["[1.5.0, 1.8.1-0)", "[2.0.0, 2.5.1-0)"]
+    assert _complement_intervals(()) == (VersionInterval(),)
+    assert _complement_intervals((VersionInterval(),)) == ()
+
+
+@given(
+    packed_edge_version(),
+    one_of(none(), packed_edge_version()),
+    one_of(none(), packed_edge_version()),
+    booleans(),
+    booleans(),
+)
+def test_packed_bounds_match_cuts(
+    version: PartialVersion,
+    start: PartialVersion,
+    end: PartialVersion,
+    start_inclusive: bool,
+    end_inclusive: bool,
+):
+    """
+    Ensures packed interval bounds contain the same releases as the interval's cuts.
+    """
+
+    interval = VersionInterval.from_bounds(start, end, start_inclusive, end_inclusive)
+    expected = interval.contains_key(version.sort_key)
+    assert (version in interval) == expected
+
+    lower, upper = interval.packed_bounds
+    if version.packed_key >= 0:
+        assert (lower <= version.packed_key < upper) == expected
+
+    normalized = interval.normalize()
+    if normalized.is_empty:
+        assert lower >= upper
+    else:
+        assert normalized.packed_bounds == interval.packed_bounds
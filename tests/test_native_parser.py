@@ -0,0 +1,135 @@
+# -*- encoding: utf-8 -*-
+# Copyright (c) 2020 Modist Team <admin@modist.io>
+# ISC License <https://choosealicense.com/licenses/isc>
+
+"""Contains unit tests for the SemselNativeParser."""
+
+import re
+from ast import literal_eval
+from typing import Any, Tuple
+
+import pytest
+from hypothesis import given
+
+from semsel.parser import SemselParser, ParserEngine, SemselNativeParser
+from semsel.exceptions import ParseFailure, InvalidExpression
+
+from .strategies import selector_expression, mutated_selector_expression
+
+REFERENCE_PARSER = SemselParser()
+NATIVE_PARSER = SemselParser(engine="native")
+
+
+def parse_outcome(parser: SemselParser, content: str) -> Tuple[Any, ...]:
+    """Parse the given content and produce a comparable description of the outcome.
+
+    .. note:: Expected terminals are reported as sets within failure messages so they
+        are sorted here to avoid depending on set ordering. Selectors are compared by
+        their expressions since selector equality is semantic (``1`` equals
+        ``1.0.0``).
+    """
+
+    try:
+        return ("selector", str(parser.parse(content, validate=False)))
+    except (ParseFailure, InvalidExpression) as exc:
+        return (
+            type(exc),
+            re.sub(
+                r"\{[^}]*\}",
+                lambda match: str(sorted(literal_eval(match.group(0)))),
+                str(exc),
+            ),
+        )
+
+
+def test_native_engine_uses_native_parser():
+    """
+    Ensures the ``SemselParser`` using the native engine parses with a
+    ``SemselNativeParser`` and still tokenizes with the reference grammar.
+    """
+
+    parser = SemselParser(engine="native")
+    assert parser.engine == ParserEngine.NATIVE
+    assert isinstance(parser.native_parser, SemselNativeParser)
+    assert parser.tokenize("^1").data == "selector"
+
+
+@given(selector_expression())
+def test_native_parse_matches_reference_parse(content: str):
+    """
+    Ensures the native parser produces the same ``VersionSelector`` expressions as the
+    reference Earley engine.
+    """
+
+    assert parse_outcome(NATIVE_PARSER, content) == parse_outcome(
+        REFERENCE_PARSER, content
+    )
+
+
+@given(mutated_selector_expression())
+def test_native_parse_failures_match_reference_parse(content: str):
+    """
+    Ensures the native parser accepts and rejects the same expressions as the
+    reference Earley engine with the same failure messages.
+    """
+
+    assert parse_outcome(NATIVE_PARSER, content) == parse_outcome(
+        REFERENCE_PARSER, content
+    )
+
+
+@pytest.mark.parametrize(
+    "content",
+    ["", " ", "a", "1.", "1.2.3-", ">", "1 -", "1 ||", "1x", "1 - 2 - 3", "1 ||  >2"],
+)
+def test_native_parse_invalid_matches_reference_parse(content: str):
+    """
+    Ensures the native parser reports the same failures as the reference Earley engine
+    for known invalid expressions.
+    """
+
+    outcome = parse_outcome(NATIVE_PARSER, content)
+    assert outcome[0] == ParseFailure
+    assert outcome == parse_outcome(REFERENCE_PARSER, content)
+
+
+@pytest.mark.parametrize("content", ["~1", "~1.2 || ~2", "2 - 1", "~1 x"])
+def test_native_parse_defers_invalid_expressions(content: str):
+    """
+    Ensures the native parser only raises errors from building conditions and ranges
+    once the expression is known to be syntactically valid.
+    """
+
+    assert parse_outcome(NATIVE_PARSER, content) == parse_outcome(
+        REFERENCE_PARSER, content
+    )
+
+
+@given(mutated_selector_expression())
+def test_native_try_parse_matches_reference_try_parse(content: str):
+    """
+    Ensures the native parser's non-raising results describe failures with the same
+    kind, position, and message as the reference Earley engine.
+    """
+
+    native_result = NATIVE_PARSER.try_parse(content, validate=False)
+    reference_result = REFERENCE_PARSER.try_parse(content, validate=False)
+
+    assert native_result.ok == reference_result.ok
+    assert native_result.kind == reference_result.kind
+    assert native_result.position == reference_result.position
+    assert parse_outcome(NATIVE_PARSER, content) == parse_outcome(
+        REFERENCE_PARSER, content
+    )
+
+
+@given(mutated_selector_expression())
+def test_native_check_matches_try_parse(content: str):
+    """
+    Ensures the native parser's cheap validity check agrees with its parse results.
+    """
+
+    for validate in (True, False):
+        assert NATIVE_PARSER.check(content, validate=validate) == (
+            NATIVE_PARSER.try_parse(content, validate=validate).ok
+        )
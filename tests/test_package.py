@@ -4,6 +4,34 @@
 
 """This moudle exposes some initial package building sanity checks."""
 
+import sys
+import subprocess
+from typing import List
+
+import pytest
+
+
+def get_imported_modules(statement: str) -> List[str]:
+    """Get the names of all modules imported while running the given statement.
+
+    :param str statement: The Python statement to run in a fresh interpreter
+    :return: A list of imported module names (as reported by ``-X importtime``)
+    :rtype: List[str]
+    """
+
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+    return [
+        line.rsplit("|", 1)[-1].strip()
+        for line in process.stderr.splitlines()
+        if line.startswith("import time:") and "|" in line
+    ]
+
 
 def test_version_importable():
     """Basic sanity check to ensure we can discover the package name and version."""
@@ -12,3 +40,37 @@ def test_version_importable():
 
     assert isinstance(__version__.__name__, str)
     assert isinstance(__version__.__version__, str)
+
+
+@pytest.mark.skipif(
+    sys.version_info < (3, 7), reason="lazy imports require Python 3.7+"
+)
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "import semsel",
+        "import semsel.parser",
+        "from semsel.version import PartialVersion",
+        "from semsel import VersionIndex",
+        "from semsel import SemselParser; SemselParser(engine='native').parse('^1')",
+    ],
+)
+def test_import_does_not_import_lark(statement: str):
+    """Ensure importing the package (and native parsing) never imports Lark."""
+
+    imported = get_imported_modules(statement)
+    assert "semsel" in imported
+    assert not [name for name in imported if name.split(".")[0] == "lark"]
+
+
+@pytest.mark.skipif(
+    sys.version_info < (3, 7), reason="lazy imports require Python 3.7+"
+)
+def test_building_parser_imports_lark():
+    """Ensure Lark is imported once a Lark based parser is first built."""
+
+    imported = get_imported_modules(
+        "from semsel import SemselParser; SemselParser().parse('^1')"
+    )
+    assert "lark" in imported
+    assert "semsel.transformer" in imported
@@ -4,21 +4,40 @@
 
 """Contains unit tests for the SemselParser."""
 
+from typing import Optional
+from pathlib import Path
 from unittest import mock
 
+import attr
 import pytest
 from lark import Lark, Tree
 from hypothesis import given
 from lark.grammar import Terminal
 from lark.exceptions import VisitError, UnexpectedEOF, UnexpectedCharacters
-from hypothesis.strategies import text, sampled_from
-
-from semsel.parser import GRAMMAR, SemselParser, SemselTransformer
+from hypothesis.strategies import text, lists, sampled_from
+
+from semsel.parser import (
+    GRAMMAR,
+    CacheInfo,
+    LALR_GRAMMAR,
+    SemselParser,
+    ParserEngine,
+    ParseErrorKind,
+    SemselTransformer,
+    _format_unexpected_characters,
+)
 from semsel.selector import VersionSelector
 from semsel.exceptions import ParseFailure, InvalidExpression
 
 from .strategies import version_selector
 
+ENGINE_PARSERS = [
+    SemselParser(),
+    SemselParser(engine="lalr"),
+    SemselParser(engine="lalr", inline_transform=True),
+    SemselParser(engine="native"),
+]
+
 
 def test_defaults_to_included_grammar():
     """
@@ -30,6 +49,18 @@ def test_defaults_to_included_grammar():
     assert isinstance(parser.parser, Lark)
 
 
+def test_lalr_engine_defaults_to_lalr_grammar():
+    """
+    Ensures the ``SemselParser`` using the LALR engine uses the LALR compatible grammar.
+    """
+
+    parser = SemselParser(engine="lalr")
+    assert parser.engine == ParserEngine.LALR
+    assert parser.grammar == LALR_GRAMMAR
+    assert isinstance(parser.parser, Lark)
+    assert parser.parser.options.parser == "lalr"
+
+
 def test_default_transfomer_visits_tokens():
     """
     Ensures the default instance of the ``SemselParser`` uses the appropraite
@@ -144,3 +175,567 @@ def test_parse_UnexpectedEOF_raises_ParseFailure(version_selector: VersionSelect
 
         with pytest.raises(ParseFailure):
             SemselParser().parse(str(version_selector), validate=False)
+
+
+@given(version_selector())
+def test_lalr_parse_matches_earley_parse(version_selector: VersionSelector):
+    """
+    Ensures the LALR engine produces the same ``VersionSelector`` expressions as the
+    default Earley engine.
+    """
+
+    content = str(version_selector)
+    assert str(SemselParser(engine="lalr").parse(content, validate=False)) == str(
+        SemselParser().parse(content, validate=False)
+    )
+
+
+@pytest.mark.parametrize(
+    "content", ["1  2", "1||2", "1 ||2", "1|| 2", "1 ||  2", "> 1 || ~ 1.2 1 - 2"]
+)
+def test_lalr_parse_handles_optional_spaces(content: str):
+    """
+    Ensures the LALR engine accepts the same optional whitespace as the Earley engine.
+    """
+
+    assert str(SemselParser(engine="lalr").parse(content, validate=False)) == str(
+        SemselParser().parse(content, validate=False)
+    )
+
+
+@pytest.mark.parametrize(
+    "content", ["", "a", "1.", "1x", "1 -", "1 ||", "1 - 2 - 3", "1  || 2", "1 ||  >2"]
+)
+def test_lalr_parse_invalid_raises_ParseFailure(content: str):
+    """
+    Ensures the LALR engine raises ``ParseFailure`` for the same invalid expressions as
+    the Earley engine.
+    """
+
+    with pytest.raises(ParseFailure):
+        SemselParser(engine="lalr").parse(content)
+
+
+def test_parse_cache_disabled_by_default():
+    """
+    Ensures the ``SemselParser`` does not cache parsed selectors unless asked to.
+    """
+
+    parser = SemselParser(engine="native")
+    assert parser.parse("^1") is not parser.parse("^1")
+    assert parser.cache_info() == CacheInfo(
+        hits=0, misses=0, evictions=0, maxsize=0, currsize=0
+    )
+
+
+@given(version_selector())
+def test_parse_cache_returns_cached_selector(version_selector: VersionSelector):
+    """
+    Ensures the ``SemselParser`` returns cached selectors for the same stripped
+    expression and validation flag.
+    """
+
+    parser = SemselParser(engine="native", cache_size=8)
+    parsed = parser.parse(str(version_selector), validate=False)
+    assert parser.parse(f" {version_selector!s}\t", validate=False) is parsed
+    assert parser.cache_info() == CacheInfo(
+        hits=1, misses=1, evictions=0, maxsize=8, currsize=1
+    )
+
+
+def test_parse_cache_keys_on_validate():
+    """
+    Ensures the ``SemselParser`` caches selectors separately for the validation flag.
+    """
+
+    parser = SemselParser(engine="native", cache_size=8)
+    assert parser.parse("^1", validate=True) is not parser.parse("^1", validate=False)
+    assert parser.cache_info().misses == 2
+
+
+def test_parse_cache_evicts_least_recently_used():
+    """
+    Ensures the ``SemselParser`` cache evicts the least recently used selectors once it
+    exceeds its maximum size.
+    """
+
+    parser = SemselParser(engine="native", cache_size=2)
+    first = parser.parse("1")
+    parser.parse("2")
+    assert parser.parse("1") is first
+    parser.parse("3")
+    assert parser.parse("1") is first
+    assert parser.parse("2") is not None
+    assert parser.cache_info() == CacheInfo(
+        hits=2, misses=4, evictions=2, maxsize=2, currsize=2
+    )
+
+
+def test_parse_cache_does_not_cache_failures():
+    """
+    Ensures the ``SemselParser`` cache does not cache expressions that fail to parse.
+    """
+
+    parser = SemselParser(engine="native", cache_size=2)
+    for _ in range(2):
+        with pytest.raises(ParseFailure):
+            parser.parse("1 -")
+
+    assert parser.cache_info().currsize == 0
+
+
+def test_clear_cache_resets_cache():
+    """
+    Ensures clearing the ``SemselParser`` cache removes cached selectors and resets the
+    cache statistics.
+    """
+
+    parser = SemselParser(engine="native", cache_size=2)
+    parsed = parser.parse("^1")
+    parser.parse("^1")
+    parser.clear_cache()
+    assert parser.cache_info() == CacheInfo(
+        hits=0, misses=0, evictions=0, maxsize=2, currsize=0
+    )
+    assert parser.parse("^1") is not parsed
+
+
+def test_cached_selectors_are_immutable():
+    """
+    Ensures selectors returned from the ``SemselParser`` cache cannot be mutated.
+    """
+
+    parser = SemselParser(engine="native", cache_size=2)
+    parsed = parser.parse("^1.2 || 1 - 2")
+    assert isinstance(parsed.clauses, tuple)
+    assert all(isinstance(clause, tuple) for clause in parsed.clauses)
+
+    condition, version_range = parsed.clauses[0][0], parsed.clauses[1][0]
+    for instance, attribute in (
+        (parsed, "clauses"),
+        (condition, "operator"),
+        (condition.version, "major"),
+        (version_range, "version_start"),
+    ):
+        with pytest.raises(attr.exceptions.FrozenInstanceError):
+            setattr(instance, attribute, None)
+
+
+def test_grammar_cache_requires_lalr_engine():
+    """
+    Ensures grammar caching can only be requested for the LALR engine.
+    """
+
+    for engine in ("earley", "native"):
+        with pytest.raises(ValueError):
+            SemselParser(engine=engine, grammar_cache=True)
+
+
+def test_grammar_cache_writes_compiled_grammar(tmp_path: Path):
+    """
+    Ensures the first LALR parser using a grammar cache compiles and writes the
+    compiled grammar to the given cache directory.
+    """
+
+    parser = SemselParser(engine="lalr", grammar_cache=str(tmp_path))
+    assert str(parser.parse("^1")) == "^1"
+    assert [_.suffix for _ in tmp_path.iterdir()] == [".pickle"]
+
+
+def test_grammar_cache_loads_compiled_grammar(tmp_path: Path):
+    """
+    Ensures later LALR parsers using a grammar cache load the compiled grammar instead
+    of compiling it again.
+    """
+
+    SemselParser(engine="lalr", grammar_cache=str(tmp_path)).parser
+    with mock.patch.object(
+        Lark, "_load", autospec=True, side_effect=Lark._load
+    ) as mocked_load:
+        parser = SemselParser(engine="lalr", grammar_cache=str(tmp_path))
+        assert str(parser.parse(">1 <2 || 3 - 4", validate=False)) == ">1 <2 || 3 - 4"
+        mocked_load.assert_called_once()
+
+    with pytest.raises(ParseFailure):
+        parser.parse("1 -")
+
+
+def test_grammar_cache_keyed_on_grammar_and_options(tmp_path: Path):
+    """
+    Ensures compiled grammars are cached separately for different grammars and options.
+    """
+
+    SemselParser(engine="lalr", grammar_cache=str(tmp_path)).parser
+    SemselParser(engine="lalr", grammar_cache=str(tmp_path), debug=True).parser
+    SemselParser(
+        engine="lalr", grammar=f"{LALR_GRAMMAR!s}\n", grammar_cache=str(tmp_path)
+    ).parser
+    assert len(list(tmp_path.iterdir())) == 3
+
+
+def test_grammar_cache_recovers_from_invalid_cache(tmp_path: Path):
+    """
+    Ensures an unreadable cached grammar is replaced by a freshly compiled grammar.
+    """
+
+    SemselParser(engine="lalr", grammar_cache=str(tmp_path)).parser
+    (cache_path,) = tmp_path.iterdir()
+    cache_path.write_bytes(b"invalid")
+
+    with pytest.warns(UserWarning):
+        parser = SemselParser(engine="lalr", grammar_cache=str(tmp_path))
+        assert str(parser.parse("^1")) == "^1"
+
+    with cache_path.open("rb") as cache_file:
+        assert isinstance(Lark.load(cache_file), Lark)
+
+
+@pytest.mark.parametrize(
+    "error", [AttributeError("stale"), KeyError("memo"), TypeError("unexpected")]
+)
+def test_grammar_cache_recovers_from_corrupt_cache(tmp_path: Path, error: Exception):
+    """
+    Ensures a cached grammar which fails to load for any reason is removed and
+    replaced by a freshly compiled grammar.
+    """
+
+    SemselParser(engine="lalr", grammar_cache=str(tmp_path)).parser
+    (cache_path,) = tmp_path.iterdir()
+
+    with mock.patch.object(Lark, "_load", side_effect=error):
+        with pytest.warns(UserWarning):
+            parser = SemselParser(engine="lalr", grammar_cache=str(tmp_path))
+            assert str(parser.parse("^1")) == "^1"
+
+    with cache_path.open("rb") as cache_file:
+        assert isinstance(Lark.load(cache_file), Lark)
+
+
+def test_inline_transform_requires_lalr_engine():
+    """
+    Ensures inline transformation can only be requested for the LALR engine.
+    """
+
+    for engine in ("earley", "native"):
+        with pytest.raises(ValueError):
+            SemselParser(engine=engine, inline_transform=True)
+
+
+@given(version_selector())
+def test_inline_transform_matches_tree_transform(version_selector: VersionSelector):
+    """
+    Ensures inline transformation produces the same selectors as transforming trees.
+    """
+
+    content = str(version_selector)
+    inline_parser = SemselParser(engine="lalr", inline_transform=True)
+    assert str(inline_parser.parse(content, validate=False)) == str(
+        SemselParser(engine="lalr").parse(content, validate=False)
+    )
+
+
+def test_inline_transform_skips_tree_transform():
+    """
+    Ensures inline transformation never builds or transforms an intermediate tree.
+    """
+
+    parser = SemselParser(engine="lalr", inline_transform=True)
+    with mock.patch.object(SemselTransformer, "transform") as mocked_transform:
+        selector = parser.parse(">=1.2.3-rc.1+build.2 <2 || 3 - 4", validate=False)
+        mocked_transform.assert_not_called()
+
+    assert str(selector) == ">=1.2.3-rc.1+build.2 <2 || 3 - 4"
+    assert isinstance(parser.tokenize("^1"), Tree)
+
+
+def test_inline_transform_validates_selectors():
+    """
+    Ensures inline transformation still honors the validate flag and maps failures.
+    """
+
+    parser = SemselParser(engine="lalr", inline_transform=True)
+    with pytest.raises(InvalidExpression):
+        parser.parse("^1 ^2")
+    with pytest.raises(ParseFailure):
+        parser.parse("1 -")
+
+    assert str(parser.parse("^1 ^2", validate=False)) == "^1 ^2"
+
+
+@pytest.mark.parametrize("content", ["~1 ^ >", "10.0 - 2.0.0 ||29>3", "2 - 1 ||"])
+def test_inline_transform_defers_invalid_expressions(content: str):
+    """
+    Ensures inline transformation reports syntax errors after invalid expressions.
+    """
+
+    with pytest.raises(ParseFailure):
+        SemselParser(engine="lalr", inline_transform=True).parse(content)
+
+
+@given(
+    lists(
+        sampled_from(["~1", "^1", "2 - 1", "1.0", "2", ">", "-", "||", " ", "."]),
+        max_size=6,
+    ).map("".join)
+)
+def test_inline_transform_fails_like_other_engines(content: str):
+    """
+    Ensures every engine parses or fails to parse the same expressions the same way.
+    """
+
+    outcomes = set()
+    for parser in ENGINE_PARSERS:
+        try:
+            outcomes.add(str(parser.parse(content)))
+        except (ParseFailure, InvalidExpression) as exc:
+            outcomes.add(type(exc).__name__)
+
+    assert len(outcomes) == 1
+
+
+def test_inline_transform_shares_grammar_cache(tmp_path: Path):
+    """
+    Ensures inline and tree building parsers share the same cached grammar.
+    """
+
+    inline_parser = SemselParser(
+        engine="lalr", grammar_cache=str(tmp_path), inline_transform=True
+    )
+    assert str(inline_parser.parse("^1")) == "^1"
+
+    parser = SemselParser(engine="lalr", grammar_cache=str(tmp_path))
+    assert isinstance(parser.tokenize("^1"), Tree)
+    assert str(parser.parse("^1")) == "^1"
+    assert len(list(tmp_path.iterdir())) == 1
+
+
+@pytest.mark.parametrize("engine", ["earley", "lalr", "native"])
+@pytest.mark.parametrize(
+    "content, kind, position",
+    [
+        ("1.2.", ParseErrorKind.UNEXPECTED_END, 4),
+        (">=1 <2 ||", ParseErrorKind.UNEXPECTED_END, 9),
+        ("1.a", ParseErrorKind.UNEXPECTED_CHARACTERS, 2),
+        ("^1 ^2", ParseErrorKind.INVALID_EXPRESSION, None),
+        ("2 - 1", ParseErrorKind.INVALID_EXPRESSION, None),
+    ],
+)
+def test_try_parse_describes_failures(
+    engine: str, content: str, kind: ParseErrorKind, position: Optional[int]
+):
+    """
+    Ensures try_parse describes failures without raising and with the same message as
+    the error raised by parse.
+    """
+
+    parser = SemselParser(engine=engine)
+    result = parser.try_parse(content)
+
+    assert not result
+    assert result.selector is None
+    assert result.kind == kind
+    if position is not None:
+        assert result.position == position
+
+    with pytest.raises(type(result.error)) as exc_info:
+        parser.parse(content)
+
+    assert result.message == exc_info.value.message
+    assert not parser.check(content)
+
+
+@pytest.mark.parametrize("engine", ["earley", "lalr", "native"])
+def test_try_parse_returns_selector(engine: str):
+    """
+    Ensures try_parse returns successfully parsed selectors.
+    """
+
+    parser = SemselParser(engine=engine)
+    result = parser.try_parse(" ^1.2 || 3 - 4 ")
+
+    assert result.ok
+    assert result.kind is None and result.position is None
+    assert result.message is None and result.error is None
+    assert result.selector == parser.parse(" ^1.2 || 3 - 4 ")
+    assert parser.check("^1.2")
+
+
+def test_try_parse_builds_messages_lazily():
+    """
+    Ensures try_parse only formats failure messages once they are requested.
+    """
+
+    parser = SemselParser(engine="native")
+    with mock.patch(
+        "semsel.parser._format_unexpected_characters",
+        wraps=_format_unexpected_characters,
+    ) as mocked_format:
+        result = parser.try_parse("1.a")
+        mocked_format.assert_not_called()
+
+        assert "unexpected characters" in result.message
+        assert result.message is result.message
+        mocked_format.assert_called_once()
+
+
+def test_try_parse_uses_cache():
+    """
+    Ensures try_parse shares the parsed selector cache with parse.
+    """
+
+    parser = SemselParser(cache_size=2)
+    selector = parser.parse("^1")
+
+    assert parser.try_parse(" ^1 ").selector is selector
+    assert not parser.try_parse("1 -")
+    assert parser.cache_info().hits == 1
+    assert parser.cache_info().currsize == 1
+
+
+@pytest.mark.parametrize("engine", ["earley", "lalr", "native"])
+def test_parse_interns_versions_and_conditions(engine: str):
+    """
+    Ensures identical versions and conditions are shared between parsed selectors.
+    """
+
+    parser = SemselParser(engine=engine)
+    first = parser.parse(">=1.2.3 <2 || 1.0.0 - 1.2.3", validate=False)
+    second = parser.parse(">=1.2.3 <2", validate=False)
+
+    assert first.clauses[0][0] is second.clauses[0][0]
+    assert first.clauses[0][1] is second.clauses[0][1]
+    assert first.clauses[1][0].version_end is first.clauses[0][0].version
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_parse_many_preserves_order(workers: int):
+    """
+    Ensures parse_many results match individual parses in the order of the expressions.
+    """
+
+    contents = ["^1", "~1.2.3", "1.0.0 - 2.0.0", "^1", ">=1 || <0.1"]
+    parser = SemselParser()
+
+    assert [
+        str(selector)
+        for selector in parser.parse_many(
+            contents, validate=False, workers=workers, chunksize=2
+        )
+    ] == [str(parser.parse(content, validate=False)) for content in contents]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_parse_many_returns_failures(workers: int):
+    """
+    Ensures parse_many returns parsing errors in place of their expressions.
+    """
+
+    parser = SemselParser(engine="lalr")
+    results = parser.parse_many(["^1", "1 -", "^1"], workers=workers, chunksize=1)
+
+    assert str(results[0]) == "^1"
+    assert isinstance(results[1], ParseFailure)
+    assert str(results[2]) == "^1"
+
+
+@pytest.mark.parametrize("options", [dict(workers=0), dict(chunksize=0)])
+def test_parse_many_requires_positive_workers_and_chunksize(options: dict):
+    """
+    Ensures parse_many rejects fewer than 1 worker process or chunk sizes below 1.
+    """
+
+    with pytest.raises(ValueError):
+        SemselParser().parse_many(["^1"], **options)
+
+
+def test_parse_many_parses_duplicates_once():
+    """
+    Ensures parse_many only parses each unique expression once.
+    """
+
+    parser = SemselParser()
+    with mock.patch.object(parser, "parse", wraps=parser.parse) as mocked_parse:
+        results = parser.parse_many(["^1", "^1", "~1"], workers=1)
+        assert mocked_parse.call_count == 2
+        assert results[0] is results[1]
+
+
+def test_parse_stream_skips_blank_and_comment_lines():
+    """
+    Ensures parse_stream skips blank and comment lines while counting line numbers.
+    """
+
+    lines = ["# header\n", "\n", "^1\n", "   \n", "  # indented comment\n", "~1.2\n"]
+    results = list(SemselParser().parse_stream(lines))
+
+    assert [(line_no, key, str(selector)) for line_no, key, selector in results] == [
+        (3, None, "^1"),
+        (6, None, "~1.2"),
+    ]
+
+
+def test_parse_stream_splits_keys(tmp_path: Path):
+    """
+    Ensures parse_stream splits keys from selectors when given a key separator.
+    """
+
+    requirements_path = tmp_path.joinpath("requirements.txt")
+    requirements_path.write_text("first: ^1\nsecond :>=1 <2 || 3\n")
+
+    with requirements_path.open("r") as requirements_file:
+        results = list(
+            SemselParser().parse_stream(
+                requirements_file, validate=False, key_separator=":"
+            )
+        )
+
+    assert [(line_no, key, str(selector)) for line_no, key, selector in results] == [
+        (1, "first", "^1"),
+        (2, "second", ">=1 <2 || =3"),
+    ]
+
+
+def test_parse_stream_continues_after_failures():
+    """
+    Ensures parse_stream yields parsing failures in place without stopping the stream.
+    """
+
+    results = list(
+        SemselParser().parse_stream(
+            ["a: 1 -", "missing separator", "b: ^1"], key_separator=":"
+        )
+    )
+
+    assert isinstance(results[0][2], ParseFailure)
+    assert results[0][:2] == (1, "a")
+    assert isinstance(results[1][2], ParseFailure)
+    assert results[1][:2] == (2, None)
+    assert str(results[2][2]) == "^1"
+
+
+@pytest.mark.parametrize("engine", ["earley", "lalr", "native"])
+def test_parse_stream_reports_failures_in_stripped_selector(engine: str):
+    """
+    Ensures parse_stream reports failures of keyed lines against the stripped selector.
+    """
+
+    ((line_no, key, error),) = SemselParser(engine=engine).parse_stream(
+        ["pkg:  1 -  "], key_separator=":"
+    )
+
+    assert (line_no, key) == (1, "pkg")
+    assert isinstance(error, ParseFailure)
+    assert "'1 -'" in error.message
+    assert error.message.endswith("column 3")
+
+
+def test_parse_stream_is_lazy():
+    """
+    Ensures parse_stream only consumes lines as results are requested.
+    """
+
+    lines = iter(["^1", "~1"])
+    results = SemselParser().parse_stream(lines)
+
+    assert next(results)[0] == 1
+    assert next(lines) == "~1"
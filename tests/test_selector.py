@@ -0,0 +1,564 @@
+# -*- encoding: utf-8 -*-
+# Copyright (c) 2020 Modist Team <admin@modist.io>
+# ISC License <https://choosealicense.com/licenses/isc>
+
+"""Contains unit tests for the VersionSelector class."""
+
+import operator
+from typing import List
+from functools import reduce
+
+import attr
+import pytest
+from hypothesis import given
+from hypothesis.strategies import none, lists, sampled_from
+
+from semsel.parser import SemselParser
+from semsel.version import PartialVersion
+from semsel.interval import VersionInterval, _version_key, _union_intervals
+from semsel.exceptions import InvalidExpression
+from semsel.selector import (
+    VersionRange,
+    VersionSelector,
+    VersionCondition,
+    ConditionOperator,
+)
+
+from .strategies import (
+    version_range,
+    small_version,
+    partial_version,
+    version_selector,
+    version_condition,
+)
+
+PARSER = SemselParser(engine="native")
+
+
+def release_version():
+    """Strategy for building partial versions without prereleases."""
+
+    return partial_version(prerelease_strategy=none())
+
+
+def small_selector():
+    """Strategy for building selectors from a small pool of close versions."""
+
+    condition = version_condition(
+        operator_strategy=sampled_from(
+            [
+                operator
+                for operator in ConditionOperator
+                if operator != ConditionOperator.MINOR
+            ]
+        ),
+        version_strategy=small_version(),
+    )
+    return version_selector(
+        selector_clause_strategy=lists(
+            lists(condition, min_size=1, max_size=3), min_size=1, max_size=3
+        )
+    )
+
+
+def reference_contains(condition: VersionCondition, version: PartialVersion) -> bool:
+    """Check if a release version satisfies a release condition without intervals.
+
+    :param VersionCondition condition: The condition to check
+    :param PartialVersion version: The version to check
+    :return: True if the version satisfies the condition, otherwise False
+    :rtype: bool
+    """
+
+    comparison = version.compare(condition.version)
+    if condition.operator == ConditionOperator.MAJOR:
+        return comparison >= 0 and version.major == condition.version.major
+    elif condition.operator == ConditionOperator.MINOR:
+        return (
+            comparison >= 0
+            and version.major == condition.version.major
+            and (version.minor or 0) == condition.version.minor
+        )
+
+    return comparison in {
+        ConditionOperator.EQ: (0,),
+        ConditionOperator.GT: (1,),
+        ConditionOperator.GE: (0, 1),
+        ConditionOperator.LT: (-1,),
+        ConditionOperator.LE: (-1, 0),
+    }[condition.operator]
+
+
+@given(version_condition(version_strategy=release_version()), release_version())
+def test_condition_interval_matches_operator(
+    condition: VersionCondition, version: PartialVersion
+):
+    """
+    Ensures the compiled interval of a condition implements the condition's operator.
+    """
+
+    selector = VersionSelector(clauses=[[condition]], validate=False)
+    assert selector.contains(version) == reference_contains(condition, version)
+
+
+@given(version_range(), partial_version())
+def test_range_interval_includes_endpoints(
+    version_range: VersionRange, version: PartialVersion
+):
+    """
+    Ensures the compiled interval of a range includes both of its endpoints.
+    """
+
+    selector = VersionSelector(clauses=[[version_range]], validate=False)
+    assert version_range.version_start in selector
+    assert version_range.version_end in selector
+    assert selector.contains(version) == (
+        _version_key(version_range.version_start)
+        <= _version_key(version)
+        <= _version_key(version_range.version_end)
+    )
+
+
+@given(
+    lists(
+        lists(version_condition(version_strategy=release_version()), min_size=1),
+        min_size=1,
+        max_size=3,
+    ),
+    release_version(),
+)
+def test_contains_matches_any_clause(clauses, version: PartialVersion):
+    """
+    Ensures a selector contains a version if all expressions of any clause do.
+    """
+
+    selector = VersionSelector(clauses=clauses, validate=False)
+    assert selector.contains(version) == any(
+        all(reference_contains(condition, version) for condition in clause)
+        for clause in clauses
+    )
+
+
+@pytest.mark.parametrize(
+    "content, version, expected",
+    [
+        ("^1.2", "1.9.9", True),
+        ("^1.2", "2.0.0", False),
+        ("^1.2", "2.0.0-rc.1", False),
+        ("<2", "2.0.0-rc.1", True),
+        ("^1.2", "1.1.9", False),
+        ("~1.2.3", "1.2.9", True),
+        ("~1.2.3", "1.3.0", False),
+        ("~1.2.3", "1.3.0-0", False),
+        (">=1.2 <2 || ^3", "3.4.5", True),
+        (">=1.2 <2 || ^3", "2.5.0", False),
+        ("1.0.0 - 1.2.0", "1.2.0", True),
+        ("1.0.0 - 1.2.0", "1.2.1", False),
+        ("=1.2.3", "1.2.3+build.1", True),
+        ("=1.2.3", "1.2.3-rc.1", False),
+        (">1.2.3-rc.1", "1.2.3-rc.2", True),
+        (">1.2.3-rc.1", "1.2.3-rc.1", False),
+    ],
+)
+def test_contains_parsed_selectors(content: str, version: str, expected: bool):
+    """
+    Ensures parsed selectors contain the expected versions.
+    """
+
+    selector = PARSER.parse(content, validate=False)
+    assert selector.contains(version) == expected
+    assert (PartialVersion.from_string(version) in selector) == expected
+
+
+def test_intervals_are_compiled_once():
+    """
+    Ensures the intervals of a selector are only compiled once.
+    """
+
+    selector = PARSER.parse(">=1.2 <2 || ^3", validate=False)
+    assert selector.intervals is selector.intervals
+    assert [str(interval) for interval in selector.intervals] == [
+        "[1.2.0, 2.0.0)",
+        "[3.0.0, 4.0.0-0)",
+    ]
+
+
+@given(
+    version_condition(version_strategy=release_version()),
+    lists(release_version(), max_size=20),
+)
+def test_filter_yields_contained_versions(
+    condition: VersionCondition, versions: List[PartialVersion]
+):
+    """
+    Ensures filtering yields exactly the given versions contained by the selector.
+    """
+
+    selector = VersionSelector(clauses=[[condition]], validate=False)
+    assert list(selector.filter(versions)) == [
+        version for version in versions if version in selector
+    ]
+
+
+def test_filter_accepts_strings_and_versions():
+    """
+    Ensures filtering accepts both version strings and versions and yields them as is.
+    """
+
+    selector = PARSER.parse("^1.2", validate=False)
+    version = PartialVersion(1, 9)
+    assert list(selector.filter(["1.1.0", "1.2.0", version, "2.0.0"])) == [
+        "1.2.0",
+        version,
+    ]
+
+
+def test_filter_is_lazy():
+    """
+    Ensures filtering only consumes candidates as matches are requested.
+    """
+
+    selector = PARSER.parse("^1", validate=False)
+    versions = iter(["1.0.0", "0.1.0", "1.1.0", "not a version"])
+    filtered = selector.filter(versions)
+
+    assert next(filtered) == "1.0.0"
+    assert next(filtered) == "1.1.0"
+    with pytest.raises(ValueError):
+        next(filtered)
+
+
+@given(
+    version_condition(version_strategy=release_version()),
+    lists(release_version(), max_size=20),
+)
+def test_max_min_satisfying_match_filtered_versions(
+    condition: VersionCondition, versions: List[PartialVersion]
+):
+    """
+    Ensures the greatest and least satisfying versions match the filtered versions.
+    """
+
+    selector = VersionSelector(clauses=[[condition]], validate=False)
+    filtered = [_version_key(version) for version in selector.filter(versions)]
+    maximum = selector.max_satisfying(iter(versions))
+    minimum = selector.min_satisfying(iter(versions))
+
+    if not filtered:
+        assert maximum is None and minimum is None
+    else:
+        assert _version_key(maximum) == max(filtered)
+        assert _version_key(minimum) == min(filtered)
+
+
+def test_max_min_satisfying_prereleases():
+    """
+    Ensures the greatest and least satisfying versions respect prerelease precedence.
+    """
+
+    selector = PARSER.parse(">=1.0.0-alpha <1.0.0 || ^2", validate=False)
+    versions = ["1.0.0-beta.11", "1.0.0-beta.2", "1.0.0", "2.3.0", "3.0.0-rc.1"]
+
+    assert selector.max_satisfying(versions) == "2.3.0"
+    assert selector.min_satisfying(versions) == "1.0.0-beta.2"
+    assert selector.max_satisfying(["0.1.0", "4.0.0"]) is None
+
+
+@given(small_selector(), small_selector(), small_version())
+def test_selector_algebra_matches_contains(
+    source: VersionSelector, target: VersionSelector, version: PartialVersion
+):
+    """
+    Ensures intersections, unions, and complements contain the expected versions.
+    """
+
+    source_contains, target_contains = version in source, version in target
+    assert ((source & target).contains(version)) == (
+        source_contains and target_contains
+    )
+    assert ((source | target).contains(version)) == (source_contains or target_contains)
+    assert ((~source).contains(version)) == (not source_contains)
+
+
+@given(small_selector())
+def test_selector_algebra_is_canonical(selector: VersionSelector):
+    """
+    Ensures built selectors are canonical and can be parsed from their string.
+    """
+
+    built = VersionSelector.from_intervals(selector.interval_set)
+    assert built.interval_set == selector.interval_set
+    assert PARSER.parse(str(built), validate=False).interval_set == built.interval_set
+    assert (~~selector).interval_set == selector.interval_set
+    assert (selector & ~selector).is_empty()
+    assert str(selector | ~selector) == ">=0.0.0-0"
+
+
+@pytest.mark.parametrize(
+    "source, target, expected_and, expected_or",
+    [
+        ("^1.2 || ^3", ">=1.4 <3.1", ">=1.4.0 <2.0.0-0 || >=3.0.0 <3.1.0", None),
+        ("<=1.0.0", ">1.0.0", "<0.0.0-0", ">=0.0.0-0"),
+        ("<1.0.1-0", ">=1.0.1-0 <2", "<0.0.0-0", "<2.0.0"),
+        (">=1.0.0 <=1.0.0", "1.0.0", "=1.0.0", "=1.0.0"),
+        (">1.0.0-alpha", "<=1.0.0-alpha.0", "=1.0.0-alpha.0", ">=0.0.0-0"),
+        ("1.0.0 - 2.0.0", "2.0.0 - 3.0.0", "=2.0.0", ">=1.0.0 <=3.0.0"),
+    ],
+)
+def test_selector_algebra_examples(
+    source: str, target: str, expected_and: str, expected_or: str
+):
+    """
+    Ensures intersections and unions of parsed selectors produce the expected strings.
+    """
+
+    source_selector = PARSER.parse(source, validate=False)
+    target_selector = PARSER.parse(target, validate=False)
+
+    assert str(source_selector & target_selector) == expected_and
+    if expected_or is not None:
+        assert str(source_selector | target_selector) == expected_or
+
+
+def test_selector_is_empty():
+    """
+    Ensures selectors without any satisfying version are detected as empty.
+    """
+
+    assert PARSER.parse(">2 <1", validate=False).is_empty()
+    assert PARSER.parse(">1.0.0 <1.0.1-0", validate=False).is_empty()
+    assert PARSER.parse("<0.0.0-0 || >2 <=2", validate=False).is_empty()
+    assert not PARSER.parse(">2 <1 || =0.0.0-0", validate=False).is_empty()
+    assert str(~PARSER.parse("<0.0.0-0", validate=False)) == ">=0.0.0-0"
+
+
+@pytest.mark.parametrize(
+    "content, expected",
+    [
+        (">=1 >=1.2 <3 <2.5 || >=1.3 <2", ">=1.2.0 <2.5.0"),
+        ("^1 || ^1.1 || >=1.4 <1.9 || 1.0.0 - 1.8.0", ">=1.0.0 <2.0.0-0"),
+        (">1.2.3 <=1.4.0 || >=1.3 <1.5 || >1.5.9 <2", ">1.2.3 <1.5.0 || >1.5.9 <2.0.0"),
+        ("1.2.3 || >=1.2.3 <=1.2.3", "=1.2.3"),
+        ("<1 || >=1 <2 || >=2", ">=0.0.0-0"),
+        (">2 <1 || <3 >4", "<0.0.0-0"),
+    ],
+)
+def test_simplify_examples(content: str, expected: str):
+    """
+    Ensures simplified selectors merge redundant conditions and overlapping clauses.
+    """
+
+    selector = PARSER.parse(content, validate=False)
+    assert str(selector.simplify()) == expected
+    assert selector.canonical == expected
+
+
+@given(small_selector())
+def test_simplify_is_minimal_and_equivalent(selector: VersionSelector):
+    """
+    Ensures simplified selectors are equivalent, minimal, and have stable strings.
+    """
+
+    simplified = selector.simplify()
+    assert simplified.interval_set == selector.interval_set
+    assert len(simplified.clauses) == max(len(selector.interval_set), 1)
+    assert all(len(clause) <= 2 for clause in simplified.clauses)
+    assert simplified.canonical == selector.canonical
+    assert PARSER.parse(selector.canonical, validate=False).canonical == (
+        selector.canonical
+    )
+
+
+@pytest.mark.parametrize(
+    "content, message",
+    [
+        (">1 <3 >=2.5 <2", "Expression >=2.5 conflicts with expression <2"),
+        ("^1 ^2", "Expression ^1 conflicts with expression ^2"),
+        (">=1 <3 || <1 >=2 <4", "Expression <1 conflicts with expression >=2"),
+        ("<2 >1 >=3", "Expression <2 conflicts with expression >=3"),
+        (">1.0.0 <1.0.1-0", "Expression >1.0.0 conflicts with expression <1.0.1-0"),
+        ("^1 <0.0.0-0", "Expression ^1 conflicts with expression <0.0.0-0"),
+        (">=1 <0.0.0-0", "Expression >=1 conflicts with expression <0.0.0-0"),
+        ("<0.0.0-0 ^1", "Expression ^1 conflicts with expression <0.0.0-0"),
+    ],
+)
+def test_validate_reports_first_conflict(content: str, message: str):
+    """
+    Ensures validation reports the first conflicting expression of a clause.
+    """
+
+    with pytest.raises(InvalidExpression) as exc:
+        PARSER.parse(content)
+
+    assert str(exc.value).startswith(message)
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        ">=1 <2",
+        ">=1 >=1.2 <3 <2.5 || >=1.3 <2",
+        "^1.2 ~1.4.1 <=1.4.2",
+        "=1 || 2 - 3",
+        "<0.0.0-0",
+        "<0.0.0-0 || ^1",
+    ],
+)
+def test_validate_accepts_satisfiable_clauses(content: str):
+    """
+    Ensures validation accepts clauses which are satisfied by some version.
+    """
+
+    assert str(PARSER.parse(content)) == content
+
+
+@given(small_selector())
+def test_validate_matches_clause_emptiness(selector: VersionSelector):
+    """
+    Ensures validation fails if and only if the expressions of a clause conflict.
+    """
+
+    expected = any(
+        len(clause) > 1
+        and _union_intervals(
+            [
+                reduce(
+                    operator.and_,
+                    [expression.interval for expression in clause],
+                    VersionInterval(),
+                )
+            ]
+        )
+        == ()
+        for clause in selector.clauses
+    )
+    try:
+        VersionSelector(clauses=selector.clauses)
+    except InvalidExpression:
+        assert expected
+    else:
+        assert not expected
+
+
+@given(small_selector(), small_selector(), small_version())
+def test_subset_matches_contains(
+    source: VersionSelector, target: VersionSelector, version: PartialVersion
+):
+    """
+    Ensures subset and equivalence checks agree with the selector algebra.
+    """
+
+    if source.issubset(target) and version in source:
+        assert version in target
+
+    assert source.issubset(source | target)
+    assert (source & target).issubset(source)
+    assert source.issuperset(source & target)
+    assert source.issubset(target) == (source & ~target).is_empty()
+    assert source.equivalent(target) == (
+        source.issubset(target) and source.issuperset(target)
+    )
+    assert source.equivalent(source.simplify())
+
+
+@pytest.mark.parametrize(
+    "source, target, subset, superset",
+    [
+        ("~1.2.3", "^1.2", True, False),
+        ("^1.2 || 1.5.0", ">=1.2.0 <2.0.0-0", True, True),
+        (">=1 <2 || >=3 <4", ">=1 <4", True, False),
+        (">=1 <4", ">=1 <2 || >=2 <4", True, True),
+        (">=1 <4", ">=1 <2 || >2 <4", False, True),
+        ("<=1.0.0 || >=1.0.1-0", ">=0.0.0-0", True, True),
+        ("<0.0.0-0", "=1.0.0", True, False),
+    ],
+)
+def test_subset_examples(source: str, target: str, subset: bool, superset: bool):
+    """
+    Ensures subset, superset, and equivalence checks of parsed selectors.
+    """
+
+    source_selector = PARSER.parse(source, validate=False)
+    target_selector = PARSER.parse(target, validate=False)
+
+    assert source_selector.issubset(target_selector) == subset
+    assert source_selector.issuperset(target_selector) == superset
+    assert source_selector.equivalent(target_selector) == (subset and superset)
+
+
+@pytest.mark.parametrize(
+    "source, target, expected",
+    [
+        ("^1", ">=1.0.0 <2.0.0-0", True),
+        (">=1 <2", ">=1.0.0 <2.0.0", True),
+        ("^1", ">=1.0.0 <2", False),
+        ("~1.2", ">=1.2 <1.3.0-0 || 1.2.5", True),
+        ("1.0.0 - 2.0.0", ">=1 <=2", True),
+        (">2 <1", "<0.0.0-0", True),
+    ],
+)
+def test_selectors_compare_and_hash_semantically(
+    source: str, target: str, expected: bool
+):
+    """
+    Ensures selectors are equal and hash equal if satisfied by the same versions.
+    """
+
+    source_selector = PARSER.parse(source, validate=False)
+    target_selector = PARSER.parse(target, validate=False)
+
+    assert (source_selector == target_selector) == expected
+    assert (source_selector != target_selector) != expected
+    if expected:
+        assert hash(source_selector) == hash(target_selector)
+        assert {source_selector: source}[target_selector] == source
+    assert source_selector != source
+
+
+@given(small_selector())
+def test_selector_hash_matches_equality(selector: VersionSelector):
+    """
+    Ensures simplified selectors are equal to and hash the same as their source.
+    """
+
+    simplified = selector.simplify()
+    assert simplified == selector
+    assert hash(simplified) == hash(selector)
+    assert len({selector, simplified, ~selector}) == 2
+
+
+@pytest.mark.parametrize(
+    "expression",
+    [
+        VersionCondition(ConditionOperator.GE, PartialVersion(1, 2)),
+        VersionRange(PartialVersion(1), PartialVersion(2)),
+        PARSER.parse("^1 || >=2.1 <3"),
+    ],
+)
+def test_expressions_are_slotted(expression):
+    """
+    Ensures conditions, ranges, and selectors are slotted and immutable.
+    """
+
+    assert not hasattr(expression, "__dict__")
+    with pytest.raises(attr.exceptions.FrozenInstanceError):
+        expression.validate = False
+
+
+@given(version_selector())
+def test_cached_properties_do_not_change_selectors(selector: VersionSelector):
+    """
+    Ensures computing the cached properties of a selector doesn't change its data.
+    """
+
+    before = repr(selector)
+    for clause in selector.clauses:
+        for expression in clause:
+            copied = attr.evolve(expression)
+            assert expression.interval == copied.interval
+            assert expression == copied and hash(expression) == hash(copied)
+
+    assert selector.canonical == str(selector.simplify())
+    assert repr(selector) == before
+    assert selector.intervals is selector.intervals
+    assert selector.interval_set is selector.interval_set
@@ -4,6 +4,7 @@
 
 """Contains unit tests for the SemselTransformer transformer."""
 
+import attr
 import pytest
 from lark import Tree, Token
 from hypothesis import given
@@ -19,7 +20,7 @@ from hypothesis.strategies import (
     sampled_from,
 )
 
-from semsel.parser import SemselTransformer
+from semsel.transformer import SemselTransformer
 from semsel.version import PartialVersion
 from semsel.selector import (
     VersionRange,
@@ -119,7 +120,7 @@ def test_transforms_version_condition_to_VersionCondition(
     """
 
     if operator == ConditionOperator.MINOR and version.minor is None:
-        version.minor = optional_minor
+        version = attr.evolve(version, minor=optional_minor)
     tree.children = [operator, version]
     transformed: VersionCondition = SemselTransformer(visit_tokens=True).transform(tree)
     assert isinstance(transformed, VersionCondition)
@@ -0,0 +1,94 @@
+# -*- encoding: utf-8 -*-
+# Copyright (c) 2020 Modist Team <admin@modist.io>
+# ISC License <https://choosealicense.com/licenses/isc>
+
+"""Contains unit tests for the vectorized selector evaluation."""
+
+from typing import List
+
+import pytest
+from hypothesis import given
+from hypothesis.strategies import lists
+
+from semsel.parser import SemselParser
+from semsel.version import PartialVersion
+
+from .strategies import small_version
+
+numpy = pytest.importorskip("numpy")
+vector = pytest.importorskip("semsel.vector")
+
+PARSER = SemselParser(engine="native")
+PRERELEASES = ["0", "1", "alpha", "alpha.1", "alpha.beta", "beta.2", "beta.11", "rc.1"]
+SELECTORS = [
+    "^1.2",
+    "~0.3",
+    ">=1.0.0-alpha <1.0.0",
+    ">1.0.0-alpha.1 <=1.0.0-beta.11",
+    ">=1.0.0-alpha.0 <1.0.0-beta",
+    ">=1 <2 || >=1.5 <3 || ^5",
+    "1.0.0 - 1.2.0 || 4",
+    "<2",
+    "=1.0.0-rc.1",
+    ">2 <1",
+]
+
+
+def vector_version():
+    """Strategy for building partial versions with small numbers and prereleases."""
+
+    return small_version(max_number=5, prereleases=PRERELEASES)
+
+
+def test_from_columns_ranks_prereleases():
+    """Ensure prereleases are ranked by precedence with releases ranked last."""
+
+    versions = vector.VersionArray.from_columns(
+        [1, 1, 1, 1], [0, 0, 0, 0], [0, 0, 0, 0], ["beta.11", None, "beta.2", "beta.2"]
+    )
+    assert versions.prerelease.tolist() == [3, 6, 1, 1]
+    assert len(versions) == 4
+
+
+def test_from_columns_defaults_to_releases():
+    """Ensure missing columns are filled with zeros and releases."""
+
+    versions = vector.VersionArray.from_columns([1, 2])
+    selector = PARSER.parse("<=1.0.0", validate=False)
+    assert versions.contains(selector).tolist() == [True, False]
+
+
+def test_empty_array():
+    """Ensure an empty array builds an empty mask."""
+
+    mask = vector.contains(PARSER.parse("^1", validate=False), [])
+    assert mask.dtype == bool
+    assert len(mask) == 0
+
+
+@pytest.mark.parametrize("content", SELECTORS)
+@given(versions=lists(vector_version(), max_size=20))
+def test_contains_matches_scalar_contains(content: str, versions: List[PartialVersion]):
+    """Ensure the vectorized mask is identical to checking each version."""
+
+    selector = PARSER.parse(content, validate=False)
+    mask = vector.contains(selector, versions)
+
+    assert mask.tolist() == [selector.contains(version) for version in versions]
+
+
+@given(versions=lists(vector_version(), max_size=20), bound=vector_version())
+def test_contains_matches_scalar_contains_for_any_bound(
+    versions: List[PartialVersion], bound: PartialVersion
+):
+    """Ensure prerelease bounds outside of the array's prereleases are ranked."""
+
+    array = vector.VersionArray.from_versions(versions)
+    for operator in (">", ">=", "<", "<=", "^", "~", "="):
+        if operator == "~" and bound.minor is None:
+            continue
+
+        selector = PARSER.parse(f"{operator!s}{bound!s}", validate=False)
+        assert array.contains(selector).tolist() == [
+            selector.contains(version) for version in versions
+        ]
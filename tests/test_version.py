@@ -0,0 +1,379 @@
+# -*- encoding: utf-8 -*-
+# Copyright (c) 2020 Modist Team <admin@modist.io>
+# ISC License <https://choosealicense.com/licenses/isc>
+
+"""Contains unit tests for the PartialVersion class."""
+
+import gc
+
+import attr
+import pytest
+from hypothesis import given
+from hypothesis.strategies import none, one_of, integers
+
+from semsel.utils import cmp
+from semsel.version import (
+    PACKED_LIMIT,
+    _INTERNED_VERSIONS,
+    PACKED_FIELD_LIMIT,
+    PartialVersion,
+    sort_versions,
+    _parse_version,
+    _prerelease_key,
+)
+
+from .strategies import partial_version
+
+
+@given(partial_version())
+def test_intern_shares_identical_versions(version: PartialVersion):
+    """
+    Ensures interning identical version data always produces the same instance.
+    """
+
+    interned = PartialVersion.intern(**version.to_dict())
+    assert interned is PartialVersion.intern(**version.to_dict())
+    assert interned.to_dict() == version.to_dict()
+
+
+@given(partial_version())
+def test_from_string_interns_versions(version: PartialVersion):
+    """
+    Ensures versions built from strings are interned.
+    """
+
+    assert PartialVersion.from_string(str(version)) is PartialVersion.intern(
+        **version.to_dict()
+    )
+
+
+@given(partial_version())
+def test_from_string_fast_path_matches_pattern(version: PartialVersion):
+    """
+    Ensures plain version strings parse the same as when matched by the pattern.
+    """
+
+    content = str(version)
+    match = PartialVersion._pattern.fullmatch(content)
+    assert match
+    assert PartialVersion.from_string(content).to_dict() == {
+        key: (int(value) if value and key in ("major", "minor", "patch") else value)
+        for key, value in match.groupdict().items()
+    }
+
+
+@pytest.mark.parametrize(
+    "content",
+    ["", ".", "1.", ".1", "1..2", "01", "1.02", "1.2.3.4", "+1", " 1", "\u0661"],
+)
+def test_from_string_rejects_invalid_plain_versions(content: str):
+    """
+    Ensures invalid version strings are rejected rather than parsed by the fast path.
+    """
+
+    with pytest.raises(ValueError):
+        PartialVersion.from_string(content)
+
+
+def test_from_string_caches_parsed_strings():
+    """
+    Ensures parsing the same version string again reuses the cached version.
+    """
+
+    _parse_version.cache_clear()
+    for content in ("1.2.3", "1.2.3-rc.1+build", "1.2.3", "1.2.3-rc.1+build"):
+        PartialVersion.from_string(content)
+
+    info = _parse_version.cache_info()
+    assert (info.hits, info.misses) == (2, 2)
+
+
+def test_intern_distinguishes_version_data():
+    """
+    Ensures versions which only compare equal are not interned as the same instance.
+    """
+
+    assert PartialVersion.intern(1) is not PartialVersion.intern(1, 0, 0)
+    assert PartialVersion.intern(1, 0, 0) is not PartialVersion.intern(
+        1, 0, 0, build="build.1"
+    )
+
+
+def test_intern_releases_unused_versions():
+    """
+    Ensures interned versions are released once they are no longer referenced.
+    """
+
+    version = PartialVersion.intern(123456789, 1, 2, "unused")
+    key = (PartialVersion, 123456789, 1, 2, "unused", None)
+    assert _INTERNED_VERSIONS[key] is version
+
+    del version
+    gc.collect()
+    assert key not in _INTERNED_VERSIONS
+
+
+@given(partial_version(), partial_version())
+def test_hash_matches_equality(source: PartialVersion, target: PartialVersion):
+    """
+    Ensures versions which compare equal always hash equal.
+    """
+
+    if source == target:
+        assert hash(source) == hash(target)
+
+    zero_filled = attr.evolve(
+        source, minor=source.minor or 0, patch=source.patch or 0, build=None
+    )
+    assert source == zero_filled
+    assert hash(source) == hash(zero_filled)
+
+
+def test_versions_are_semantic_dictionary_keys():
+    """
+    Ensures versions which compare equal are the same dictionary key.
+    """
+
+    versions = {PartialVersion(1, 2): "first"}
+    versions[PartialVersion.from_string("1.2.0+build.1")] = "second"
+
+    assert versions == {PartialVersion(1, 2): "second"}
+    assert len({PartialVersion(1, 0, 0, "rc.1"), PartialVersion(1, 0, 0, "rc.2")}) == 2
+
+
+@pytest.mark.parametrize("other", [None, 1, object(), "x", "1.0.0.0"])
+def test_versions_never_equal_foreign_objects(other):
+    """
+    Ensures comparing equality against objects which aren't versions never raises.
+    """
+
+    version = PartialVersion(1)
+    assert not version == other
+    assert version != other
+    assert version not in [None, "x"]
+
+
+def test_versions_only_equal_versions():
+    """
+    Ensures versions never equal version data so equality agrees with hashing, while
+    ``compare`` still coerces version data.
+    """
+
+    version = PartialVersion(1)
+    assert not version == "1.0.0" and not "1.0.0" == version
+    assert version != "1.0.0"
+    assert "1.0.0" not in {version}
+    assert version.compare("1.0.0") == 0
+    assert version.compare((1, 0, 0)) == 0
+
+
+@pytest.mark.parametrize("other", [None, 1, object(), "1.0.0", (1, 0, 0)])
+def test_versions_are_not_ordered_against_foreign_objects(other):
+    """
+    Ensures ordering versions against objects which aren't versions defers to the other
+    object rather than coercing it.
+    """
+
+    version = PartialVersion(1)
+    for operator in ("__lt__", "__le__", "__gt__", "__ge__"):
+        assert getattr(version, operator)(other) is NotImplemented
+
+    with pytest.raises(TypeError):
+        version < other
+
+
+def test_sort_key_follows_semver_precedence():
+    """
+    Ensures sort keys order versions as described by the Semver specification.
+    """
+
+    versions = [
+        "1.0.0-alpha",
+        "1.0.0-alpha.1",
+        "1.0.0-alpha.beta",
+        "1.0.0-beta",
+        "1.0.0-beta.2",
+        "1.0.0-beta.11",
+        "1.0.0-rc.1",
+        "1.0.0",
+        "1.0.1-0",
+        "1.1",
+        "2",
+    ]
+    parsed = [PartialVersion.from_string(version) for version in versions]
+
+    assert sort_versions(reversed(versions)) == versions
+    assert sort_versions(versions, reverse=True) == versions[::-1]
+    assert sorted(reversed(parsed)) == parsed
+    assert all(source < target for source, target in zip(parsed, parsed[1:]))
+
+
+@given(partial_version(), partial_version())
+def test_compare_matches_prerelease_compare(
+    source: PartialVersion, target: PartialVersion
+):
+    """
+    Ensures comparing sort keys matches comparing the version data.
+    """
+
+    expected = cmp(source.to_tuple()[:3], target.to_tuple()[:3])
+    if not expected and (source.prerelease or target.prerelease):
+        if not source.prerelease:
+            expected = 1
+        elif not target.prerelease:
+            expected = -1
+        else:
+            expected = PartialVersion.prerelease_compare(
+                source.prerelease, target.prerelease
+            )
+
+    assert source.compare(target) == expected
+    assert (source < target) == (expected < 0)
+    assert (source >= target) == (expected >= 0)
+
+
+def test_prerelease_compare_follows_semver_precedence():
+    """
+    Ensures prerelease identifiers are compared by the Semver precedence rules.
+    """
+
+    ordered = ["1", "2", "10", "alpha", "alpha.1", "alpha.beta", "beta.2", "rc.1"]
+    for index, source in enumerate(ordered):
+        for target in ordered[index + 1 :]:
+            assert PartialVersion.prerelease_compare(source, target) == -1
+            assert PartialVersion.prerelease_compare(target, source) == 1
+        assert PartialVersion.prerelease_compare(source, source) == 0
+
+    assert PartialVersion.prerelease_compare(None, "") == 0
+
+
+def test_prerelease_keys_are_cached():
+    """
+    Ensures prerelease keys are shared between repeated comparisons of a tag.
+    """
+
+    _prerelease_key.cache_clear()
+    PartialVersion.prerelease_compare("rc.1", "rc.2")
+    PartialVersion.prerelease_compare("rc.2", "rc.1")
+
+    info = _prerelease_key.cache_info()
+    assert (info.hits, info.misses) == (2, 2)
+    assert _prerelease_key("rc.1") is _prerelease_key("rc.1")
+
+
+def test_sort_key_is_cached():
+    """
+    Ensures the sort key of a version is only computed once.
+    """
+
+    version = PartialVersion(1, 2, 3, "rc.1")
+    assert version.sort_key is version.sort_key
+    assert version.sort_key == (1, 2, 3, 0, (1, "rc"), (0, 1))
+
+
+def packable_release():
+    """Strategy for building releases which fit in the packed encoding."""
+
+    field = integers(min_value=0, max_value=PACKED_FIELD_LIMIT - 1)
+    return partial_version(
+        major_strategy=field,
+        minor_strategy=one_of(none(), field),
+        patch_strategy=one_of(none(), field),
+        prerelease_strategy=none(),
+    )
+
+
+@given(packable_release(), packable_release())
+def test_packed_keys_match_comparison(source: PartialVersion, target: PartialVersion):
+    """
+    Ensures packed keys round-trip and are ordered the same as the releases.
+    """
+
+    packed = source.to_packed()
+    assert 0 <= packed < PACKED_LIMIT
+    assert PartialVersion.from_packed(packed) == source
+    assert cmp(packed, target.to_packed()) == source.compare(target)
+
+
+@pytest.mark.parametrize(
+    "version",
+    [
+        PartialVersion(1, 2, 3, "rc.1"),
+        PartialVersion(PACKED_FIELD_LIMIT),
+        PartialVersion(1, PACKED_FIELD_LIMIT),
+        PartialVersion(1, 2, PACKED_FIELD_LIMIT),
+    ],
+)
+def test_to_packed_rejects_unpackable_versions(version: PartialVersion):
+    """
+    Ensures prereleases and releases which don't fit the packed encoding are rejected.
+    """
+
+    assert version.packed_key == -1
+    with pytest.raises(ValueError):
+        version.to_packed()
+
+
+@pytest.mark.parametrize("packed", [-1, PACKED_LIMIT, 1.0, "1"])
+def test_from_packed_rejects_invalid_keys(packed):
+    """
+    Ensures building a version from an invalid packed key is rejected.
+    """
+
+    with pytest.raises(ValueError):
+        PartialVersion.from_packed(packed)
+
+
+def test_sort_versions_falls_back_for_unpackable_versions():
+    """
+    Ensures versions are still sorted by precedence if any of them can't be packed.
+    """
+
+    versions = [
+        PartialVersion(2),
+        PartialVersion(1, PACKED_FIELD_LIMIT),
+        PartialVersion(1, 5),
+        PartialVersion(1, 5, 0, "rc.1"),
+    ]
+    assert sort_versions(versions) == [
+        versions[3],
+        versions[2],
+        versions[1],
+        versions[0],
+    ]
+    assert sort_versions(versions[::2], reverse=True) == versions[::2]
+
+
+def test_versions_are_slotted():
+    """
+    Ensures versions are slotted without exposing their cached sort key as data.
+    """
+
+    version = PartialVersion(1, 2, 3, "rc.1")
+    version.sort_key
+    assert not hasattr(version, "__dict__")
+    assert version.to_dict() == {
+        "major": 1,
+        "minor": 2,
+        "patch": 3,
+        "prerelease": "rc.1",
+        "build": None,
+    }
+    assert repr(version) == (
+        "PartialVersion(major=1, minor=2, patch=3, prerelease='rc.1', build=None)"
+    )
+    assert attr.evolve(version, minor=4).sort_key == (1, 4, 3, 0, (1, "rc"), (0, 1))
+
+
+def test_sort_versions_keeps_given_objects():
+    """
+    Ensures sorting versions keeps the given strings and versions in a stable order.
+    """
+
+    version = PartialVersion(1, 0)
+    assert sort_versions(["2.0.0", version, "1.0.0+build", "0.1.0"]) == [
+        "0.1.0",
+        version,
+        "1.0.0+build",
+        "2.0.0",
+    ]
@@ -54,3 +54,28 @@ def test_fails_match_minor_if_VersionCondition_not_using_minor_operator(
         condition._match_minor(other)
 
     assert "not constrained by a minor operator" in str(exc.value)
+
+
+@given(version_condition())
+def test_intern_shares_identical_conditions(condition: VersionCondition):
+    """
+    Ensures interning identical conditions always produces the same instance, even
+    for distinct but identical versions.
+    """
+
+    interned = VersionCondition.intern(condition.operator, condition.version)
+    assert interned is VersionCondition.intern(
+        condition.operator, PartialVersion(**condition.version.to_dict())
+    )
+    assert interned.operator == condition.operator
+    assert interned.version.to_dict() == condition.version.to_dict()
+
+
+@given(partial_version(minor_strategy=none()))
+def test_intern_fails_for_invalid_conditions(version: PartialVersion):
+    """
+    Ensures interning a condition still validates the condition.
+    """
+
+    with pytest.raises(InvalidExpression):
+        VersionCondition.intern(ConditionOperator.MINOR, version)